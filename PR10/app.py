@@ -1,8 +1,14 @@
+import os
+import sys
 import time
 import random
 from flask import Flask, render_template, request
 from hamm import Hamming
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infotheory.hamming import encode_blocks  # noqa: E402
+
 app = Flask(__name__)
 hamming = Hamming()
 
@@ -15,7 +21,10 @@ def root():
 @app.route('/result', methods=['POST'])
 def result():
     textarea_data = request.form['source_data']
-    data = hamming.encode(textarea_data)
+    if request.form.get('mode') == 'blocks':
+        data = encode_blocks(textarea_data)
+    else:
+        data = hamming.encode(textarea_data)
     return render_template('result.html', data=data)
 
 if __name__ == '__main__':
@@ -1,41 +1,25 @@
-import math
+import os
+import sys
 
-def calculate_alphabet_power(text):
-    return len(set(text.lower()))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-def calculate_hartley_entropy(alphabet_power):
-    return math.log2(alphabet_power)
-
-def calculate_shannon_entropy(text):
-    frequencies = {}
-    for char in text.lower():
-        if char.isalpha():
-            if char in frequencies:
-                frequencies[char] += 1
-            else:
-                frequencies[char] = 1
-    
-    shannon_entropy = 0
-    total_chars = len(text)
-    for freq in frequencies.values():
-        probability = freq / total_chars
-        shannon_entropy -= probability * math.log2(probability)
-    
-    return shannon_entropy
-
-def calculate_redundancy(alphabet_power, shannon_entropy):
-    return 1 - (shannon_entropy / math.log2(alphabet_power))
+from infotheory.entropy_stats import file_statistics  # noqa: E402
+from infotheory.entropy_profile import profile_stream, write_profile  # noqa: E402
 
 file_name = input("Enter the file name: ")
-with open(file_name, 'r') as file:
-    text = file.read()
+statistics = file_statistics(file_name, letters_only=True)
 
-alphabet_power = calculate_alphabet_power(text)
-hartley_entropy = calculate_hartley_entropy(alphabet_power)
-shannon_entropy = calculate_shannon_entropy(text)
-redundancy = calculate_redundancy(alphabet_power, shannon_entropy)
+print(f"The power of the alphabet: {statistics.alphabet_size}")
+print(f"Entropy according to Hartley: {statistics.hartley}")
+print(f"Entropy according to Shannon: {statistics.shannon}")
+print(f"Redundancy of the alphabet: {statistics.redundancy}")
 
-print(f"The power of the alphabet: {alphabet_power}")
-print(f"Entropy according to Hartley: {hartley_entropy}")
-print(f"Entropy according to Shannon: {shannon_entropy}")
-print(f"Redundancy of the alphabet: {redundancy}")
\ No newline at end of file
+while True:
+    block_size = input("Block size for the entropy profile (Enter to skip): ").strip()
+    if not block_size:
+        break
+    if block_size.isdigit() and int(block_size) > 0:
+        with open(file_name, 'rb') as file:
+            write_profile(profile_stream(file, int(block_size)), sys.stdout)
+        break
+    print("The block size must be a positive integer.")
\ No newline at end of file
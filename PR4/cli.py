@@ -2,16 +2,22 @@
 CLI 
 """
 import os
+import sys
 import json
 import shutil
 from datetime import datetime
 from huffman import CodeGenerator
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infotheory.codebook_cache import CodebookCache  # noqa: E402
+
 class CLI:
     """
     Класс CLI предоставляет простой интерфейс командной строки для работы с кодами Хаффмана.
 
     Атрибуты:
+        cache: Кэш кодов Хаффмана, общий для всех генераций за сеанс.
         generator: Объект CodeGenerator для генерации кодов Хаффмана.
     """
 
@@ -19,7 +25,8 @@ class CLI:
         """
         Инициализация объекта CLI.
         """
-        self.generator = CodeGenerator()
+        self.cache = CodebookCache()
+        self.generator = CodeGenerator(self.cache)
 
     def show_menu(self):
         """
@@ -66,12 +73,16 @@ class CLI:
 
                 code_file_path = os.path.join(code_folder_name, "code.json")
 
-                code_map = self.generator.gen_code(file_path)
+                self.generator.gen_code(file_path)
 
+                # Сохраняются только длины канонических кодов
                 with open(code_file_path, 'w', encoding='utf-8') as outfile:
-                    json.dump(code_map, outfile, ensure_ascii=False, indent=4)
+                    json.dump(self.generator.compact_code_table(), outfile,
+                              ensure_ascii=False, separators=(',', ':'))
 
                 print(f"Код Хаффмана успешно сгенерирован и сохранён в {code_file_path}")
+                stats = self.cache.stats()
+                print(f"Кэш кодов: попаданий {stats['hits']}, промахов {stats['misses']}")
             else:
                 print("Указанный файл не существует.")
         except OSError as e:
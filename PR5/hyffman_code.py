@@ -1,14 +1,21 @@
 import os
+import sys
 import json
-import math
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infotheory.bitbuffer import pack_bits, unpack_bits  # noqa: E402
+from infotheory.canonical import (canonical_codes, code_lengths_from_codes,  # noqa: E402
+                                  code_lengths_to_json, codes_from_json)
+from infotheory.entropy_stats import text_statistics  # noqa: E402
+from infotheory.huffman_table import TableDecoder  # noqa: E402
+from infotheory.huffman_tree import count_frequencies, huffman_code_lengths  # noqa: E402
 
 class HuffmanCoder:
     """
     Класс для выполнения кодирования Хаффмана для текстовых файлов.
 
     Атрибуты:
-        left (HuffmanCoder): Левый дочерний узел в дереве Хаффмана.
-        right (HuffmanCoder): Правый дочерний узел в дереве Хаффмана.
         code (dict): Словарь для хранения кодов Хаффмана для символов.
         json (dict): Словарь для сериализации кодов Хаффмана.
         bin (str): Бинарное представление закодированного текста.
@@ -17,16 +24,10 @@ class HuffmanCoder:
         file_path (str): Путь к загруженному файлу.
     """
 
-    def __init__(self, left=None, right=None):
+    def __init__(self):
         """
-        Инициализирует объект HuffmanCoder с необязательными левым и правым дочерними узлами.
-
-        Параметры:
-            left (HuffmanCoder): Левый дочерний узел.
-            right (HuffmanCoder): Правый дочерний узел.
+        Инициализирует объект HuffmanCoder с пустыми кодами и текстом.
         """
-        self.left = left
-        self.right = right
         self.code = {}
         self.json = {}
         self.bin = None
@@ -57,8 +58,7 @@ class HuffmanCoder:
             file_path (str): Путь к бинарному файлу.
         """
         with open(file_path, 'rb') as file:
-            result_data_byte = file.read()
-            self.bin = ''.join([f'{item:08b}' for item in result_data_byte])
+            self.bin = unpack_bits(file.read())
 
     def encode(self):
         """
@@ -68,35 +68,9 @@ class HuffmanCoder:
             print("Файл не загружен!")
             return
 
-        letters = set(self.text)
-        frequencies = []
-        for letter in letters:
-            frequencies.append((self.text.count(letter), letter))
-
-        while len(frequencies) > 1:
-            frequencies = sorted(frequencies, key=lambda x: x[0], reverse=True)
-            first = frequencies.pop()
-            second = frequencies.pop()
-            freq = first[0] + second[0]
-            frequencies.append((freq, HuffmanCoder(first[1], second[1])))
-
-        self.walk(frequencies[0][1])
+        self.code = canonical_codes(huffman_code_lengths(count_frequencies(self.text)))
         self.save_json()
 
-    def walk(self, node, path=''):
-        """
-        Рекурсивно обходит дерево Хаффмана для генерации кодов.
-
-        Аргументы:
-            node (HuffmanCoder): Текущий узел.
-            path (str): Путь к текущему узлу.
-        """
-        if isinstance(node, str):
-            self.code[node] = path
-            return
-        self.walk(node.left, path + '0')
-        self.walk(node.right, path + '1')
-
     def decode(self):
         """
         Декодирует бинарное представление текста.
@@ -107,17 +81,13 @@ class HuffmanCoder:
 
         with open(os.path.join(os.path.dirname(__file__), 'code.json'),
                   'r', encoding='utf-8') as file:
-            self.json = json.load(file)
+            self.json = codes_from_json(json.load(file))
 
-        current_code = ""
-        for bit in self.bin:
-            current_code += bit
-            for char, code in self.json.items():
-                if code == current_code:
-                    self.decoded_text += char
-                    current_code = ''
-                    break
+        decoder = TableDecoder(self.json)
+        self.decoded_text += ''.join(decoder.decode(pack_bits(self.bin), len(self.bin)))
 
+        # Незавершённый код в конце дополняется до первого подходящего символа
+        current_code = self.bin[len(self.bin) - decoder.remaining_bits:]
         if current_code:
             for char, code in self.json.items():
                 if code.startswith(current_code):
@@ -136,23 +106,24 @@ class HuffmanCoder:
         """
         Сохраняет закодированный текст в двоичном формате в файле 'result'.
         """
-        encoded_text = ''.join(self.code[char] for char in self.text)
-        padding_length = 8 - (len(encoded_text) % 8)
-        encoded_text += '0' * padding_length
-        source_data_byte = bytes([int(encoded_text[i:i + 8], 2)
-                                  for i in range(0, len(encoded_text), 8)])
+        encoded_text = ''.join(map(self.code.__getitem__, self.text))
+        source_data_byte = pack_bits(encoded_text)
+        if len(encoded_text) % 8 == 0:
+            # Формат файла: выравнивание всегда добавляет от 1 до 8 нулевых бит
+            source_data_byte += b'\x00'
         with open(os.path.join(os.path.dirname(__file__), 'result'), 'wb') as file:
             file.write(source_data_byte)
 
 
     def save_json(self):
         """
-        Сохраняет коды Хаффмана в формате JSON в файле 'code.json'.
+        Сохраняет длины канонических кодов Хаффмана в формате JSON в файле 'code.json'.
         """
-        formatted_codes = {char: code for char, code in self.code.items()}
+        code_lengths = code_lengths_from_codes(self.code)
         with open(os.path.join(os.path.dirname(__file__),
         'code.json'), 'w', encoding='utf-8') as file:
-            json.dump(formatted_codes, file, ensure_ascii=False, indent=4)
+            json.dump(code_lengths_to_json(code_lengths), file,
+                      ensure_ascii=False, separators=(',', ':'))
 
     def shannon_entropy(self, text):
         """
@@ -164,18 +135,7 @@ class HuffmanCoder:
         Возвращает:
             float: Значение энтропии.
         """
-        frequency_dict = {}
-        for char in text.lower():
-            if char.isalpha():
-                frequency_dict[char] = frequency_dict.get(char, 0) + 1
-
-        shannon_ent = 0
-        total_chars = sum(frequency_dict.values())
-        for char, frequency in frequency_dict.items():
-            probability = frequency / total_chars
-            shannon_ent -= probability * math.log2(probability)
-
-        return shannon_ent
+        return text_statistics(text, letters_only=True).shannon
 
     def print_data(self):
         """
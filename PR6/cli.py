@@ -1,8 +1,16 @@
+import argparse
 import os
+import sys
 import logging
 from huffman_pr6 import Huffman
 from hamming_pr6 import Hamming
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infotheory.hamming import CORRECTED, encode_blocks, decode_blocks  # noqa: E402
+from infotheory.hamming_stream import (DEFAULT_CHUNK_SIZE, encode_file,  # noqa: E402
+                                       decode_file)
+
 if not os.path.exists("logfile.log"):
     with open("logfile.log", "w", encoding='utf-8') as file:
         file.write("Log file created.\n")
@@ -10,12 +18,44 @@ if not os.path.exists("logfile.log"):
 logging.basicConfig(filename='logfile.log',
                     level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+def print_block_reports(reports):
+    """Выводит и записывает в журнал ошибки, найденные в блоках Хэмминга (72,64)."""
+    for report in reports:
+        if report.status == CORRECTED:
+            message = f"Блок {report.block}: исправлена одиночная ошибка"
+        else:
+            message = f"Блок {report.block}: обнаружена неисправимая ошибка"
+        print(message)
+        logging.warning("Hamming block %d: status %d, syndrome %d",
+                        report.block, report.status, report.syndrome)
+    if not reports:
+        print("Ошибок в блоках не обнаружено.")
+
+def encode_hamming_file(input_file, output_file, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Кодирует файл блоками Хэмминга (72,64) и выводит размеры."""
+    size, encoded_size = encode_file(input_file, output_file, chunk_size)
+    print(f"Исходный размер: {size} байт, закодированный: {encoded_size} байт")
+    logging.info("Hamming file encoding: %s -> %s (%d -> %d bytes)",
+                 input_file, output_file, size, encoded_size)
+
+def decode_hamming_file(input_file, output_file, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Декодирует файл блоков Хэмминга (72,64) и выводит найденные ошибки."""
+    size, reports = decode_file(input_file, output_file, chunk_size)
+    print_block_reports(reports)
+    print(f"Восстановлено {size} байт")
+    logging.info("Hamming file decoding: %s -> %s (%d bytes, %d damaged blocks)",
+                 input_file, output_file, size, len(reports))
+
 def menu():
     """Отображает главное меню и обрабатывает выбор пользователя."""
     while True:
         print("1. Кодировать")
         print("2. Декодировать")
-        print("3. Выход")
+        print("3. Кодировать блоками Хэмминга (72,64)")
+        print("4. Декодировать блоки Хэмминга (72,64)")
+        print("5. Кодировать файл блоками Хэмминга (72,64)")
+        print("6. Декодировать файл блоков Хэмминга (72,64)")
+        print("7. Выход")
         choice = input("Выберите операцию: ")
         huffman = Huffman()
         hamming = Hamming()
@@ -29,17 +69,78 @@ def menu():
             logging.info("Hamming encoding: %s", encoded_hamming)
         elif choice == '2':
             encoded_data = input("Введите закодированные данные: ")
-            decoded_hamming = hamming.decode(encoded_data)
+            try:
+                decoded_hamming = hamming.decode(encoded_data)
+            except ValueError as e:
+                print("Ошибка:", e)
+                continue
             print("Декодированные данные Хэмминга:", decoded_hamming)
             decoded_huffman = huffman.decode(decoded_hamming)
             print("Декодированные данные Хаффмана:", decoded_huffman)
             logging.info("Hamming decoding: %s", decoded_hamming)
             logging.info("Huffman decoding: %s", decoded_huffman)
         elif choice == '3':
+            data = input("Введите данные для кодирования: ")
+            encoded_huffman = huffman.encode(data)
+            print("Закодированные данные Хаффмана:", encoded_huffman)
+            encoded_hamming = encode_blocks(encoded_huffman)
+            print("Закодированные блоки Хэмминга:", encoded_hamming)
+            logging.info("Huffman encoding: %s", encoded_huffman)
+            logging.info("Hamming block encoding: %s", encoded_hamming)
+        elif choice == '4':
+            encoded_data = input("Введите закодированные данные: ")
+            try:
+                decoded_hamming, reports = decode_blocks(encoded_data)
+            except ValueError as e:
+                print("Ошибка:", e)
+                continue
+            print_block_reports(reports)
+            print("Декодированные данные Хэмминга:", decoded_hamming)
+            decoded_huffman = huffman.decode(decoded_hamming)
+            print("Декодированные данные Хаффмана:", decoded_huffman)
+            logging.info("Hamming block decoding: %s", decoded_hamming)
+            logging.info("Huffman decoding: %s", decoded_huffman)
+        elif choice in ('5', '6'):
+            input_file = input("Введите путь к исходному файлу: ")
+            output_file = input("Введите путь к результату: ")
+            try:
+                if choice == '5':
+                    encode_hamming_file(input_file, output_file)
+                else:
+                    decode_hamming_file(input_file, output_file)
+            except (OSError, ValueError) as e:
+                print("Ошибка:", e)
+        elif choice == '7':
             print("Выход из программы.")
             break
         else:
             print("Неверный выбор операции.")
 
+def parse_args():
+    """Разбор аргументов командной строки.
+
+    Без аргументов запускается интерактивное меню.
+    """
+    parser = argparse.ArgumentParser(description="Кодирование файлов кодом Хэмминга (72,64)")
+    subparsers = parser.add_subparsers(dest="command")
+    for command in ("encode", "decode"):
+        subparser = subparsers.add_parser(command)
+        subparser.add_argument("input", help="Исходный файл")
+        subparser.add_argument("output", help="Файл результата")
+        subparser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                               help="Байт данных, обрабатываемых за один раз")
+    args = parser.parse_args()
+    if args.command and args.chunk_size < 1:
+        parser.error("--chunk-size должен быть положительным")
+    return args
+
 if __name__ == "__main__":
-    menu()
+    arguments = parse_args()
+    if arguments.command:
+        handler = encode_hamming_file if arguments.command == "encode" else decode_hamming_file
+        try:
+            handler(arguments.input, arguments.output, arguments.chunk_size)
+        except (OSError, ValueError) as e:
+            raise SystemExit(f"Ошибка: {e}") from e
+    else:
+        menu()
@@ -1,14 +1,28 @@
 
+import os
+import sys
 import json
-import heapq
-from collections import defaultdict
 from configparser import ConfigParser
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infotheory.bitbuffer import pack_bits  # noqa: E402
+from infotheory.canonical import canonical_codes, code_lengths_to_json, codes_from_json  # noqa: E402
+from infotheory.huffman_table import TableDecoder  # noqa: E402
+from infotheory.huffman_tree import count_frequencies, huffman_code_lengths  # noqa: E402
+
 class Huffman:
     """Класс для работы с кодированием и декодированием данных методом Хаффмана."""
 
-    def __init__(self):
+    def __init__(self, cache=None):
+        """Инициализация объекта класса.
+
+        Args:
+            cache (CodebookCache): Кэш кодов по гистограмме частот; None - коды
+                строятся при каждом вызове.
+        """
         self.huffman_codes = {}
+        self.cache = cache
 
     def encode(self, data):
         """Кодирование данных методом Хаффмана.
@@ -19,23 +33,12 @@ class Huffman:
         Returns:
             str: Закодированные данные.
         """
-        frequency = defaultdict(int)
-        for symbol in data:
-            frequency[symbol] += 1
-
-        priority_queue = [[weight, [symbol, ""]] for symbol, weight in frequency.items()]
-        heapq.heapify(priority_queue)
-
-        while len(priority_queue) > 1:
-            lo = heapq.heappop(priority_queue)
-            hi = heapq.heappop(priority_queue)
-            for pair in lo[1:]:
-                pair[1] = '0' + pair[1]
-            for pair in hi[1:]:
-                pair[1] = '1' + pair[1]
-            heapq.heappush(priority_queue, [lo[0] + hi[0]] + lo[1:] + hi[1:])
-
-        self.huffman_codes = dict(priority_queue[0][1:])
+        frequencies = count_frequencies(data)
+        if self.cache is not None:
+            code_lengths, self.huffman_codes = self.cache.get(frequencies)
+        else:
+            code_lengths = huffman_code_lengths(frequencies)
+            self.huffman_codes = canonical_codes(code_lengths)
         huffman_encoded_data = ''.join(self.huffman_codes[symbol] for symbol in data)
 
         config = ConfigParser()
@@ -47,26 +50,35 @@ class Huffman:
             config.write(configfile)
 
         with open("huffman_codes.json", "w", encoding='utf-8') as file:
-            json.dump(self.huffman_codes, file)
+            json.dump(code_lengths_to_json(code_lengths), file,
+                      ensure_ascii=False, separators=(',', ':'))
 
         return huffman_encoded_data
 
-    def decode(self, encoded_data):
+    def decode(self, encoded_data, method='table'):
         """Декодирование данных методом Хаффмана.
 
         Args:
             encoded_data (str): Закодированные данные.
+            method (str): 'table' - табличное декодирование упакованных байтов,
+                'bitwise' - исходное побитовое декодирование.
 
         Returns:
             str: Декодированные данные.
         """
         with open("huffman_codes.json", "r", encoding='utf-8') as file:
-            self.huffman_codes = json.load(file)
+            self.huffman_codes = codes_from_json(json.load(file))
 
         config = ConfigParser()
         config.read('settings.ini', encoding='utf-8')
         word_length = int(config['Huffman']['Word_Length'])
 
+        encoded_data = encoded_data.strip()
+        if method == 'table':
+            decoder = TableDecoder(self.huffman_codes)
+            payload = pack_bits(encoded_data)
+            return ''.join(decoder.decode(payload, len(encoded_data), word_length))
+
         reverse_huffman_codes = {v: k for k, v in self.huffman_codes.items()}
 
         decoded_data = ""
@@ -0,0 +1,266 @@
+"""
+Адаптивное (однопроходное) кодирование Хаффмана по алгоритму FGK.
+
+Кодер и декодер строят одинаковое дерево по мере обработки данных,
+поэтому таблица кодов не передаётся, а вывод начинается сразу.
+Алфавит - байты 0..255 и служебный символ конца потока, так что размер
+дерева, а значит и расход памяти, ограничен при любой длине потока.
+"""
+import os
+import sys
+from bisect import bisect_right
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infotheory.bitbuffer import pack_bits, unpack_bits  # noqa: E402
+
+END_OF_STREAM = 256
+RAW_SYMBOL_BITS = 9  # ширина несжатого символа после кода NYT
+ALPHABET_SIZE = 257
+MAX_NUMBER = 2 * ALPHABET_SIZE  # номер корня; листья и узлы нумеруются вниз от него
+
+
+class _Node:
+    """Узел адаптивного дерева Хаффмана."""
+
+    __slots__ = ('weight', 'number', 'parent', 'left', 'right', 'symbol')
+
+    def __init__(self, number, parent=None, symbol=None):
+        self.weight = 0
+        self.number = number
+        self.parent = parent
+        self.left = None
+        self.right = None
+        self.symbol = symbol
+
+
+class AdaptiveTree:
+    """
+    Дерево FGK с нумерацией узлов, сохраняющей свойство соседства.
+
+    Веса узлов не убывают с ростом номера, поэтому старший узел блока
+    одинакового веса находится двоичным поиском по списку весов.
+
+    Атрибуты:
+        root (_Node): Корень дерева.
+        nyt (_Node): Лист "ещё не встречавшийся символ".
+        leaves (list): Лист каждого символа алфавита или None.
+        order (list): Узлы по номерам.
+        weights (list): Веса узлов по номерам.
+    """
+
+    def __init__(self):
+        """Создаёт дерево из единственного листа NYT."""
+        self.root = _Node(MAX_NUMBER)
+        self.nyt = self.root
+        self.leaves = [None] * ALPHABET_SIZE
+        self.order = [None] * (MAX_NUMBER + 1)
+        self.order[MAX_NUMBER] = self.root
+        self.weights = [0] * (MAX_NUMBER + 1)
+
+    def code(self, node):
+        """
+        Возвращает код узла - путь от корня.
+
+        Args:
+            node (_Node): Узел дерева.
+
+        Returns:
+            str: Код в виде строки из '0'/'1'.
+        """
+        bits = []
+        while node.parent is not None:
+            bits.append('1' if node.parent.right is node else '0')
+            node = node.parent
+        return ''.join(reversed(bits))
+
+    def update(self, symbol):
+        """
+        Учитывает очередное появление символа и перестраивает дерево.
+
+        Args:
+            symbol (int): Символ алфавита.
+        """
+        weights = self.weights
+        node = self.leaves[symbol]
+        if node is None:
+            # Новый лист и бывший NYT - старшие узлы веса 0, перестановка не нужна
+            leaf = self._split_nyt(symbol)
+            leaf.weight = 1
+            weights[leaf.number] = 1
+            node = leaf.parent
+            node.weight += 1
+            weights[node.number] += 1
+            node = node.parent
+        # Брат NYT может весить столько же, сколько родитель: его вес
+        # увеличивается после предков, чтобы не нарушить порядок весов
+        deferred = None
+        if node is not None and node.parent is not None and node.parent.left is self.nyt:
+            leader = self._leader(node)
+            if leader is not node and leader is not node.parent:
+                self._swap(node, leader)
+            deferred = node
+            node = node.parent
+        while node is not None:
+            leader = self._leader(node)
+            if leader is not node:
+                self._swap(node, leader)
+            node.weight += 1
+            weights[node.number] += 1
+            node = node.parent
+        if deferred is not None:
+            deferred.weight += 1
+            weights[deferred.number] += 1
+
+    def _leader(self, node):
+        """Узел с наибольшим номером среди узлов того же веса."""
+        return self.order[bisect_right(self.weights, node.weight) - 1]
+
+    def _split_nyt(self, symbol):
+        """Заменяет лист NYT узлом с новым NYT и листом нового символа."""
+        old = self.nyt
+        number = old.number
+        old.right = _Node(number - 1, old, symbol)
+        old.left = _Node(number - 2, old)
+        self.order[number - 1] = old.right
+        self.order[number - 2] = old.left
+        self.leaves[symbol] = old.right
+        self.nyt = old.left
+        return old.right
+
+    def _swap(self, first, second):
+        """Меняет местами два узла одинакового веса вместе с поддеревьями."""
+        first_parent = first.parent
+        second_parent = second.parent
+        first_is_left = first_parent.left is first
+        second_is_left = second_parent.left is second
+        if first_is_left:
+            first_parent.left = second
+        else:
+            first_parent.right = second
+        if second_is_left:
+            second_parent.left = first
+        else:
+            second_parent.right = first
+        first.parent, second.parent = second_parent, first_parent
+        first.number, second.number = second.number, first.number
+        self.order[first.number] = first
+        self.order[second.number] = second
+
+
+class AdaptiveHuffmanEncoder:
+    """
+    Потоковый кодер: принимает байты по частям и сразу возвращает коды.
+
+    Атрибуты:
+        tree (AdaptiveTree): Текущее дерево.
+        pending (str): Биты, ещё не образовавшие полный байт.
+    """
+
+    def __init__(self):
+        """Создаёт кодер с пустым деревом."""
+        self.tree = AdaptiveTree()
+        self.pending = ''
+
+    def _symbol_bits(self, symbol):
+        """Код символа; для нового символа - код NYT и сам символ."""
+        tree = self.tree
+        leaf = tree.leaves[symbol]
+        if leaf is None:
+            bits = tree.code(tree.nyt) + format(symbol, f'0{RAW_SYMBOL_BITS}b')
+        else:
+            bits = tree.code(leaf)
+        tree.update(symbol)
+        return bits
+
+    def encode_chunk(self, data):
+        """
+        Кодирует очередную часть потока.
+
+        Args:
+            data (bytes): Часть входного потока.
+
+        Returns:
+            bytes: Все полностью сформированные байты кода.
+        """
+        bits = self.pending + ''.join([self._symbol_bits(symbol) for symbol in data])
+        whole = len(bits) - len(bits) % 8
+        self.pending = bits[whole:]
+        return pack_bits(bits[:whole])
+
+    def finish(self):
+        """
+        Завершает поток символом конца потока и выравнивает последний байт.
+
+        Returns:
+            bytes: Остаток кода.
+        """
+        bits = self.pending + self._symbol_bits(END_OF_STREAM)
+        self.pending = ''
+        return pack_bits(bits)
+
+
+class AdaptiveHuffmanDecoder:
+    """
+    Потоковый декодер, зеркально повторяющий перестройку дерева кодера.
+
+    Атрибуты:
+        tree (AdaptiveTree): Текущее дерево.
+        finished (bool): Признак того, что прочитан символ конца потока.
+    """
+
+    def __init__(self):
+        """Создаёт декодер с пустым деревом."""
+        self.tree = AdaptiveTree()
+        self.node = self.tree.root
+        # Пока дерево пусто, корень - лист NYT, и первый символ передаётся без кода
+        self.raw = ''
+        self.finished = False
+
+    def decode_chunk(self, data):
+        """
+        Декодирует очередную часть потока.
+
+        Состояние (текущий узел и частично прочитанный символ) сохраняется
+        между вызовами, поэтому части могут резаться на любой границе.
+
+        Args:
+            data (bytes): Часть закодированного потока.
+
+        Returns:
+            bytes: Декодированные байты.
+        """
+        tree = self.tree
+        decoded = bytearray()
+        node = self.node
+        raw = self.raw
+        for bit in unpack_bits(data):
+            if self.finished:
+                break
+            if raw is not None:
+                raw += bit
+                if len(raw) < RAW_SYMBOL_BITS:
+                    continue
+                symbol = int(raw, 2)
+                raw = None
+            else:
+                node = node.right if bit == '1' else node.left
+                if node is None:
+                    raise ValueError("Поток содержит недопустимый код")
+                if node.left is not None:
+                    continue
+                if node is tree.nyt:
+                    raw = ''
+                    node = tree.root
+                    continue
+                symbol = node.symbol
+            if symbol == END_OF_STREAM:
+                self.finished = True
+            else:
+                decoded.append(symbol)
+            tree.update(symbol)
+            node = tree.root
+        self.node = node
+        self.raw = raw
+        return bytes(decoded)
+
@@ -0,0 +1,413 @@
+"""
+Замеры скорости кодеков Хаффмана и вспомогательных преобразований.
+
+Запуск: python benchmark.py [--file путь] [--size число_символов]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import zlib
+import bz2
+from io import BytesIO
+from collections import Counter
+from huffman import Huffman, DECODERS
+from adaptive import AdaptiveHuffmanEncoder, AdaptiveHuffmanDecoder
+from range_coder import MAX_ORDER, ContextModel, RangeEncoder, RangeDecoder, symbol_bits_for
+from tans import TansCodec
+import lz77
+import bwt
+from entropy import calculate_frequency_entropy
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infotheory.bitbuffer import pack_bits, unpack_bits  # noqa: E402
+from infotheory.canonical import pack_code_lengths  # noqa: E402
+from infotheory.codebook_cache import CodebookCache, StaticCodebook  # noqa: E402
+
+
+def sample_text(size, seed=0):
+    """Генерация текста с неравномерным распределением символов.
+
+    Args:
+        size (int): Длина текста.
+        seed (int): Начальное значение генератора случайных чисел.
+
+    Returns:
+        str: Сгенерированный текст.
+    """
+    alphabet = "оеаинтсрвлкмдпуяыьгзбчйхжшюцщэфъё .,\n"
+    weights = [1 / (rank + 1) for rank in range(len(alphabet))]
+    rng = random.Random(seed)
+    return ''.join(rng.choices(alphabet, weights, k=size))
+
+
+def measure(function, *args):
+    """Замер времени выполнения функции.
+
+    Returns:
+        tuple: (результат, время в секундах).
+    """
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def bench_decoders(data):
+    """Сравнение способов декодирования на одних и тех же данных.
+
+    Args:
+        data (str): Исходный текст.
+    """
+    huffman = Huffman()
+    codes = huffman.build_codes(data)
+    encoded_data = ''.join(codes[symbol] for symbol in data)
+    size_kb = len(data.encode('utf-8')) / 1024
+
+    print(f"Символов: {len(data)}, бит: {len(encoded_data)}")
+    for method in DECODERS:
+        decoded_data, elapsed = measure(huffman.decode_bits, encoded_data, len(data), method)
+        assert decoded_data == data, f"Декодер {method} вернул неверный результат"
+        print(f"{method:>8}: {elapsed:.3f} с, {size_kb / elapsed:.0f} КБ/с")
+
+    decoded_data, elapsed = measure(legacy_scan_decode, encoded_data, codes)
+    assert decoded_data == data, "Декодер scan вернул неверный результат"
+    print(f"{'scan':>8}: {elapsed:.3f} с, {size_kb / elapsed:.0f} КБ/с")
+
+
+def adaptive_encode(data):
+    """Адаптивное кодирование байтов одним вызовом."""
+    encoder = AdaptiveHuffmanEncoder()
+    return encoder.encode_chunk(data) + encoder.finish()
+
+
+def adaptive_decode(data):
+    """Адаптивное декодирование байтов одним вызовом."""
+    return AdaptiveHuffmanDecoder().decode_chunk(data)
+
+
+def bench_adaptive(data):
+    """Сравнение статического и адаптивного кодирования: сжатие и скорость.
+
+    Для статического кода в размер входит таблица длин кодов.
+
+    Args:
+        data (str): Исходный текст.
+    """
+    raw = data.encode('utf-8')
+    size_kb = len(raw) / 1024
+
+    huffman = Huffman()
+    (payload, bit_count), static_encode = measure(huffman.encode_packed, data)
+    decoded_data, static_decode = measure(huffman.decode_packed, payload, bit_count, len(data))
+    assert decoded_data == data, "Статический декодер вернул неверный результат"
+    table = pack_code_lengths({ord(symbol): length
+                               for symbol, length in huffman.code_lengths.items()})
+    static_size = len(table) + len(payload)
+
+    encoded, adaptive_encode_time = measure(adaptive_encode, raw)
+    decoded, adaptive_decode_time = measure(adaptive_decode, encoded)
+    assert decoded == raw, "Адаптивный декодер вернул неверный результат"
+
+    print(f"Статический и адаптивный код, {size_kb:.0f} КБ:")
+    for name, size, encode_time, decode_time in (
+            ("static", static_size, static_encode, static_decode),
+            ("adaptive", len(encoded), adaptive_encode_time, adaptive_decode_time)):
+        print(f"{name:>10}: {size} байт, сжатие {len(raw) / size:.3f}, "
+              f"кодирование {size_kb / encode_time:.0f} КБ/с, "
+              f"декодирование {size_kb / decode_time:.0f} КБ/с")
+
+
+def bench_byte_mode(data):
+    """Сравнение кодирования текста по символам и по байтам.
+
+    Args:
+        data (str): Исходный текст.
+    """
+    raw = data.encode('utf-8')
+    size_kb = len(raw) / 1024
+
+    print(f"Символы и байты, {size_kb:.0f} КБ:")
+    huffman = Huffman()
+    (payload, bit_count), encode_time = measure(huffman.encode_packed, data)
+    decoded_data, decode_time = measure(huffman.decode_packed, payload, bit_count, len(data))
+    assert decoded_data == data, "Декодер символов вернул неверный результат"
+    print(f"{'text':>10}: {len(payload)} байт, кодирование {size_kb / encode_time:.0f} КБ/с, "
+          f"декодирование {size_kb / decode_time:.0f} КБ/с")
+
+    (payload, bit_count), encode_time = measure(huffman.encode_packed_bytes, raw)
+    decoded, decode_time = measure(huffman.decode_packed_bytes, payload, bit_count, len(raw))
+    assert decoded == raw, "Декодер байтов вернул неверный результат"
+    print(f"{'bytes':>10}: {len(payload)} байт, кодирование {size_kb / encode_time:.0f} КБ/с, "
+          f"декодирование {size_kb / decode_time:.0f} КБ/с")
+
+
+def bench_range(data):
+    """Сравнение интервального кодера с контекстом разных порядков и кода Хаффмана.
+
+    Результат - среднее число бит на символ рядом с энтропией источника
+    (без учёта таблиц).
+
+    Args:
+        data (str): Исходный текст.
+    """
+    size_kb = len(data.encode('utf-8')) / 1024
+    entropy = calculate_frequency_entropy(Counter(data))
+    print(f"Интервальный кодер, {size_kb:.0f} КБ, энтропия {entropy:.3f} бит/символ:")
+
+    huffman = Huffman()
+    (payload, _), encode_time = measure(huffman.encode_packed, data)
+    print(f"{'huffman':>10}: {8 * len(payload) / len(data):.3f} бит/символ, "
+          f"кодирование {size_kb / encode_time:.0f} КБ/с")
+
+    alphabet = sorted(set(data))
+    index = {symbol: number for number, symbol in enumerate(alphabet)}
+    symbols = [index[symbol] for symbol in data]
+    symbol_bits = symbol_bits_for(len(alphabet))
+    for order in range(MAX_ORDER + 1):
+        encoder = RangeEncoder(ContextModel(order, symbol_bits))
+        encoded, encode_time = measure(lambda: encoder.encode(symbols) + encoder.finish())
+        decoder = RangeDecoder(ContextModel(order, symbol_bits), [encoded])
+        decoded, decode_time = measure(decoder.decode, len(symbols))
+        assert decoded == symbols, f"Порядок {order}: неверный результат"
+        print(f"{'order ' + str(order):>10}: {8 * len(encoded) / len(data):.3f} бит/символ, "
+              f"кодирование {size_kb / encode_time:.0f} КБ/с, "
+              f"декодирование {size_kb / decode_time:.0f} КБ/с")
+
+
+def bench_tans(data):
+    """Сравнение tANS и статического кода Хаффмана с табличным декодером.
+
+    Размеры указаны без таблиц: у обоих методов таблица строится по одной
+    и той же гистограмме частот.
+
+    Args:
+        data (str): Исходный текст.
+    """
+    size_kb = len(data.encode('utf-8')) / 1024
+    frequency = Counter(data)
+    print(f"tANS, {size_kb:.0f} КБ, энтропия {calculate_frequency_entropy(frequency):.3f} бит/символ:")
+
+    huffman = Huffman()
+    (payload, bit_count), encode_time = measure(huffman.encode_packed, data)
+    decoded_data, decode_time = measure(huffman.decode_packed, payload, bit_count, len(data))
+    assert decoded_data == data, "Декодер Хаффмана вернул неверный результат"
+    print(f"{'huffman':>10}: {bit_count / len(data):.3f} бит/символ, "
+          f"кодирование {size_kb / encode_time:.0f} КБ/с, "
+          f"декодирование {size_kb / decode_time:.0f} КБ/с")
+
+    for table_log in (9, 11, 13):
+        codec = TansCodec.from_frequency(frequency, table_log)
+        encoded, encode_time = measure(codec.encode, data)
+        decoded, decode_time = measure(codec.decode, encoded, len(data))
+        assert ''.join(decoded) == data, f"tANS {table_log}: неверный результат"
+        print(f"{'tans ' + str(table_log):>10}: {8 * len(encoded) / len(data):.3f} бит/символ, "
+              f"кодирование {size_kb / encode_time:.0f} КБ/с, "
+              f"декодирование {size_kb / decode_time:.0f} КБ/с")
+
+
+def bench_lz77(data):
+    """Сравнение LZ77 с кодами Хаффмана и zlib (DEFLATE) как эталона.
+
+    Args:
+        data (str): Исходный текст.
+    """
+    raw = data.encode('utf-8')
+    size_kb = len(raw) / 1024
+    print(f"LZ77 и zlib, {size_kb:.0f} КБ:")
+
+    huffman = Huffman()
+    (payload, _), encode_time = measure(huffman.encode_packed_bytes, raw)
+    size = len(payload) + len(pack_code_lengths(huffman.code_lengths))
+    print(f"{'huffman':>10}: {size} байт, сжатие {len(raw) / size:.3f}, "
+          f"кодирование {size_kb / encode_time:.0f} КБ/с")
+
+    for window, max_chain in ((4096, 16), (lz77.DEFAULT_WINDOW, lz77.DEFAULT_MAX_CHAIN)):
+        (block, _, _), encode_time = measure(lz77.encode_block, raw, window, max_chain)
+        decoded, decode_time = measure(lz77.decode_block, BytesIO(block))
+        assert decoded == raw, "LZ77 вернул неверный результат"
+        name = f"lz77 {window // 1024}K"
+        print(f"{name:>10}: {len(block)} байт, сжатие {len(raw) / len(block):.3f}, "
+              f"кодирование {size_kb / encode_time:.0f} КБ/с, "
+              f"декодирование {size_kb / decode_time:.0f} КБ/с")
+
+    for level in (6, 9):
+        compressed, encode_time = measure(zlib.compress, raw, level)
+        decoded, decode_time = measure(zlib.decompress, compressed)
+        assert decoded == raw, "zlib вернул неверный результат"
+        print(f"{'zlib ' + str(level):>10}: {len(compressed)} байт, "
+              f"сжатие {len(raw) / len(compressed):.3f}, "
+              f"кодирование {size_kb / encode_time:.0f} КБ/с, "
+              f"декодирование {size_kb / decode_time:.0f} КБ/с")
+
+
+def bench_bwt(data):
+    """Сжатие блоками BWT + MTF + RLE с кодом Хаффмана и bz2 как эталон.
+
+    Args:
+        data (str): Исходный текст.
+    """
+    raw = data.encode('utf-8')
+    size_kb = len(raw) / 1024
+    print(f"BWT и bz2, {size_kb:.0f} КБ:")
+
+    def encode(raw):
+        return b''.join(bwt.encode_block(raw[start:start + bwt.DEFAULT_BLOCK_SIZE])
+                        for start in range(0, len(raw), bwt.DEFAULT_BLOCK_SIZE))
+
+    def decode(encoded):
+        file = BytesIO(encoded)
+        blocks = []
+        while file.tell() < len(encoded):
+            blocks.append(bwt.decode_block(file))
+        return b''.join(blocks)
+
+    encoded, encode_time = measure(encode, raw)
+    decoded, decode_time = measure(decode, encoded)
+    assert decoded == raw, "BWT вернул неверный результат"
+    compressed, bz2_encode_time = measure(bz2.compress, raw)
+    _, bz2_decode_time = measure(bz2.decompress, compressed)
+    for name, size, encode_time, decode_time in (
+            ("bwt", len(encoded), encode_time, decode_time),
+            ("bz2", len(compressed), bz2_encode_time, bz2_decode_time)):
+        print(f"{name:>10}: {size} байт, сжатие {len(raw) / size:.3f}, "
+              f"кодирование {size_kb / encode_time:.0f} КБ/с, "
+              f"декодирование {size_kb / decode_time:.0f} КБ/с")
+
+
+def sample_messages(count, seed=0):
+    """Набор коротких похожих сообщений: несколько шаблонов с разными числами.
+
+    Args:
+        count (int): Число сообщений.
+        seed (int): Начальное значение генератора случайных чисел.
+
+    Returns:
+        list: Список сообщений.
+    """
+    templates = ("статус узла {}: норма", "ошибка на узле {}: нет связи",
+                 "узел {} перезапущен", "нагрузка узла {}: высокая")
+    rng = random.Random(seed)
+    return [rng.choice(templates).format(rng.randint(1, 4)) for _ in range(count)]
+
+
+def bench_codebooks(count):
+    """Сжатие множества коротких сообщений: построение кодов для каждого,
+    кэш кодов и обученная заранее кодовая книга.
+
+    Args:
+        count (int): Число сообщений.
+    """
+    messages = sample_messages(count)
+    print(f"Короткие сообщения, {count} шт.:")
+
+    def per_message(huffman):
+        total = 0
+        for message in messages:
+            payload, _ = huffman.encode_packed(message)
+            table = pack_code_lengths({ord(symbol): length
+                                       for symbol, length in huffman.code_lengths.items()})
+            total += len(table) + len(payload)
+        return total
+
+    size, elapsed = measure(per_message, Huffman())
+    print(f"{'rebuild':>10}: {size} байт, {count / elapsed:.0f} сообщений/с")
+
+    cache = CodebookCache()
+    size, elapsed = measure(per_message, Huffman(cache=cache))
+    stats = cache.stats()
+    print(f"{'cache':>10}: {size} байт, {count / elapsed:.0f} сообщений/с, "
+          f"попаданий {stats['hits']}, промахов {stats['misses']}")
+
+    training = Counter(ord(symbol) for message in sample_messages(1000, seed=1)
+                       for symbol in message)
+    codebook = StaticCodebook.train(training)
+
+    def static(codebook):
+        total = 0
+        for message in messages:
+            bits = codebook.encode(map(ord, message))
+            total += len(pack_bits(bits))
+        return total
+
+    size, elapsed = measure(static, codebook)
+    print(f"{'static':>10}: {size} байт, {count / elapsed:.0f} сообщений/с")
+
+
+def legacy_scan_decode(encoded_data, codes):
+    """Прежнее декодирование PR5/test: перебор всех кодов на каждом бите."""
+    decoded_data = ""
+    current_code = ""
+    for bit in encoded_data:
+        current_code += bit
+        for symbol, code in codes.items():
+            if code == current_code:
+                decoded_data += symbol
+                current_code = ""
+                break
+    return decoded_data
+
+
+def legacy_pack_bits(bits):
+    """Прежняя упаковка битов: int() для каждого байта отдельно."""
+    bits += '0' * (-len(bits) % 8)
+    return bytes([int(bits[i:i + 8], 2) for i in range(0, len(bits), 8)])
+
+
+def legacy_unpack_bits(data):
+    """Прежняя распаковка битов: форматирование каждого байта отдельно."""
+    return ''.join([f'{item:08b}' for item in data])
+
+
+def bench_bit_packing(size):
+    """Сравнение прежней и новой упаковки битов на случайных данных.
+
+    Args:
+        size (int): Размер упакованных данных в байтах.
+    """
+    data = random.Random(0).randbytes(size)
+    bits = unpack_bits(data)
+    size_mb = size / (1 << 20)
+
+    print(f"Упаковка битов, {size_mb:.1f} МБ:")
+    for name, pack, unpack in (("legacy", legacy_pack_bits, legacy_unpack_bits),
+                               ("bitbuffer", pack_bits, unpack_bits)):
+        packed, pack_time = measure(pack, bits)
+        unpacked, unpack_time = measure(unpack, packed)
+        assert packed == data and unpacked == bits, f"{name}: неверный результат"
+        total = pack_time + unpack_time
+        print(f"{name:>10}: {total:.3f} с, {size_mb / total:.1f} МБ/с")
+
+
+def main():
+    """Точка входа: разбор аргументов и запуск замеров."""
+    parser = argparse.ArgumentParser(description="Замеры скорости кодеков Хаффмана")
+    parser.add_argument('--file', help="Текстовый файл для замеров")
+    parser.add_argument('--size', type=int, default=200_000,
+                        help="Длина синтетического текста, если файл не указан")
+    parser.add_argument('--bits-size', type=int, default=4 << 20,
+                        help="Размер данных в байтах для замера упаковки битов")
+    parser.add_argument('--messages', type=int, default=20_000,
+                        help="Число коротких сообщений для замера кэша кодов")
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, 'r', encoding='utf-8') as file:
+            data = file.read()
+    else:
+        data = sample_text(args.size)
+
+    bench_decoders(data)
+    bench_adaptive(data)
+    bench_byte_mode(data)
+    bench_range(data)
+    bench_tans(data)
+    bench_lz77(data)
+    bench_bwt(data)
+    bench_codebooks(args.messages)
+    bench_bit_packing(args.bits_size)
+
+
+if __name__ == "__main__":
+    main()
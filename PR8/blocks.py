@@ -0,0 +1,95 @@
+"""
+Независимое кодирование блоков текста для параллельной обработки.
+
+Функции модуля выполняются в дочерних процессах, поэтому принимают и
+возвращают только простые значения, которые можно передать через pickle.
+"""
+import os
+import sys
+from collections import Counter, deque
+
+from huffman import Huffman
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infotheory.bitbuffer import pack_bits  # noqa: E402
+from infotheory.canonical import pack_code_lengths, unpack_code_lengths  # noqa: E402
+
+DEFAULT_BLOCK_SIZE = 1 << 20  # символов в блоке
+
+
+def encode_block(text, code_lengths=None, max_code_length=None):
+    """Кодирование одного блока.
+
+    Args:
+        text (str): Текст блока.
+        code_lengths (dict): Общая таблица длин кодов; если не задана,
+            для блока строится собственная таблица.
+        max_code_length (int): Ограничение длины кода собственной таблицы.
+
+    Returns:
+        tuple: (сериализованная таблица длин кодов или b'', упакованный поток,
+            биты выравнивания, частоты символов блока).
+    """
+    huffman = Huffman(max_code_length)
+    frequency = Counter(text)
+    if code_lengths is None:
+        huffman.build_codes_from_frequency(frequency)
+        table = pack_code_lengths({ord(symbol): length
+                                   for symbol, length in huffman.code_lengths.items()})
+    else:
+        huffman.load_code_lengths(code_lengths)
+        table = b''
+    codes = huffman.huffman_codes
+    bits = ''.join(map(codes.__getitem__, text))
+    return table, pack_bits(bits), -len(bits) % 8, frequency
+
+
+def decode_block(input_file, entry, code_lengths=None):
+    """Декодирование одного блока контейнера.
+
+    Args:
+        input_file (str): Путь к контейнеру.
+        entry (BlockEntry): Запись индекса блока.
+        code_lengths (dict): Общая таблица длин кодов, если блок не содержит своей.
+
+    Returns:
+        str: Текст блока.
+    """
+    with open(input_file, 'rb') as file:
+        file.seek(entry.offset)
+        table = file.read(entry.table_size)
+        payload = file.read(entry.payload_size)
+    if len(payload) < entry.payload_size:
+        raise ValueError("Блок контейнера обрезан")
+    if entry.table_size:
+        lengths, _ = unpack_code_lengths(table)
+        code_lengths = {chr(symbol): length for symbol, length in lengths.items()}
+
+    huffman = Huffman()
+    huffman.load_code_lengths(code_lengths)
+    return huffman.decode_packed(payload, 8 * len(payload) - entry.padding, entry.symbol_count)
+
+
+def ordered_map(pool, function, arguments, limit):
+    """Параллельное выполнение функции с сохранением порядка результатов.
+
+    В отличие от Executor.map одновременно отправляется не более limit
+    задач, поэтому входные данные читаются по мере обработки.
+
+    Args:
+        pool (Executor): Пул процессов.
+        function (callable): Выполняемая функция.
+        arguments (iterable): Кортежи аргументов для каждого вызова.
+        limit (int): Максимальное число задач в работе.
+
+    Yields:
+        Результаты вызовов в порядке аргументов.
+    """
+    pending = deque()
+    for args in arguments:
+        pending.append(pool.submit(function, *args))
+        if len(pending) >= limit:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
@@ -0,0 +1,272 @@
+"""
+Преобразование Барроуза - Уилера (BWT), move-to-front и RLE перед кодом Хаффмана.
+
+Конвейер блока (как в bzip2):
+    BWT группирует одинаковые байты из похожих контекстов,
+    MTF превращает их в серии малых чисел (в основном нулей),
+    серии нулей записываются числами RUN_A/RUN_B в биективной двоичной
+    системе, остальные значения MTF сдвигаются на единицу,
+    результат кодируется кодом Хаффмана.
+
+Суффиксный массив строится удвоением префиксов (Manber - Myers): на
+каждом шаге суффиксы упорядочиваются по паре рангов (i, i + k) двумя
+устойчивыми сортировками подсчётом, то есть за O(n); шагов не больше
+log n, а при неповторяющихся данных процесс завершается раньше.
+Обратное преобразование выполняется за O(n) по LF-отображению.
+
+Блок сериализуется как BWT_BLOCK_FORMAT, таблица длин кодов
+(infotheory.canonical.pack_code_lengths) и упакованный поток.
+"""
+import os
+import sys
+import struct
+from collections import Counter
+
+from huffman import Huffman
+from container import BWT_BLOCK_FORMAT
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infotheory.bitbuffer import pack_bits  # noqa: E402
+from infotheory.canonical import canonical_codes, pack_code_lengths, unpack_code_lengths  # noqa: E402
+from infotheory.huffman_table import TableDecoder  # noqa: E402
+
+DEFAULT_BLOCK_SIZE = 256 * 1024  # байт в блоке BWT
+RUN_A = 0
+RUN_B = 1
+MTF_SHIFT = 1  # значение MTF v > 0 записывается символом v + MTF_SHIFT
+
+
+def suffix_array(data):
+    """
+    Суффиксный массив строки с добавленным в конец наименьшим символом.
+
+    Args:
+        data (bytes): Данные.
+
+    Returns:
+        list: Начала суффиксов data + sentinel в порядке возрастания
+            (первым всегда идёт суффикс len(data), состоящий из sentinel).
+    """
+    size = len(data) + 1
+    rank = [byte + 1 for byte in data]
+    rank.append(0)
+    order = sorted(range(size), key=rank.__getitem__)
+    rank_count = 257  # ранги - значения байтов плюс один, 0 - sentinel
+    distinct = len(set(rank))
+    step = 1
+    while distinct < size:
+        # Сортировка по второй половине: суффиксы без неё идут первыми,
+        # остальные - в порядке суффиксов, с которых начинается вторая половина
+        second = list(range(size - step, size))
+        second.extend(index - step for index in order if index >= step)
+        # Устойчивая сортировка подсчётом по первой половине
+        starts = [0] * (rank_count + 1)
+        for value in rank:
+            starts[value + 1] += 1
+        for value in range(rank_count):
+            starts[value + 1] += starts[value]
+        for index in second:
+            value = rank[index]
+            order[starts[value]] = index
+            starts[value] += 1
+
+        classes = [0] * size
+        distinct = 0
+        previous = None
+        for index in order:
+            key = (rank[index], rank[index + step] if index + step < size else -1)
+            if key != previous:
+                distinct += 1
+                previous = key
+            classes[index] = distinct - 1
+        rank = classes
+        rank_count = distinct
+        step *= 2
+    return order
+
+
+def bwt_transform(data):
+    """
+    Прямое преобразование Барроуза - Уилера.
+
+    Args:
+        data (bytes): Данные блока.
+
+    Returns:
+        tuple: (последний столбец без sentinel (bytes), позиция sentinel в нём).
+    """
+    last = bytearray()
+    primary = 0
+    for position, start in enumerate(suffix_array(data)):
+        if start:
+            last.append(data[start - 1])
+        else:
+            primary = position
+    return bytes(last), primary
+
+
+def inverse_bwt(last, primary):
+    """
+    Обратное преобразование Барроуза - Уилера за O(n).
+
+    Args:
+        last (bytes): Последний столбец без sentinel.
+        primary (int): Позиция sentinel в последнем столбце.
+
+    Returns:
+        bytes: Исходные данные блока.
+
+    Raises:
+        ValueError: Если позиция sentinel вне блока.
+    """
+    size = len(last)
+    if not 0 <= primary <= size:
+        raise ValueError("Недопустимая позиция sentinel в блоке BWT")
+    # Первый столбец: sentinel, затем байты по возрастанию
+    starts = [0] * 256
+    total = 1
+    counts = Counter(last)
+    for byte in range(256):
+        starts[byte] = total
+        total += counts.get(byte, 0)
+    # LF-отображение: строка с последним символом в позиции i -> строка, начинающаяся с него
+    lf = [0] * (size + 1)
+    for position in range(size + 1):
+        if position == primary:
+            continue
+        byte = last[position - (position > primary)]
+        lf[position] = starts[byte]
+        starts[byte] += 1
+
+    output = bytearray(size)
+    row = 0  # строка, начинающаяся с sentinel; её последний символ - последний байт данных
+    for position in range(size - 1, -1, -1):
+        output[position] = last[row - (row > primary)]
+        row = lf[row]
+    return bytes(output)
+
+
+def mtf_encode(data):
+    """Преобразование move-to-front: номер байта в списке недавно встреченных."""
+    table = bytearray(range(256))
+    output = bytearray(len(data))
+    for position, byte in enumerate(data):
+        index = table.index(byte)
+        if index:
+            table[1:index + 1] = table[:index]
+            table[0] = byte
+        output[position] = index
+    return bytes(output)
+
+
+def mtf_decode(data):
+    """Обратное преобразование move-to-front."""
+    table = bytearray(range(256))
+    output = bytearray(len(data))
+    for position, index in enumerate(data):
+        byte = table[index]
+        if index:
+            table[1:index + 1] = table[:index]
+            table[0] = byte
+        output[position] = byte
+    return bytes(output)
+
+
+def rle_encode(data):
+    """
+    Запись серий нулей MTF символами RUN_A/RUN_B (биективная двоичная система).
+
+    Args:
+        data (bytes): Результат MTF.
+
+    Returns:
+        list: Символы алфавита 0..256.
+    """
+    symbols = []
+    run = 0
+    for value in data:
+        if not value:
+            run += 1
+            continue
+        while run:
+            run -= 1
+            symbols.append(run & 1)
+            run >>= 1
+        symbols.append(value + MTF_SHIFT)
+    while run:
+        run -= 1
+        symbols.append(run & 1)
+        run >>= 1
+    return symbols
+
+
+def rle_decode(symbols):
+    """Восстановление результата MTF из символов rle_encode."""
+    output = bytearray()
+    run = 0
+    weight = 1
+    for symbol in symbols:
+        if symbol <= RUN_B:
+            run += weight << symbol
+            weight <<= 1
+            continue
+        if run:
+            output += bytes(run)
+            run = 0
+            weight = 1
+        output.append(symbol - MTF_SHIFT)
+    output += bytes(run)
+    return bytes(output)
+
+
+def encode_block(data, max_code_length=None):
+    """
+    Сжатие блока: BWT, MTF, RLE и код Хаффмана.
+
+    Args:
+        data (bytes): Данные блока.
+        max_code_length (int): Ограничение длины кода; None - без ограничения.
+
+    Returns:
+        bytes: Сериализованный блок.
+    """
+    last, primary = bwt_transform(data)
+    symbols = rle_encode(mtf_encode(last))
+    huffman = Huffman(max_code_length)
+    codes = huffman.build_codes_from_frequency(Counter(symbols))
+    table = pack_code_lengths(huffman.code_lengths)
+    bits = ''.join(map(codes.__getitem__, symbols))
+    header = struct.pack(BWT_BLOCK_FORMAT, len(data), primary, len(symbols), len(table), len(bits))
+    return header + table + pack_bits(bits)
+
+
+def decode_block(file):
+    """
+    Чтение и восстановление одного блока.
+
+    Args:
+        file: Файл, открытый в режиме 'rb' и установленный на начало блока.
+
+    Returns:
+        bytes: Данные блока.
+
+    Raises:
+        ValueError: Если блок обрезан или повреждён.
+    """
+    raw = file.read(struct.calcsize(BWT_BLOCK_FORMAT))
+    if len(raw) < struct.calcsize(BWT_BLOCK_FORMAT):
+        raise ValueError("Блок BWT обрезан")
+    size, primary, symbol_count, table_size, bit_count = struct.unpack(BWT_BLOCK_FORMAT, raw)
+    code_lengths, _ = unpack_code_lengths(file.read(table_size))
+    payload = file.read((bit_count + 7) // 8)
+    if len(payload) < (bit_count + 7) // 8:
+        raise ValueError("Блок BWT обрезан")
+
+    symbols = TableDecoder(canonical_codes(code_lengths)).decode(payload, bit_count, symbol_count)
+    if len(symbols) != symbol_count:
+        raise ValueError("Поток BWT обрезан")
+    last = mtf_decode(rle_decode(symbols))
+    if len(last) != size:
+        raise ValueError("Размер блока BWT не совпадает с заголовком")
+    return inverse_bwt(last, primary)
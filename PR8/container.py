@@ -0,0 +1,194 @@
+"""
+Двоичный контейнер для сжатых данных.
+
+Структура файла:
+    заголовок фиксированной длины (HEADER_FORMAT),
+    таблица длин канонических кодов (infotheory.canonical.pack_code_lengths),
+    упакованный битовый поток.
+
+В блочном режиме (METHOD_HUFFMAN_BLOCKS) вместо единого потока записаны:
+    смещение индекса блоков (INDEX_OFFSET_FORMAT),
+    независимые блоки: собственная таблица длин кодов и упакованный поток,
+    индекс блоков (BLOCK_ENTRY_FORMAT для каждого блока).
+
+В адаптивном режиме (METHOD_ADAPTIVE) таблица кодов пуста, а за заголовком
+следует поток адаптивного кодера (adaptive.py), который заканчивается
+символом конца потока. Заголовок записывается до начала кодирования,
+поэтому число символов в нём равно 0.
+
+В режиме общего словаря (METHOD_DICTIONARY) таблица кодов пуста, за ней
+записан идентификатор словаря (DICTIONARY_ID_FORMAT, см. dictionary.py),
+а затем упакованный поток кодов словаря с escape-кодами.
+
+В режиме интервального кодирования (METHOD_RANGE, см. range_coder.py)
+таблица перечисляет алфавит текста: символ -> число бит его номера
+(для ALPHABET_BYTES таблица пуста). За таблицей записан порядок
+контекстной модели (RANGE_ORDER_FORMAT), а затем поток интервального кодера.
+
+В режиме tANS (METHOD_TANS, см. tans.py) таблица хранит нормированные
+частоты символов (их сумма - размер таблицы состояний). За таблицей
+записано число символов в блоке (TANS_BLOCK_SIZE_FORMAT), затем блоки:
+размер потока блока (TANS_STREAM_SIZE_FORMAT) и сам поток.
+
+В режиме LZ77 (METHOD_LZ77, см. lz77.py) таблица пуста, а за ней следуют
+независимые блоки исходных байтов: заголовок блока (LZ77_BLOCK_FORMAT),
+таблицы кодов литералов/длин и групп расстояний, три упакованных потока.
+
+В режиме BWT (METHOD_BWT, см. bwt.py) таблица также пуста, а блоки
+исходных байтов состоят из заголовка блока (BWT_BLOCK_FORMAT), таблицы
+длин кодов символов MTF/RLE и упакованного потока.
+
+В режиме токенов (METHOD_TOKENS, см. infotheory/tokens.py) символы кода -
+номера токенов словаря (слов, серий пробелов и отдельных символов), число
+символов в заголовке - число номеров. За таблицей длин кодов записаны
+размер словаря в байтах (TOKEN_VOCABULARY_FORMAT), сам словарь и
+упакованный поток.
+"""
+import os
+import sys
+import struct
+from collections import namedtuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infotheory.canonical import pack_code_lengths, unpack_code_lengths  # noqa: E402
+
+MAGIC = b'HFC8'
+VERSION = 1
+
+# magic, версия, метод, алфавит, флаги, биты выравнивания, число символов, размер таблицы
+HEADER_FORMAT = '>4sBBBBBQI'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+METHOD_HUFFMAN = 0
+METHOD_HUFFMAN_BLOCKS = 1
+METHOD_ADAPTIVE = 2
+METHOD_DICTIONARY = 3
+METHOD_RANGE = 4
+METHOD_TANS = 5
+METHOD_LZ77 = 6
+METHOD_BWT = 7
+METHOD_TOKENS = 8
+
+FLAG_SHARED_TABLE = 0x01  # все блоки используют таблицу кодов из заголовка
+
+ALPHABET_TEXT = 0  # символы Unicode, номер символа - его код ord()
+ALPHABET_BYTES = 1  # байты произвольного файла, номер символа - значение байта
+
+Header = namedtuple('Header', ['method', 'alphabet', 'flags', 'padding', 'symbol_count'])
+
+DICTIONARY_ID_FORMAT = '>I'
+RANGE_ORDER_FORMAT = '>B'
+TANS_BLOCK_SIZE_FORMAT = '>I'
+TANS_STREAM_SIZE_FORMAT = '>I'
+# размер блока, число символов литералов и длин, число совпадений, размеры двух
+# таблиц, число бит потоков литералов и длин, групп расстояний и дополнительных бит
+LZ77_BLOCK_FORMAT = '>IIIIIQQQ'
+# размер блока, позиция sentinel, число символов MTF/RLE, размер таблицы, число бит потока
+BWT_BLOCK_FORMAT = '>IIIIQ'
+TOKEN_VOCABULARY_FORMAT = '>I'
+
+INDEX_OFFSET_FORMAT = '>Q'
+INDEX_COUNT_FORMAT = '>I'
+# смещение блока, размер таблицы, размер потока, число символов, биты выравнивания
+BLOCK_ENTRY_FORMAT = '>QIQQB'
+
+BlockEntry = namedtuple('BlockEntry',
+                        ['offset', 'table_size', 'payload_size', 'symbol_count', 'padding'])
+
+
+def write_header(file, header, code_lengths):
+    """Запись заголовка и таблицы длин кодов.
+
+    Args:
+        file: Файл, открытый в режиме 'wb'.
+        header (Header): Поля заголовка.
+        code_lengths (dict): Словарь целочисленный символ -> длина кода.
+
+    Returns:
+        int: Число записанных байт.
+    """
+    table = pack_code_lengths(code_lengths)
+    file.write(struct.pack(HEADER_FORMAT, MAGIC, VERSION, header.method, header.alphabet,
+                           header.flags, header.padding, header.symbol_count, len(table)))
+    file.write(table)
+    return HEADER_SIZE + len(table)
+
+
+def read_header(file):
+    """Чтение заголовка и таблицы длин кодов.
+
+    Args:
+        file: Файл, открытый в режиме 'rb' и установленный на начало контейнера.
+
+    Returns:
+        tuple: (Header, словарь целочисленный символ -> длина кода).
+
+    Raises:
+        ValueError: Если файл не является контейнером поддерживаемой версии.
+    """
+    raw = file.read(HEADER_SIZE)
+    if len(raw) < HEADER_SIZE or raw[:len(MAGIC)] != MAGIC:
+        raise ValueError("Файл не является контейнером Хаффмана")
+    (_, version, method, alphabet, flags, padding,
+     symbol_count, table_size) = struct.unpack(HEADER_FORMAT, raw)
+    if version != VERSION:
+        raise ValueError(f"Неподдерживаемая версия контейнера: {version}")
+    table = file.read(table_size)
+    if len(table) < table_size:
+        raise ValueError("Таблица длин кодов обрезана")
+    code_lengths, _ = unpack_code_lengths(table)
+    return Header(method, alphabet, flags, padding, symbol_count), code_lengths
+
+
+def is_container(path):
+    """Проверка, записан ли файл в формате контейнера.
+
+    Args:
+        path (str): Путь к файлу.
+
+    Returns:
+        bool: True, если файл начинается с сигнатуры контейнера.
+    """
+    with open(path, 'rb') as file:
+        return file.read(len(MAGIC)) == MAGIC
+
+
+def write_block_index(file, entries):
+    """Запись индекса блоков в текущую позицию файла.
+
+    Args:
+        file: Файл, открытый в режиме 'wb'.
+        entries (list): Список BlockEntry.
+
+    Returns:
+        int: Смещение начала индекса.
+    """
+    offset = file.tell()
+    file.write(struct.pack(INDEX_COUNT_FORMAT, len(entries)))
+    for entry in entries:
+        file.write(struct.pack(BLOCK_ENTRY_FORMAT, *entry))
+    return offset
+
+
+def read_block_index(file):
+    """Чтение индекса блоков.
+
+    Args:
+        file: Файл, установленный сразу после заголовка и таблицы длин кодов.
+
+    Returns:
+        list: Список BlockEntry.
+    """
+    raw = file.read(struct.calcsize(INDEX_OFFSET_FORMAT))
+    if len(raw) < struct.calcsize(INDEX_OFFSET_FORMAT):
+        raise ValueError("Отсутствует смещение индекса блоков")
+    (index_offset,) = struct.unpack(INDEX_OFFSET_FORMAT, raw)
+    file.seek(index_offset)
+    (count,) = struct.unpack(INDEX_COUNT_FORMAT, file.read(struct.calcsize(INDEX_COUNT_FORMAT)))
+    entry_size = struct.calcsize(BLOCK_ENTRY_FORMAT)
+    raw = file.read(count * entry_size)
+    if len(raw) < count * entry_size:
+        raise ValueError("Индекс блоков обрезан")
+    return [BlockEntry(*struct.unpack_from(BLOCK_ENTRY_FORMAT, raw, position))
+            for position in range(0, len(raw), entry_size)]
@@ -0,0 +1,216 @@
+"""
+Общие словари кодов Хаффмана для сжатия коротких сообщений.
+
+Словарь обучается один раз по корпусу текстов (команда train в main.py)
+и сохраняется в каталоге словарей под идентификатором - CRC32 его
+содержимого, поэтому каждая новая версия получает новый идентификатор.
+Контейнер METHOD_DICTIONARY хранит вместо таблицы кодов только этот
+идентификатор.
+
+Структура файла словаря <идентификатор>.hfd:
+    DICTIONARY_MAGIC, число бит значения после escape-кода (1 байт),
+    таблица длин кодов (infotheory.canonical.pack_code_lengths).
+
+Файл index.json сопоставляет имени словаря список его версий. По умолчанию
+каталог словарей находится в пользовательском каталоге данных (вне дерева
+исходников), его можно переопределить переменной окружения
+HUFFMAN_DICTIONARY_DIR или параметром --dictionary-dir.
+"""
+import os
+import sys
+import json
+import zlib
+from collections import Counter
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infotheory.canonical import pack_code_lengths, unpack_code_lengths  # noqa: E402
+from infotheory.codebook_cache import CodebookCache, StaticCodebook, TEXT_RAW_BITS  # noqa: E402
+
+DICTIONARY_MAGIC = b'HFD1'
+DICTIONARY_EXTENSION = '.hfd'
+DICTIONARY_DIR_ENV = 'HUFFMAN_DICTIONARY_DIR'
+INDEX_FILE = 'index.json'
+CHUNK_SIZE = 1 << 20  # размер части файла корпуса при подсчёте частот
+
+# Загруженные словари остаются в памяти на всё время работы процесса
+loaded_dictionaries = CodebookCache()
+
+
+def default_dictionary_dir():
+    """Каталог словарей по умолчанию: переменная окружения или каталог данных пользователя."""
+    if os.environ.get(DICTIONARY_DIR_ENV):
+        return os.environ[DICTIONARY_DIR_ENV]
+    if sys.platform == 'win32':
+        data_home = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        data_home = os.environ.get('XDG_DATA_HOME') or os.path.join(os.path.expanduser('~'),
+                                                                     '.local', 'share')
+    return os.path.join(data_home, 'huffman', 'dictionaries')
+
+
+DEFAULT_DICTIONARY_DIR = default_dictionary_dir()
+
+
+def format_dictionary_id(dictionary_id):
+    """Текстовое представление идентификатора словаря (8 шестнадцатеричных цифр)."""
+    return f'{dictionary_id:08x}'
+
+
+def corpus_frequencies(corpus_dir):
+    """Подсчёт частот символов во всех файлах каталога корпуса.
+
+    Args:
+        corpus_dir (str): Каталог с текстовыми файлами в кодировке UTF-8.
+
+    Returns:
+        tuple: (Counter целочисленный символ -> частота, число файлов).
+
+    Raises:
+        ValueError: Если каталог не содержит файлов или файл не является текстом UTF-8.
+    """
+    frequency = Counter()
+    file_count = 0
+    for root, _, files in os.walk(corpus_dir):
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            try:
+                with open(path, 'r', encoding='utf-8', newline='') as file:
+                    for chunk in iter(lambda: file.read(CHUNK_SIZE), ''):
+                        frequency.update(chunk)
+            except UnicodeDecodeError as e:
+                raise ValueError(f"Файл корпуса {path} не является текстом UTF-8") from e
+            file_count += 1
+    if not file_count:
+        raise ValueError(f"Каталог корпуса {corpus_dir} не содержит файлов")
+    return Counter({ord(symbol): count for symbol, count in frequency.items()}), file_count
+
+
+def serialize_dictionary(codebook):
+    """Сериализация кодовой книги в формат файла словаря.
+
+    Returns:
+        bytes: Содержимое файла словаря.
+    """
+    return DICTIONARY_MAGIC + bytes([codebook.raw_bits]) + pack_code_lengths(codebook.code_lengths)
+
+
+def parse_dictionary(data):
+    """Восстановление кодовой книги из содержимого файла словаря.
+
+    Raises:
+        ValueError: Если данные не являются файлом словаря.
+    """
+    if data[:len(DICTIONARY_MAGIC)] != DICTIONARY_MAGIC or len(data) <= len(DICTIONARY_MAGIC):
+        raise ValueError("Файл не является словарём кодов Хаффмана")
+    raw_bits = data[len(DICTIONARY_MAGIC)]
+    code_lengths, _ = unpack_code_lengths(data, len(DICTIONARY_MAGIC) + 1)
+    return StaticCodebook(code_lengths, raw_bits)
+
+
+def read_index(dictionary_dir):
+    """Чтение индекса словарей: имя -> список версий {"version", "id"}."""
+    path = os.path.join(dictionary_dir, INDEX_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+
+def train_dictionary(corpus_dir, name, dictionary_dir=DEFAULT_DICTIONARY_DIR,
+                     max_code_length=None):
+    """Обучение словаря по корпусу и сохранение новой версии.
+
+    Args:
+        corpus_dir (str): Каталог с текстами корпуса.
+        name (str): Имя словаря.
+        dictionary_dir (str): Каталог словарей.
+        max_code_length (int): Ограничение длины кода; None - без ограничения.
+
+    Returns:
+        tuple: (идентификатор словаря, номер версии, число файлов корпуса,
+            число символов корпуса).
+    """
+    frequency, file_count = corpus_frequencies(corpus_dir)
+    codebook = StaticCodebook.train(frequency, TEXT_RAW_BITS, max_code_length)
+    data = serialize_dictionary(codebook)
+    dictionary_id = zlib.crc32(data)
+
+    os.makedirs(dictionary_dir, exist_ok=True)
+    path = os.path.join(dictionary_dir, format_dictionary_id(dictionary_id) + DICTIONARY_EXTENSION)
+    with open(path, 'wb') as file:
+        file.write(data)
+
+    index = read_index(dictionary_dir)
+    versions = index.setdefault(name, [])
+    if versions and versions[-1]['id'] == format_dictionary_id(dictionary_id):
+        version = versions[-1]['version']
+    else:
+        version = len(versions) + 1
+        versions.append({'version': version, 'id': format_dictionary_id(dictionary_id)})
+    with open(os.path.join(dictionary_dir, INDEX_FILE), 'w', encoding='utf-8') as file:
+        json.dump(index, file, ensure_ascii=False, indent=2)
+
+    return dictionary_id, version, file_count, sum(frequency.values())
+
+
+def resolve_dictionary(reference, dictionary_dir=DEFAULT_DICTIONARY_DIR):
+    """Определение идентификатора словаря по имени, имени с версией или идентификатору.
+
+    Args:
+        reference (str): 'имя' (последняя версия), 'имя:версия' или
+            шестнадцатеричный идентификатор.
+        dictionary_dir (str): Каталог словарей.
+
+    Returns:
+        int: Идентификатор словаря.
+
+    Raises:
+        ValueError: Если словарь не найден.
+    """
+    index = read_index(dictionary_dir)
+    name, _, version = reference.partition(':')
+    if name in index:
+        versions = index[name]
+        if not version:
+            return int(versions[-1]['id'], 16)
+        for entry in versions:
+            if str(entry['version']) == version:
+                return int(entry['id'], 16)
+        raise ValueError(f"Версия {version} словаря '{name}' не найдена")
+    try:
+        return int(reference, 16)
+    except ValueError:
+        raise ValueError(f"Словарь '{reference}' не найден") from None
+
+
+def load_dictionary(dictionary_id, dictionary_dir=DEFAULT_DICTIONARY_DIR):
+    """Загрузка словаря по идентификатору; повторные обращения не читают файл.
+
+    Args:
+        dictionary_id (int): Идентификатор словаря.
+        dictionary_dir (str): Каталог словарей.
+
+    Returns:
+        StaticCodebook: Кодовая книга словаря.
+
+    Raises:
+        ValueError: Если файл словаря отсутствует или повреждён.
+    """
+    key = (os.path.abspath(dictionary_dir), dictionary_id)
+    try:
+        return loaded_dictionaries.dictionary(key)
+    except KeyError:
+        pass
+    path = os.path.join(dictionary_dir, format_dictionary_id(dictionary_id) + DICTIONARY_EXTENSION)
+    try:
+        with open(path, 'rb') as file:
+            data = file.read()
+    except FileNotFoundError:
+        raise ValueError(f"Словарь {format_dictionary_id(dictionary_id)} не найден "
+                         f"в каталоге {dictionary_dir}") from None
+    if zlib.crc32(data) != dictionary_id:
+        raise ValueError(f"Словарь {format_dictionary_id(dictionary_id)} повреждён")
+    codebook = parse_dictionary(data)
+    loaded_dictionaries.add_dictionary(key, codebook)
+    return codebook
@@ -1,42 +1,890 @@
-from collections import defaultdict
-from math import log2
-from huffman import Huffman
+import os
+import sys
+import struct
+from contextlib import nullcontext
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from huffman import Huffman, DEFAULT_DECODER, count_bytes
+from adaptive import AdaptiveHuffmanEncoder, AdaptiveHuffmanDecoder
+from dictionary import DEFAULT_DICTIONARY_DIR, resolve_dictionary, load_dictionary
+from range_coder import (DEFAULT_ORDER, ContextModel, RangeEncoder, RangeDecoder,
+                         symbol_bits_for)
+from tans import DEFAULT_TABLE_LOG, TansCodec
+import lz77
+import bwt
+from blocks import DEFAULT_BLOCK_SIZE, encode_block, decode_block, ordered_map
+from container import (Header, METHOD_HUFFMAN, METHOD_HUFFMAN_BLOCKS, METHOD_ADAPTIVE,
+                       METHOD_DICTIONARY, DICTIONARY_ID_FORMAT, METHOD_RANGE, RANGE_ORDER_FORMAT,
+                       METHOD_TANS, TANS_BLOCK_SIZE_FORMAT, TANS_STREAM_SIZE_FORMAT, METHOD_LZ77,
+                       METHOD_BWT, METHOD_TOKENS, TOKEN_VOCABULARY_FORMAT,
+                       ALPHABET_TEXT, ALPHABET_BYTES, FLAG_SHARED_TABLE, INDEX_OFFSET_FORMAT, write_header, read_header,
+                       BlockEntry, HEADER_SIZE, is_container, write_block_index, read_block_index)
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infotheory.bitbuffer import pack_bits, unpack_bits  # noqa: E402
+from infotheory.canonical import canonical_codes, pack_code_lengths  # noqa: E402
+from infotheory.huffman_table import TableDecoder  # noqa: E402
+from infotheory.huffman_tree import length_limit_cost  # noqa: E402
+from infotheory.entropy_stats import shannon_entropy  # noqa: E402
+from infotheory.entropy_profile import (DEFAULT_WINDOW as DEFAULT_PROFILE_WINDOW,  # noqa: E402
+                                       PROFILE_FORMATS, profile_stream, write_profile)
+from infotheory.ngram_entropy import MAX_ORDER as MAX_NGRAM_ORDER, file_conditional_entropy  # noqa: E402
+from infotheory.tokens import DEFAULT_MAX_VOCABULARY, Vocabulary, count_tokens, tokenize  # noqa: E402
+
+DEFAULT_CHUNK_SIZE = 1 << 20  # размер части при потоковой обработке
+STDIO = '-'  # путь, означающий стандартный ввод или вывод
 
 def calculate_entropy(data):
     """Расчет энтропии для исходного текста."""
-    frequency = defaultdict(int)
-    for symbol in data:
-        frequency[symbol] += 1
-    total_symbols = len(data)
-    entropy = -sum((freq / total_symbols) * log2(freq / total_symbols)
-        for freq in frequency.values())
-    return entropy
+    return shannon_entropy(Counter(data))
+
+def calculate_frequency_entropy(frequency):
+    """Расчет энтропии по таблице частот символов."""
+    return shannon_entropy(frequency)
 
 def calculate_compression_ratio(original_size, encoded_size):
     """Расчет степени сжатия."""
     return original_size / encoded_size
 
-def encode_file(input_file, output_file):
-    """Кодирование файла."""
-    with open(input_file, 'r', encoding='utf-8') as file:  # Указана кодировка 'utf-8'
+def encode_file(input_file, output_file, max_code_length=None):
+    """Кодирование файла в двоичный контейнер.
+
+    Заголовок контейнера содержит длины канонических кодов, поэтому
+    служебные файлы settings.ini и huffman_codes.json не нужны.
+    max_code_length ограничивает длину кода (None - без ограничения).
+
+    Returns:
+        tuple: (размер исходного файла, размер контейнера в байтах,
+            энтропия, среднее число бит на символ).
+    """
+    with open(input_file, 'r', encoding='utf-8', newline='') as file:
         data = file.read()
+    huffman = Huffman(max_code_length)
+    payload, bit_count = huffman.encode_packed(data)
+
+    header = Header(METHOD_HUFFMAN, ALPHABET_TEXT, 0, -bit_count % 8, len(data))
+    code_lengths = {ord(symbol): length for symbol, length in huffman.code_lengths.items()}
+    with open(output_file, 'wb') as file:
+        encoded_size = write_header(file, header, code_lengths)
+        file.write(payload)
+    encoded_size += len(payload)
+
+    bits_per_symbol = bit_count / len(data) if data else 0.0
+
+    return os.path.getsize(input_file), encoded_size, calculate_entropy(data), bits_per_symbol
+
+def encode_file_dictionary(input_file, output_file, dictionary,
+                           dictionary_dir=DEFAULT_DICTIONARY_DIR):
+    """Кодирование файла общим словарём, обученным командой train.
+
+    Вместо таблицы кодов в контейнер записывается идентификатор словаря,
+    поэтому короткие сообщения не несут накладных расходов на таблицу.
+    Символы, которых не было в корпусе, передаются escape-кодом.
+
+    Args:
+        dictionary (str): Имя словаря, 'имя:версия' или его идентификатор.
+
+    Returns:
+        tuple: (размер исходного файла, размер контейнера в байтах,
+            энтропия, среднее число бит на символ).
+    """
+    dictionary_id = resolve_dictionary(dictionary, dictionary_dir)
+    codebook = load_dictionary(dictionary_id, dictionary_dir)
+    with open(input_file, 'r', encoding='utf-8', newline='') as file:
+        data = file.read()
+    bits = codebook.encode(map(ord, data))
+
+    header = Header(METHOD_DICTIONARY, ALPHABET_TEXT, 0, -len(bits) % 8, len(data))
+    with open(output_file, 'wb') as file:
+        encoded_size = write_header(file, header, {})
+        file.write(struct.pack(DICTIONARY_ID_FORMAT, dictionary_id))
+        payload = pack_bits(bits)
+        file.write(payload)
+    encoded_size += struct.calcsize(DICTIONARY_ID_FORMAT) + len(payload)
+
+    entropy = calculate_entropy(data) if data else 0.0
+    bits_per_symbol = len(bits) / len(data) if data else 0.0
+
+    return os.path.getsize(input_file), encoded_size, entropy, bits_per_symbol
+
+def decode_file_dictionary(input_file, output_file, dictionary_dir=DEFAULT_DICTIONARY_DIR):
+    """Декодирование контейнера, закодированного общим словарём.
+
+    Returns:
+        tuple: (размер закодированного файла, число декодированных символов).
+    """
+    with open(input_file, 'rb') as file:
+        header, _ = read_header(file)
+        if header.method != METHOD_DICTIONARY:
+            raise ValueError("Файл не закодирован общим словарём")
+        raw = file.read(struct.calcsize(DICTIONARY_ID_FORMAT))
+        if len(raw) < struct.calcsize(DICTIONARY_ID_FORMAT):
+            raise ValueError("Отсутствует идентификатор словаря")
+        (dictionary_id,) = struct.unpack(DICTIONARY_ID_FORMAT, raw)
+        payload = file.read()
+
+    codebook = load_dictionary(dictionary_id, dictionary_dir)
+    bits = unpack_bits(payload, 8 * len(payload) - header.padding)
+    decoded_data = ''.join(map(chr, codebook.decode(bits, header.symbol_count)))
+    if len(decoded_data) != header.symbol_count:
+        raise ValueError("Поток данных обрезан")
+
+    with open(output_file, 'w', encoding='utf-8', newline='') as file:
+        file.write(decoded_data)
+
+    return os.path.getsize(input_file), len(decoded_data)
+
+def decode_file(input_file, output_file, decoder=DEFAULT_DECODER,
+                dictionary_dir=DEFAULT_DICTIONARY_DIR):
+    """Декодирование файла.
+
+    Файлы в формате контейнера декодируются без служебных файлов;
+    старый текстовый формат из символов '0'/'1' по-прежнему читается
+    с помощью settings.ini и huffman_codes.json.
+
+    Args:
+        input_file (str): Путь к закодированному файлу.
+        output_file (str): Путь для сохранения результата.
+        decoder (str): Способ декодирования ('table' или 'bitwise').
+        dictionary_dir (str): Каталог общих словарей для METHOD_DICTIONARY.
+
+    Returns:
+        tuple: (размер закодированного файла, число декодированных символов).
+    """
+    if not is_container(input_file):
+        return decode_text_file(input_file, output_file, decoder)
+
     huffman = Huffman()
-    encoded_data = huffman.encode(data)
+    with open(input_file, 'rb') as file:
+        header, code_lengths = read_header(file)
+        text_payload = header.method == METHOD_HUFFMAN and header.alphabet == ALPHABET_TEXT
+        payload = file.read() if text_payload else b''
+    if header.method == METHOD_HUFFMAN_BLOCKS:
+        return decode_file_blocks(input_file, output_file)
+    if header.method == METHOD_ADAPTIVE:
+        return decode_file_adaptive(input_file, output_file)
+    if header.method == METHOD_DICTIONARY:
+        return decode_file_dictionary(input_file, output_file, dictionary_dir)
+    if header.method == METHOD_RANGE:
+        return decode_file_range(input_file, output_file)
+    if header.method == METHOD_TANS:
+        return decode_file_tans(input_file, output_file)
+    if header.method == METHOD_LZ77:
+        return decode_file_lz77(input_file, output_file)
+    if header.method == METHOD_BWT:
+        return decode_file_bwt(input_file, output_file)
+    if header.method == METHOD_TOKENS:
+        return decode_file_tokens(input_file, output_file)
+    if header.alphabet == ALPHABET_BYTES:
+        return decode_file_bytes(input_file, output_file)
+    if header.method != METHOD_HUFFMAN or header.alphabet != ALPHABET_TEXT:
+        raise ValueError("Неподдерживаемый метод сжатия в заголовке контейнера")
 
-    with open(output_file, 'w', encoding='utf-8') as file:  
-        file.write(encoded_data)
-    
-    bits_per_symbol = len(encoded_data) / len(data)
+    huffman.load_code_lengths({chr(symbol): length for symbol, length in code_lengths.items()})
+    bit_count = 8 * len(payload) - header.padding
+    decoded_data = huffman.decode_packed(payload, bit_count, header.symbol_count, decoder)
+
+    with open(output_file, 'w', encoding='utf-8', newline='') as file:
+        file.write(decoded_data)
+
+    return os.path.getsize(input_file), len(decoded_data)
+
+def read_chunks(file, chunk_size):
+    """Генератор частей файла фиксированного размера."""
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+def encode_file_stream(input_file, output_file, chunk_size=DEFAULT_CHUNK_SIZE,
+                       max_code_length=None):
+    """Потоковое кодирование файла в контейнер за два прохода.
+
+    Первый проход считает частоты символов, второй кодирует файл
+    частями по chunk_size символов. В памяти одновременно находится
+    только одна часть, поэтому размер файла не ограничен объёмом памяти.
+
+    Returns:
+        tuple: (размер исходного файла, размер контейнера в байтах,
+            энтропия, среднее число бит на символ).
+    """
+    frequency = Counter()
+    with open(input_file, 'r', encoding='utf-8', newline='') as file:
+        for chunk in read_chunks(file, chunk_size):
+            frequency.update(chunk)
+    symbol_count = sum(frequency.values())
+
+    huffman = Huffman(max_code_length)
+    codes = huffman.build_codes_from_frequency(frequency)
+    bit_count = sum(len(codes[symbol]) * freq for symbol, freq in frequency.items())
+
+    header = Header(METHOD_HUFFMAN, ALPHABET_TEXT, 0, -bit_count % 8, symbol_count)
+    code_lengths = {ord(symbol): length for symbol, length in huffman.code_lengths.items()}
+    with open(input_file, 'r', encoding='utf-8', newline='') as source, \
+            open(output_file, 'wb') as target:
+        write_header(target, header, code_lengths)
+        huffman.encode_stream(read_chunks(source, chunk_size), target)
+
+    bits_per_symbol = bit_count / symbol_count if symbol_count else 0.0
+
+    return (os.path.getsize(input_file), os.path.getsize(output_file),
+            calculate_frequency_entropy(frequency), bits_per_symbol)
+
+def decode_file_stream(input_file, output_file, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Потоковое табличное декодирование контейнера частями по chunk_size байт.
+
+    Returns:
+        tuple: (размер закодированного файла, число декодированных символов).
+    """
+    with open(input_file, 'rb') as file:
+        header, _ = read_header(file)
+    if header.method == METHOD_HUFFMAN and header.alphabet == ALPHABET_BYTES:
+        return decode_file_bytes(input_file, output_file, chunk_size)
+
+    decoded_size = 0
+    with open(input_file, 'rb') as source, \
+            open(output_file, 'w', encoding='utf-8', newline='') as target:
+        header, code_lengths = read_header(source)
+        if header.method != METHOD_HUFFMAN or header.alphabet != ALPHABET_TEXT:
+            raise ValueError("Неподдерживаемый метод сжатия в заголовке контейнера")
+        bit_count = 8 * (os.path.getsize(input_file) - source.tell()) - header.padding
+
+        huffman = Huffman()
+        huffman.load_code_lengths({chr(symbol): length for symbol, length in code_lengths.items()})
+        for decoded in huffman.decode_stream(read_chunks(source, chunk_size),
+                                             bit_count, header.symbol_count):
+            target.write(decoded)
+            decoded_size += len(decoded)
+
+    return os.path.getsize(input_file), decoded_size
+
+def encode_file_bytes(input_file, output_file, chunk_size=DEFAULT_CHUNK_SIZE,
+                      max_code_length=None):
+    """Кодирование произвольного двоичного файла по алфавиту из 256 байтов.
+
+    Файл читается в режиме 'rb' без декодирования Unicode: первый проход
+    считает частоты байтов в массиве, второй кодирует части по таблице
+    кодов, индексом которой служит значение байта.
+
+    Returns:
+        tuple: (размер исходного файла, размер контейнера в байтах,
+            энтропия, среднее число бит на байт).
+    """
+    counts = None
+    with open(input_file, 'rb') as file:
+        for chunk in read_chunks(file, chunk_size):
+            counts = count_bytes(chunk, counts)
+    frequency = {byte: count for byte, count in enumerate(counts or []) if count}
+    byte_count = sum(frequency.values())
+
+    huffman = Huffman(max_code_length)
+    huffman.build_codes_from_frequency(frequency)
+    bit_count = sum(huffman.code_lengths[byte] * count for byte, count in frequency.items())
+
+    header = Header(METHOD_HUFFMAN, ALPHABET_BYTES, 0, -bit_count % 8, byte_count)
+    with open(input_file, 'rb') as source, open(output_file, 'wb') as target:
+        write_header(target, header, huffman.code_lengths)
+        huffman.encode_byte_stream(read_chunks(source, chunk_size), target)
+
+    entropy = calculate_frequency_entropy(frequency) if byte_count else 0.0
+    bits_per_symbol = bit_count / byte_count if byte_count else 0.0
+
+    return os.path.getsize(input_file), os.path.getsize(output_file), entropy, bits_per_symbol
+
+def decode_file_bytes(input_file, output_file, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Потоковое декодирование контейнера с алфавитом байтов.
+
+    Returns:
+        tuple: (размер закодированного файла, число декодированных байт).
+    """
+    decoded_size = 0
+    with open(input_file, 'rb') as source, open(output_file, 'wb') as target:
+        header, code_lengths = read_header(source)
+        if header.method != METHOD_HUFFMAN or header.alphabet != ALPHABET_BYTES:
+            raise ValueError("Файл не является контейнером с алфавитом байтов")
+        bit_count = 8 * (os.path.getsize(input_file) - source.tell()) - header.padding
+
+        huffman = Huffman()
+        huffman.load_code_lengths(code_lengths)
+        for decoded in huffman.decode_byte_stream(read_chunks(source, chunk_size),
+                                                  bit_count, header.symbol_count):
+            target.write(decoded)
+            decoded_size += len(decoded)
+
+    return os.path.getsize(input_file), decoded_size
+
+def encode_file_range(input_file, output_file, order=DEFAULT_ORDER, binary=False,
+                      chunk_size=DEFAULT_CHUNK_SIZE):
+    """Интервальное кодирование файла с адаптивной контекстной моделью порядка order.
+
+    Текст кодируется по номерам знаков в его алфавите, который записывается
+    в таблицу контейнера (первый проход собирает алфавит); при binary
+    кодируются байты файла. Оба прохода читают файл частями.
+
+    Returns:
+        tuple: (размер исходного файла, размер контейнера в байтах,
+            энтропия, среднее число бит на символ).
+    """
+    frequency = Counter()
+    if binary:
+        mode, encoding, alphabet = 'rb', None, list(range(256))
+        with open(input_file, 'rb') as file:
+            for chunk in read_chunks(file, chunk_size):
+                frequency.update(chunk)
+        table = {}
+    else:
+        mode, encoding = 'r', 'utf-8'
+        with open(input_file, 'r', encoding='utf-8', newline='') as file:
+            for chunk in read_chunks(file, chunk_size):
+                frequency.update(chunk)
+        alphabet = sorted(frequency)
+    symbol_bits = symbol_bits_for(len(alphabet))
+    if not binary:
+        table = {ord(symbol): symbol_bits for symbol in alphabet}
+    index = {symbol: number for number, symbol in enumerate(alphabet)}
+    symbol_count = sum(frequency.values())
+
+    encoder = RangeEncoder(ContextModel(order, symbol_bits))
+    header = Header(METHOD_RANGE, ALPHABET_BYTES if binary else ALPHABET_TEXT, 0, 0, symbol_count)
+    with open(input_file, mode, encoding=encoding, newline=None if binary else '') as source, \
+            open(output_file, 'wb') as target:
+        write_header(target, header, table)
+        target.write(struct.pack(RANGE_ORDER_FORMAT, order))
+        payload_size = 0
+        for chunk in read_chunks(source, chunk_size):
+            payload = encoder.encode(chunk if binary else map(index.__getitem__, chunk))
+            target.write(payload)
+            payload_size += len(payload)
+        payload = encoder.finish()
+        target.write(payload)
+        payload_size += len(payload)
+
+    entropy = calculate_frequency_entropy(frequency) if symbol_count else 0.0
+    bits_per_symbol = 8 * payload_size / symbol_count if symbol_count else 0.0
+
+    return os.path.getsize(input_file), os.path.getsize(output_file), entropy, bits_per_symbol
+
+def decode_file_range(input_file, output_file, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Потоковое декодирование контейнера интервального кодера.
+
+    Returns:
+        tuple: (размер закодированного файла, число декодированных символов).
+    """
+    decoded_size = 0
+    with open(input_file, 'rb') as source:
+        header, table = read_header(source)
+        if header.method != METHOD_RANGE:
+            raise ValueError("Файл не закодирован интервальным кодером")
+        raw = source.read(struct.calcsize(RANGE_ORDER_FORMAT))
+        if len(raw) < struct.calcsize(RANGE_ORDER_FORMAT):
+            raise ValueError("Отсутствует порядок контекстной модели")
+        (order,) = struct.unpack(RANGE_ORDER_FORMAT, raw)
+        binary = header.alphabet == ALPHABET_BYTES
+        alphabet = None if binary else [chr(symbol) for symbol in sorted(table)]
+        symbol_bits = 8 if binary else symbol_bits_for(len(alphabet))
+
+        decoder = RangeDecoder(ContextModel(order, symbol_bits), read_chunks(source, chunk_size))
+        with open(output_file, 'wb' if binary else 'w', encoding=None if binary else 'utf-8',
+                  newline=None if binary else '') as target:
+            remaining = header.symbol_count
+            while remaining:
+                symbols = decoder.decode(min(remaining, chunk_size))
+                target.write(bytes(symbols) if binary else ''.join(map(alphabet.__getitem__, symbols)))
+                remaining -= len(symbols)
+                decoded_size += len(symbols)
+
+    return os.path.getsize(input_file), decoded_size
+
+def encode_file_tans(input_file, output_file, table_log=DEFAULT_TABLE_LOG, binary=False,
+                     chunk_size=DEFAULT_CHUNK_SIZE):
+    """Кодирование файла tANS по таблице частот, как у статического кода Хаффмана.
+
+    Первый проход считает частоты символов (байтов при binary), второй
+    кодирует файл блоками по chunk_size символов с общей таблицей.
+
+    Returns:
+        tuple: (размер исходного файла, размер контейнера в байтах,
+            энтропия, среднее число бит на символ).
+    """
+    mode, encoding, newline = ('rb', None, None) if binary else ('r', 'utf-8', '')
+    frequency = Counter()
+    with open(input_file, mode, encoding=encoding, newline=newline) as file:
+        for chunk in read_chunks(file, chunk_size):
+            frequency.update(chunk)
+    symbol_count = sum(frequency.values())
+
+    codec = TansCodec.from_frequency(frequency, table_log)
+    table = codec.normalized if binary else {ord(symbol): count
+                                             for symbol, count in codec.normalized.items()}
+    header = Header(METHOD_TANS, ALPHABET_BYTES if binary else ALPHABET_TEXT, 0, 0, symbol_count)
+    with open(input_file, mode, encoding=encoding, newline=newline) as source, \
+            open(output_file, 'wb') as target:
+        write_header(target, header, table)
+        target.write(struct.pack(TANS_BLOCK_SIZE_FORMAT, chunk_size))
+        payload_size = 0
+        for chunk in read_chunks(source, chunk_size):
+            payload = codec.encode(chunk)
+            target.write(struct.pack(TANS_STREAM_SIZE_FORMAT, len(payload)))
+            target.write(payload)
+            payload_size += len(payload)
+
+    entropy = calculate_frequency_entropy(frequency) if symbol_count else 0.0
+    bits_per_symbol = 8 * payload_size / symbol_count if symbol_count else 0.0
+
+    return os.path.getsize(input_file), os.path.getsize(output_file), entropy, bits_per_symbol
+
+def decode_file_tans(input_file, output_file):
+    """Потоковое декодирование контейнера tANS по блокам.
+
+    Returns:
+        tuple: (размер закодированного файла, число декодированных символов).
+    """
+    block_size_length = struct.calcsize(TANS_BLOCK_SIZE_FORMAT)
+    stream_size_length = struct.calcsize(TANS_STREAM_SIZE_FORMAT)
+    decoded_size = 0
+    with open(input_file, 'rb') as source:
+        header, table = read_header(source)
+        if header.method != METHOD_TANS:
+            raise ValueError("Файл не закодирован tANS")
+        binary = header.alphabet == ALPHABET_BYTES
+        codec = TansCodec(table if binary else {chr(symbol): count
+                                                for symbol, count in table.items()})
+        raw = source.read(block_size_length)
+        if len(raw) < block_size_length:
+            raise ValueError("Отсутствует размер блока tANS")
+        (block_size,) = struct.unpack(TANS_BLOCK_SIZE_FORMAT, raw)
+
+        with open(output_file, 'wb' if binary else 'w', encoding=None if binary else 'utf-8',
+                  newline=None if binary else '') as target:
+            remaining = header.symbol_count
+            while remaining:
+                raw = source.read(stream_size_length)
+                if len(raw) < stream_size_length:
+                    raise ValueError("Поток данных обрезан")
+                (stream_size,) = struct.unpack(TANS_STREAM_SIZE_FORMAT, raw)
+                count = min(block_size, remaining)
+                symbols = codec.decode(source.read(stream_size), count)
+                target.write(bytes(symbols) if binary else ''.join(symbols))
+                remaining -= count
+                decoded_size += count
+
+    return os.path.getsize(input_file), decoded_size
+
+def encode_file_lz77(input_file, output_file, window=lz77.DEFAULT_WINDOW,
+                     max_chain=lz77.DEFAULT_MAX_CHAIN, max_code_length=None,
+                     chunk_size=DEFAULT_CHUNK_SIZE):
+    """Сжатие файла LZ77 с кодированием потоков кодами Хаффмана (как в DEFLATE).
+
+    Файл обрабатывается как байты независимыми блоками по chunk_size байт,
+    поэтому повторы ищутся только внутри блока.
+
+    Returns:
+        tuple: (размер исходного файла, размер контейнера в байтах,
+            энтропия байтов, среднее число бит на байт).
+    """
+    byte_count = os.path.getsize(input_file)
+    counts = None
+    header = Header(METHOD_LZ77, ALPHABET_BYTES, 0, 0, byte_count)
+    with open(input_file, 'rb') as source, open(output_file, 'wb') as target:
+        write_header(target, header, {})
+        for chunk in read_chunks(source, chunk_size):
+            counts = count_bytes(chunk, counts)
+            block, _, _ = lz77.encode_block(chunk, window, max_chain, max_code_length)
+            target.write(block)
+
+    encoded_size = os.path.getsize(output_file)
+    frequency = {byte: count for byte, count in enumerate(counts or []) if count}
+    entropy = calculate_frequency_entropy(frequency) if byte_count else 0.0
+    bits_per_symbol = 8 * (encoded_size - HEADER_SIZE) / byte_count if byte_count else 0.0
+
+    return byte_count, encoded_size, entropy, bits_per_symbol
+
+def decode_file_lz77(input_file, output_file):
+    """Потоковое декодирование контейнера LZ77 по блокам.
+
+    Returns:
+        tuple: (размер закодированного файла, число декодированных байт).
+    """
+    decoded_size = 0
+    with open(input_file, 'rb') as source, open(output_file, 'wb') as target:
+        header, _ = read_header(source)
+        if header.method != METHOD_LZ77:
+            raise ValueError("Файл не сжат LZ77")
+        while decoded_size < header.symbol_count:
+            block = lz77.decode_block(source)
+            target.write(block)
+            decoded_size += len(block)
+    if decoded_size != header.symbol_count:
+        raise ValueError("Размер данных не совпадает с заголовком")
+
+    return os.path.getsize(input_file), decoded_size
+
+def encode_file_bwt(input_file, output_file, block_size=bwt.DEFAULT_BLOCK_SIZE,
+                    max_code_length=None):
+    """Сжатие файла блоками BWT + MTF + RLE с кодом Хаффмана (как в bzip2).
+
+    Returns:
+        tuple: (размер исходного файла, размер контейнера в байтах,
+            энтропия байтов, среднее число бит на байт).
+    """
+    byte_count = os.path.getsize(input_file)
+    counts = None
+    header = Header(METHOD_BWT, ALPHABET_BYTES, 0, 0, byte_count)
+    with open(input_file, 'rb') as source, open(output_file, 'wb') as target:
+        write_header(target, header, {})
+        for chunk in read_chunks(source, block_size):
+            counts = count_bytes(chunk, counts)
+            target.write(bwt.encode_block(chunk, max_code_length))
+
+    encoded_size = os.path.getsize(output_file)
+    frequency = {byte: count for byte, count in enumerate(counts or []) if count}
+    entropy = calculate_frequency_entropy(frequency) if byte_count else 0.0
+    bits_per_symbol = 8 * (encoded_size - HEADER_SIZE) / byte_count if byte_count else 0.0
+
+    return byte_count, encoded_size, entropy, bits_per_symbol
+
+def decode_file_bwt(input_file, output_file):
+    """Потоковое декодирование контейнера BWT по блокам.
+
+    Returns:
+        tuple: (размер закодированного файла, число декодированных байт).
+    """
+    decoded_size = 0
+    with open(input_file, 'rb') as source, open(output_file, 'wb') as target:
+        header, _ = read_header(source)
+        if header.method != METHOD_BWT:
+            raise ValueError("Файл не сжат BWT")
+        while decoded_size < header.symbol_count:
+            block = bwt.decode_block(source)
+            target.write(block)
+            decoded_size += len(block)
+    if decoded_size != header.symbol_count:
+        raise ValueError("Размер данных не совпадает с заголовком")
+
+    return os.path.getsize(input_file), decoded_size
+
+def encode_file_tokens(input_file, output_file, max_vocabulary=DEFAULT_MAX_VOCABULARY,
+                       max_code_length=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Кодирование текста кодом Хаффмана над словами (токенами) вместо символов.
+
+    Первый проход считает частоты символов и токенов и выбирает словарь,
+    второй - частоты номеров токенов, третий кодирует файл частями.
+
+    Args:
+        max_vocabulary (int): Максимальное число многосимвольных токенов в словаре.
+
+    Returns:
+        tuple: (размер исходного файла, размер контейнера в байтах,
+            энтропия символов, среднее число бит на символ).
+    """
+    def read_tokens():
+        with open(input_file, 'r', encoding='utf-8', newline='') as file:
+            yield from tokenize(read_chunks(file, chunk_size))
+
+    with open(input_file, 'r', encoding='utf-8', newline='') as file:
+        characters, frequency = count_tokens(read_chunks(file, chunk_size), max_vocabulary)
+    vocabulary = Vocabulary.build(characters, frequency, max_vocabulary)
+
+    id_frequency = Counter()
+    for tokens in read_tokens():
+        id_frequency.update(vocabulary.encode(tokens))
+    id_count = sum(id_frequency.values())
+    # Символы, которые встречаются только внутри токенов словаря, кодов не получают
+    huffman = Huffman(max_code_length)
+    codes = huffman.build_codes_from_frequency(id_frequency)
+    bit_count = sum(len(codes[number]) * count for number, count in id_frequency.items())
+
+    header = Header(METHOD_TOKENS, ALPHABET_TEXT, 0, -bit_count % 8, id_count)
+    packed_vocabulary = vocabulary.pack()
+    with open(output_file, 'wb') as target:
+        write_header(target, header, huffman.code_lengths)
+        target.write(struct.pack(TOKEN_VOCABULARY_FORMAT, len(packed_vocabulary)))
+        target.write(packed_vocabulary)
+        huffman.encode_stream(map(vocabulary.encode, read_tokens()), target)
+
+    symbol_count = sum(characters.values())
+    entropy = calculate_frequency_entropy(characters) if symbol_count else 0.0
+    bits_per_symbol = bit_count / symbol_count if symbol_count else 0.0
+
+    return os.path.getsize(input_file), os.path.getsize(output_file), entropy, bits_per_symbol
+
+def decode_file_tokens(input_file, output_file, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Потоковое декодирование контейнера с кодом над токенами.
+
+    Returns:
+        tuple: (размер закодированного файла, число декодированных символов).
+    """
+    vocabulary_size_length = struct.calcsize(TOKEN_VOCABULARY_FORMAT)
+    decoded_size = 0
+    with open(input_file, 'rb') as source, \
+            open(output_file, 'w', encoding='utf-8', newline='') as target:
+        header, code_lengths = read_header(source)
+        if header.method != METHOD_TOKENS:
+            raise ValueError("Файл не закодирован по токенам")
+        raw = source.read(vocabulary_size_length)
+        if len(raw) < vocabulary_size_length:
+            raise ValueError("Отсутствует размер словаря токенов")
+        (vocabulary_size,) = struct.unpack(TOKEN_VOCABULARY_FORMAT, raw)
+        raw = source.read(vocabulary_size)
+        if len(raw) < vocabulary_size:
+            raise ValueError("Словарь токенов обрезан")
+        vocabulary = Vocabulary.unpack(raw)
+        if any(number >= len(vocabulary) for number in code_lengths):
+            raise ValueError("Таблица кодов не соответствует словарю токенов")
+        bit_count = 8 * (os.path.getsize(input_file) - source.tell()) - header.padding
+
+        decoded_count = 0
+        decoder = TableDecoder(canonical_codes(code_lengths))
+        for numbers in decoder.decode_stream(read_chunks(source, chunk_size), bit_count,
+                                             header.symbol_count):
+            text = vocabulary.decode(numbers)
+            target.write(text)
+            decoded_count += len(numbers)
+            decoded_size += len(text)
+    if decoded_count != header.symbol_count:
+        raise ValueError("Поток данных обрезан")
+
+    return os.path.getsize(input_file), decoded_size
+
+def open_binary(path, mode):
+    """Открытие файла в двоичном режиме; путь '-' означает stdin или stdout."""
+    if path == STDIO:
+        return nullcontext(sys.stdin.buffer if 'r' in mode else sys.stdout.buffer)
+    return open(path, mode)
+
+def profile_entropy(input_file, output_file, window=DEFAULT_PROFILE_WINDOW, step=None,
+                    output_format='csv'):
+    """Профиль энтропии файла по блокам или скользящему окну.
+
+    Файл читается потоком, строки профиля записываются по мере вычисления,
+    поэтому размер файла не ограничен памятью.
+
+    Args:
+        input_file (str): Путь к файлу ('-' - стандартный ввод).
+        output_file (str): Путь к CSV или JSON ('-' - стандартный вывод).
+        window (int): Размер окна в байтах.
+        step (int): Сдвиг окна; None - непересекающиеся блоки.
+        output_format (str): 'csv' или 'json'.
+
+    Returns:
+        int: Число строк профиля.
+    """
+    if output_file == STDIO:
+        output = nullcontext(sys.stdout)
+    else:
+        output = open(output_file, 'w', encoding='utf-8', newline='')
+    with open_binary(input_file, 'rb') as file, output as out:
+        return write_profile(profile_stream(file, window, step), out, output_format)
+
+def encode_file_adaptive(input_file, output_file, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Однопроходное адаптивное кодирование байтов файла или потока.
+
+    Таблица кодов не строится заранее: каждая прочитанная часть сразу
+    кодируется и записывается, поэтому вывод начинается до конца входа,
+    а память не зависит от его длины. Вместо путей можно указать '-'
+    для чтения из stdin и записи в stdout.
+
+    Returns:
+        tuple: (размер входных данных, размер контейнера в байтах,
+            энтропия, среднее число бит на байт).
+    """
+    frequency = Counter()
+    encoder = AdaptiveHuffmanEncoder()
+    original_size = 0
+    payload_size = 0
+    with open_binary(input_file, 'rb') as source, open_binary(output_file, 'wb') as target:
+        header_size = write_header(target, Header(METHOD_ADAPTIVE, ALPHABET_BYTES, 0, 0, 0), {})
+        while True:
+            chunk = source.read1(chunk_size)
+            if not chunk:
+                break
+            frequency.update(chunk)
+            original_size += len(chunk)
+            payload = encoder.encode_chunk(chunk)
+            target.write(payload)
+            target.flush()
+            payload_size += len(payload)
+        payload = encoder.finish()
+        target.write(payload)
+        payload_size += len(payload)
+
+    entropy = calculate_frequency_entropy(frequency) if original_size else 0.0
+    bits_per_symbol = 8 * payload_size / original_size if original_size else 0.0
+
+    return original_size, header_size + payload_size, entropy, bits_per_symbol
+
+def decode_file_adaptive(input_file, output_file, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Потоковое декодирование адаптивного контейнера; '-' означает stdin/stdout.
+
+    Returns:
+        tuple: (размер закодированных данных, число декодированных байт).
+    """
+    decoder = AdaptiveHuffmanDecoder()
+    decoded_size = 0
+    with open_binary(input_file, 'rb') as source, open_binary(output_file, 'wb') as target:
+        header, code_lengths = read_header(source)
+        if header.method != METHOD_ADAPTIVE:
+            raise ValueError("Файл не является адаптивным контейнером")
+        encoded_size = HEADER_SIZE + len(pack_code_lengths(code_lengths))
+        while not decoder.finished:
+            chunk = source.read1(chunk_size)
+            if not chunk:
+                break
+            encoded_size += len(chunk)
+            decoded = decoder.decode_chunk(chunk)
+            target.write(decoded)
+            target.flush()
+            decoded_size += len(decoded)
+    if not decoder.finished:
+        raise ValueError("Поток обрезан: нет символа конца потока")
+
+    return encoded_size, decoded_size
+
+def encode_file_blocks(input_file, output_file, block_size=DEFAULT_BLOCK_SIZE,
+                       workers=None, shared_table=False, max_code_length=None):
+    """Параллельное кодирование файла независимыми блоками.
+
+    Файл делится на блоки по block_size символов, которые кодируются в
+    пуле процессов. Каждый блок получает собственную таблицу кодов либо,
+    при shared_table, все блоки используют общую таблицу из заголовка
+    (для неё нужен дополнительный проход подсчёта частот). Индекс блоков
+    в конце контейнера позволяет декодировать блоки параллельно и по
+    отдельности.
+
+    Returns:
+        tuple: (размер исходного файла, размер контейнера в байтах,
+            энтропия, среднее число бит на символ).
+    """
+    workers = workers or os.cpu_count() or 1
+    code_lengths = None
+    header_lengths = {}
+    flags = 0
+    if shared_table:
+        frequency = Counter()
+        with open(input_file, 'r', encoding='utf-8', newline='') as file:
+            for chunk in read_chunks(file, block_size):
+                frequency.update(chunk)
+        huffman = Huffman(max_code_length)
+        huffman.build_codes_from_frequency(frequency)
+        code_lengths = huffman.code_lengths
+        header_lengths = {ord(symbol): length for symbol, length in code_lengths.items()}
+        flags = FLAG_SHARED_TABLE
+
+    frequency = Counter()
+    entries = []
+    bit_count = 0
+    with open(input_file, 'r', encoding='utf-8', newline='') as source, \
+            open(output_file, 'wb') as target, \
+            ProcessPoolExecutor(max_workers=workers) as pool:
+        header = Header(METHOD_HUFFMAN_BLOCKS, ALPHABET_TEXT, flags, 0, 0)
+        write_header(target, header, header_lengths)
+        index_position = target.tell()
+        target.write(struct.pack(INDEX_OFFSET_FORMAT, 0))
+
+        arguments = ((chunk, code_lengths, max_code_length)
+                     for chunk in read_chunks(source, block_size))
+        for table, payload, padding, block_frequency in ordered_map(pool, encode_block,
+                                                                    arguments, 2 * workers):
+            symbol_count = sum(block_frequency.values())
+            entries.append(BlockEntry(target.tell(), len(table), len(payload),
+                                      symbol_count, padding))
+            target.write(table)
+            target.write(payload)
+            frequency.update(block_frequency)
+            bit_count += 8 * len(payload) - padding
+
+        index_offset = write_block_index(target, entries)
+        target.seek(index_position)
+        target.write(struct.pack(INDEX_OFFSET_FORMAT, index_offset))
+        target.seek(0)
+        write_header(target, header._replace(symbol_count=sum(frequency.values())),
+                     header_lengths)
+
+    symbol_count = sum(frequency.values())
+    entropy = calculate_frequency_entropy(frequency) if symbol_count else 0.0
+    bits_per_symbol = bit_count / symbol_count if symbol_count else 0.0
+
+    return os.path.getsize(input_file), os.path.getsize(output_file), entropy, bits_per_symbol
+
+def analyze_length_limit(input_file, max_code_length, chunk_size=DEFAULT_CHUNK_SIZE,
+                         binary=False):
+    """Оценка потери сжатия файла от ограничения длины кода.
+
+    При binary частоты считаются по байтам, как в encode_file_bytes.
+
+    Returns:
+        dict: Результат infotheory.huffman_tree.length_limit_cost.
+    """
+    frequency = Counter()
+    if binary:
+        with open(input_file, 'rb') as file:
+            for chunk in read_chunks(file, chunk_size):
+                frequency.update(chunk)
+    else:
+        with open(input_file, 'r', encoding='utf-8', newline='') as file:
+            for chunk in read_chunks(file, chunk_size):
+                frequency.update(chunk)
+    return length_limit_cost(frequency, max_code_length)
+
+def read_block_container(input_file):
+    """Чтение заголовка и индекса блочного контейнера.
+
+    Returns:
+        tuple: (Header, общая таблица длин кодов или None, список BlockEntry).
+    """
+    with open(input_file, 'rb') as file:
+        header, code_lengths = read_header(file)
+        if header.method != METHOD_HUFFMAN_BLOCKS or header.alphabet != ALPHABET_TEXT:
+            raise ValueError("Файл не является блочным контейнером")
+        entries = read_block_index(file)
+    shared_lengths = None
+    if header.flags & FLAG_SHARED_TABLE:
+        shared_lengths = {chr(symbol): length for symbol, length in code_lengths.items()}
+    return header, shared_lengths, entries
+
+def decode_file_blocks(input_file, output_file, workers=None):
+    """Параллельное декодирование блочного контейнера.
+
+    Returns:
+        tuple: (размер закодированного файла, число декодированных символов).
+    """
+    workers = workers or os.cpu_count() or 1
+    _, shared_lengths, entries = read_block_container(input_file)
+
+    decoded_size = 0
+    with open(output_file, 'w', encoding='utf-8', newline='') as target, \
+            ProcessPoolExecutor(max_workers=workers) as pool:
+        arguments = ((input_file, entry, shared_lengths) for entry in entries)
+        for text in ordered_map(pool, decode_block, arguments, 2 * workers):
+            target.write(text)
+            decoded_size += len(text)
+
+    return os.path.getsize(input_file), decoded_size
+
+def decode_single_block(input_file, block_number):
+    """Декодирование одного блока контейнера без чтения остальных.
+
+    Args:
+        input_file (str): Путь к блочному контейнеру.
+        block_number (int): Номер блока, начиная с 0.
 
-    return len(data), len(encoded_data), calculate_entropy(data), bits_per_symbol
+    Returns:
+        str: Текст блока.
+    """
+    _, shared_lengths, entries = read_block_container(input_file)
+    if not 0 <= block_number < len(entries):
+        raise ValueError(f"Номер блока вне диапазона 0..{len(entries) - 1}")
+    return decode_block(input_file, entries[block_number], shared_lengths)
 
-def decode_file(input_file, output_file):
-    """Декодирование файла."""
+def decode_text_file(input_file, output_file, decoder=DEFAULT_DECODER):
+    """Декодирование файла старого текстового формата из символов '0'/'1'."""
     with open(input_file, 'r', encoding='utf-8') as file:  
         encoded_data = file.read()
 
     huffman = Huffman()
-    decoded_data = huffman.decode(encoded_data)
+    decoded_data = huffman.decode(encoded_data, decoder)
 
     with open(output_file, 'w', encoding='utf-8') as file:  
         file.write(decoded_data)
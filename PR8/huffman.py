@@ -1,42 +1,160 @@
+import os
+import sys
 import json
-import heapq
-from collections import defaultdict
+from collections import Counter
 from configparser import ConfigParser, NoSectionError, NoOptionError
-from math import log2
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infotheory.bitbuffer import BitWriter, pack_bits, unpack_bits  # noqa: E402
+from infotheory.canonical import (canonical_codes, code_lengths_from_codes,  # noqa: E402
+                                  code_lengths_to_json, codes_from_json)
+from infotheory.huffman_table import TableDecoder  # noqa: E402
+from infotheory.entropy_stats import frequency_statistics, shannon_entropy  # noqa: E402
+from infotheory.huffman_tree import (count_frequencies, huffman_code_lengths,  # noqa: E402
+                                     limited_code_lengths)
+
+# Способы декодирования: табличный по упакованным байтам и исходный побитовый
+DECODERS = ('table', 'bitwise')
+DEFAULT_DECODER = 'table'
+
+BYTE_ALPHABET_SIZE = 256
+
+def count_bytes(data, counts=None):
+    """Подсчёт частот байтов в массиве из 256 счётчиков.
+
+    Байты считает Counter на уровне C, результат переносится в массив,
+    индексом которого служит значение байта.
+
+    Args:
+        data (bytes): Данные.
+        counts (list): Массив счётчиков для накопления по частям; None - новый.
+
+    Returns:
+        list: Массив из 256 счётчиков.
+    """
+    if counts is None:
+        counts = [0] * BYTE_ALPHABET_SIZE
+    for byte, count in Counter(data).items():
+        counts[byte] += count
+    return counts
 
 class Huffman:
     """Класс для работы с кодированием и декодированием данных методом Хаффмана."""
 
-    def __init__(self):
-        """Инициализация объекта класса."""
+    def __init__(self, max_code_length=None, cache=None):
+        """Инициализация объекта класса.
+
+        Args:
+            max_code_length (int): Максимальная длина кода; None - без ограничения.
+            cache (CodebookCache): Кэш кодов по гистограмме частот; None - коды
+                строятся при каждом вызове.
+        """
         self.huffman_codes = {}
+        self.code_lengths = {}
+        self.max_code_length = max_code_length
+        self.cache = cache
 
-    def encode(self, data):
-        """Кодирование данных методом Хаффмана.
+    def build_codes(self, data):
+        """Построение канонических кодов Хаффмана по частотам символов данных.
 
         Args:
             data (str): Данные для кодирования.
 
         Returns:
-            str: Закодированные данные.
+            dict: Словарь символ -> код.
         """
-        frequency = defaultdict(int)
-        for symbol in data:
-            frequency[symbol] += 1
+        return self.build_codes_from_frequency(count_frequencies(data))
 
-        priority_queue = [[weight, [symbol, ""]] for symbol, weight in frequency.items()]
-        heapq.heapify(priority_queue)
+    def build_codes_from_frequency(self, frequency):
+        """Построение канонических кодов Хаффмана по готовой таблице частот.
 
-        while len(priority_queue) > 1:
-            lo = heapq.heappop(priority_queue)
-            hi = heapq.heappop(priority_queue)
-            for pair in lo[1:]:
-                pair[1] = '0' + pair[1]
-            for pair in hi[1:]:
-                pair[1] = '1' + pair[1]
-            heapq.heappush(priority_queue, [lo[0] + hi[0]] + lo[1:] + hi[1:])
+        Args:
+            frequency (dict): Словарь символ -> число вхождений.
 
-        self.huffman_codes = dict(priority_queue[0][1:])
+        Returns:
+            dict: Словарь символ -> код.
+        """
+        if self.cache is not None:
+            self.code_lengths, self.huffman_codes = self.cache.get(frequency, self.max_code_length)
+            return self.huffman_codes
+        if self.max_code_length is not None:
+            return self.load_code_lengths(limited_code_lengths(frequency, self.max_code_length))
+        return self.load_code_lengths(huffman_code_lengths(frequency))
+
+    def load_code_lengths(self, code_lengths):
+        """Восстановление канонических кодов по длинам кодов.
+
+        Args:
+            code_lengths (dict): Словарь символ -> длина кода.
+
+        Returns:
+            dict: Словарь символ -> код.
+        """
+        self.code_lengths = code_lengths
+        self.huffman_codes = canonical_codes(code_lengths)
+        return self.huffman_codes
+
+    def encode_packed(self, data):
+        """Кодирование данных в упакованный битовый поток без служебных файлов.
+
+        Args:
+            data (str): Данные для кодирования.
+
+        Returns:
+            tuple: (упакованные байты, число значащих бит).
+        """
+        codes = self.build_codes(data)
+        bits = ''.join(map(codes.__getitem__, data))
+        return pack_bits(bits), len(bits)
+
+    def build_byte_codes(self, counts):
+        """Построение кодов для байтов по массиву частот.
+
+        Args:
+            counts (list): Массив из 256 счётчиков (см. count_bytes).
+
+        Returns:
+            list: Таблица из 256 кодов, индексом служит значение байта;
+                байтам, которых нет в данных, соответствует пустая строка.
+        """
+        self.build_codes_from_frequency({byte: count for byte, count in enumerate(counts) if count})
+        return self.byte_code_table()
+
+    def byte_code_table(self):
+        """Таблица из 256 кодов для текущих кодов байтов.
+
+        Returns:
+            list: Коды, индексом служит значение байта.
+        """
+        table = [''] * BYTE_ALPHABET_SIZE
+        for byte, code in self.huffman_codes.items():
+            table[byte] = code
+        return table
+
+    def encode_packed_bytes(self, data):
+        """Кодирование двоичных данных в упакованный битовый поток.
+
+        Args:
+            data (bytes): Данные для кодирования.
+
+        Returns:
+            tuple: (упакованные байты, число значащих бит).
+        """
+        table = self.build_byte_codes(count_bytes(data))
+        bits = ''.join(map(table.__getitem__, data))
+        return pack_bits(bits), len(bits)
+
+    def encode(self, data):
+        """Кодирование данных методом Хаффмана.
+
+        Args:
+            data (str): Данные для кодирования.
+
+        Returns:
+            str: Закодированные данные.
+        """
+        self.build_codes(data)
         huffman_encoded_data = ''.join(self.huffman_codes[symbol] for symbol in data)
 
         # Запись длины слова в settings.ini
@@ -51,20 +169,98 @@ class Huffman:
         except (OSError, IOError) as e:
             print(f"Ошибка при работе с файлом settings.ini: {e}")
 
-        # Сохранение словаря кодов в JSON файл
+        # Сохранение длин канонических кодов в JSON файл
         try:
             with open("huffman_codes.json", "w", encoding='utf-8') as file:
-                json.dump(self.huffman_codes, file)
+                json.dump(code_lengths_to_json(self.code_lengths), file,
+                          ensure_ascii=False, separators=(',', ':'))
         except (OSError, IOError) as e:
             print(f"Ошибка при сохранении словаря кодов в JSON файл: {e}")
 
         return huffman_encoded_data
 
-    def decode(self, encoded_data):
+    def encode_stream(self, chunks, file):
+        """Потоковое кодирование частей данных текущими кодами.
+
+        Args:
+            chunks (iterable): Части исходных данных (str).
+            file: Файл, открытый в режиме 'wb'.
+
+        Returns:
+            int: Число бит выравнивания в последнем байте.
+        """
+        codes = self.huffman_codes
+        writer = BitWriter(file)
+        for chunk in chunks:
+            writer.write(''.join(map(codes.__getitem__, chunk)))
+        return writer.flush()
+
+    def encode_byte_stream(self, chunks, file):
+        """Потоковое кодирование двоичных данных по таблице кодов байтов.
+
+        Args:
+            chunks (iterable): Части исходных данных (bytes).
+            file: Файл, открытый в режиме 'wb'.
+
+        Returns:
+            int: Число бит выравнивания в последнем байте.
+        """
+        table = self.byte_code_table()
+        writer = BitWriter(file)
+        for chunk in chunks:
+            writer.write(''.join(map(table.__getitem__, chunk)))
+        return writer.flush()
+
+    def decode_stream(self, chunks, bit_count, word_length=None):
+        """Потоковое табличное декодирование упакованного битового потока.
+
+        Args:
+            chunks (iterable): Части упакованного потока (bytes).
+            bit_count (int): Общее число значащих бит.
+            word_length (int): Число символов исходного текста.
+
+        Yields:
+            str: Декодированный текст очередной части.
+        """
+        decoder = TableDecoder(self.huffman_codes)
+        for decoded in decoder.decode_stream(chunks, bit_count, word_length):
+            yield ''.join(decoded)
+
+    def decode_byte_stream(self, chunks, bit_count, byte_count=None):
+        """Потоковое табличное декодирование двоичных данных.
+
+        Args:
+            chunks (iterable): Части упакованного потока (bytes).
+            bit_count (int): Общее число значащих бит.
+            byte_count (int): Число байт исходных данных.
+
+        Yields:
+            bytes: Декодированные данные очередной части.
+        """
+        decoder = TableDecoder(self.huffman_codes)
+        for decoded in decoder.decode_stream(chunks, bit_count, byte_count):
+            yield bytes(decoded)
+
+    def decode_packed_bytes(self, payload, bit_count, byte_count=None):
+        """Табличное декодирование упакованного потока двоичных данных.
+
+        Args:
+            payload (bytes): Упакованные биты (старший бит первым).
+            bit_count (int): Число значащих бит.
+            byte_count (int): Число байт исходных данных.
+
+        Returns:
+            bytes: Декодированные данные.
+        """
+        decoder = TableDecoder(self.huffman_codes)
+        return bytes(decoder.decode(payload, bit_count, byte_count))
+
+    def decode(self, encoded_data, method=DEFAULT_DECODER):
         """Декодирование данных методом Хаффмана.
 
         Args:
             encoded_data (str): Закодированные данные.
+            method (str): Способ декодирования из DECODERS.
 
         Returns:
             str: Декодированные данные.
@@ -72,7 +268,7 @@ class Huffman:
         # Загрузка словаря кодов из JSON файла
         try:
             with open("huffman_codes.json", "r", encoding='utf-8') as file:
-                self.huffman_codes = json.load(file)
+                self.huffman_codes = codes_from_json(json.load(file))
         except (OSError, IOError, json.JSONDecodeError) as e:
             print(f"Ошибка при загрузке словаря кодов из JSON файла: {e}")
             return ""
@@ -86,6 +282,25 @@ class Huffman:
             print(f"Ошибка при чтении длины слова из settings.ini: {e}")
             return ""
 
+        return self.decode_bits(encoded_data, word_length, method)
+
+    def decode_bits(self, encoded_data, word_length=None, method=DEFAULT_DECODER):
+        """Декодирование строки из '0'/'1' по текущему словарю кодов.
+
+        Args:
+            encoded_data (str): Закодированные данные.
+            word_length (int): Число символов исходного текста.
+            method (str): Способ декодирования из DECODERS.
+
+        Returns:
+            str: Декодированные данные.
+        """
+        encoded_data = encoded_data.strip()
+        if method == 'table':
+            return self.decode_packed(pack_bits(encoded_data), len(encoded_data), word_length)
+        if method != 'bitwise':
+            raise ValueError(f"Неизвестный способ декодирования: {method}")
+
         reverse_huffman_codes = {v: k for k, v in self.huffman_codes.items()}
 
         decoded_data = ""
@@ -98,21 +313,31 @@ class Huffman:
 
         return decoded_data[:word_length]  # Ограничение по длине слова
 
+    def decode_packed(self, payload, bit_count, word_length=None, method=DEFAULT_DECODER):
+        """Декодирование упакованного битового потока.
+
+        Args:
+            payload (bytes): Упакованные биты (старший бит первым).
+            bit_count (int): Число значащих бит.
+            word_length (int): Число символов исходного текста.
+            method (str): Способ декодирования из DECODERS.
+
+        Returns:
+            str: Декодированные данные.
+        """
+        if method != 'table':
+            return self.decode_bits(unpack_bits(payload, bit_count), word_length, method)
+        decoder = TableDecoder(self.huffman_codes)
+        return ''.join(decoder.decode(payload, bit_count, word_length))
+
 def calculate_data_entropy(data):
     """Расчет энтропии для исходного текста."""
-    frequency = defaultdict(int)
-    for symbol in data:
-        frequency[symbol] += 1
-    total_symbols = len(data)
-    entropy_value = -sum((freq / total_symbols) * log2(freq / total_symbols)
-        for freq in frequency.values())
-    return entropy_value
+    return shannon_entropy(Counter(data))
 
 def calculate_average_code_length(huffman_codes, frequency):
     """Расчет средней длины кода Хаффмана."""
-    total_length = sum(len(code) * freq for code, freq in frequency.items())
-    total_symbols = sum(frequency.values())
-    return total_length / total_symbols
+    code_lengths = code_lengths_from_codes(huffman_codes)
+    return frequency_statistics(frequency, code_lengths).average_code_length
 
 def calculate_compression_ratio(original_size, encoded_size):
     """Расчет степени сжатия."""
@@ -128,20 +353,16 @@ def encode_file(input_file, output_file):
     with open(output_file, 'w', encoding='utf-8') as file:
         file.write(encoded_data)
 
-    frequency = defaultdict(int)
-    for symbol in data:
-        frequency[symbol] += 1
-
-    huffman_codes = huffman.huffman_codes
-    return len(data), len(encoded_data), calculate_data_entropy(data), calculate_average_code_length(huffman_codes, frequency)
+    statistics = frequency_statistics(Counter(data), huffman.code_lengths)
+    return len(data), len(encoded_data), statistics.shannon, statistics.average_code_length
 
-def decode_file(input_file, output_file):
+def decode_file(input_file, output_file, decoder=DEFAULT_DECODER):
     """Декодирование файла."""
     with open(input_file, 'r', encoding='utf-8') as file:
         encoded_data = file.read()
 
     huffman = Huffman()
-    decoded_data = huffman.decode(encoded_data)
+    decoded_data = huffman.decode(encoded_data, decoder)
 
     with open(output_file, 'w', encoding='utf-8') as file:
         file.write(decoded_data)
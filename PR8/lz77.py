@@ -0,0 +1,203 @@
+"""
+Предварительное сжатие LZ77 (LZSS) перед кодированием Хаффмана.
+
+Повторы ищутся в скользящем окне по хеш-цепочкам: для каждой позиции
+запоминается предыдущая позиция с теми же MIN_MATCH байтами, и при поиске
+просматривается не более max_chain кандидатов. Совпадения короче
+MIN_MATCH передаются литералами.
+
+Как и в DEFLATE, результат разбирается на потоки, каждый из которых
+кодируется собственным кодом Хаффмана:
+    литералы и длины совпадений (0..255 - байт, 256 + длина - MIN_MATCH),
+    группы расстояний (число бит расстояния - 1),
+    дополнительные биты расстояний внутри группы (без сжатия).
+
+Блок сериализуется как LZ77_BLOCK_FORMAT, две таблицы длин кодов
+(infotheory.canonical.pack_code_lengths) и три упакованных потока.
+"""
+import os
+import sys
+import struct
+from collections import Counter
+
+from huffman import Huffman
+from container import LZ77_BLOCK_FORMAT
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infotheory.bitbuffer import pack_bits, unpack_bits  # noqa: E402
+from infotheory.canonical import canonical_codes, pack_code_lengths, unpack_code_lengths  # noqa: E402
+from infotheory.huffman_table import TableDecoder  # noqa: E402
+
+MIN_MATCH = 3
+MAX_MATCH = 258
+LENGTH_BASE = 256  # первый символ длины совпадения в алфавите литералов и длин
+DEFAULT_WINDOW = 32 * 1024
+MAX_WINDOW = 1 << 24
+DEFAULT_MAX_CHAIN = 64
+
+
+def find_tokens(data, window=DEFAULT_WINDOW, max_chain=DEFAULT_MAX_CHAIN):
+    """
+    Жадный разбор данных на литералы и совпадения.
+
+    Args:
+        data (bytes): Данные блока.
+        window (int): Максимальное расстояние до начала совпадения.
+        max_chain (int): Максимальное число проверяемых кандидатов.
+
+    Returns:
+        tuple: (список символов литералов и длин, список расстояний совпадений).
+    """
+    size = len(data)
+    head = {}
+    previous = [-1] * size
+    symbols = []
+    distances = []
+    position = 0
+    while position < size:
+        best_length = 0
+        best_distance = 0
+        max_length = min(MAX_MATCH, size - position)
+        if max_length >= MIN_MATCH:
+            key = data[position:position + MIN_MATCH]
+            candidate = head.get(key, -1)
+            limit = position - window
+            chain = max_chain
+            while candidate > limit and candidate >= 0 and chain:
+                chain -= 1
+                # Кандидат интересен, только если продолжает лучшее совпадение
+                if (data[candidate + best_length:candidate + best_length + 1]
+                        == data[position + best_length:position + best_length + 1]):
+                    length = MIN_MATCH
+                    while length < max_length and data[candidate + length] == data[position + length]:
+                        length += 1
+                    if length > best_length:
+                        best_length = length
+                        best_distance = position - candidate
+                        if length == max_length:
+                            break
+                candidate = previous[candidate]
+
+        step = best_length if best_length >= MIN_MATCH else 1
+        if step > 1:
+            symbols.append(LENGTH_BASE + best_length - MIN_MATCH)
+            distances.append(best_distance)
+        else:
+            symbols.append(data[position])
+        for inserted in range(position, min(position + step, size - MIN_MATCH + 1)):
+            key = data[inserted:inserted + MIN_MATCH]
+            previous[inserted] = head.get(key, -1)
+            head[key] = inserted
+        position += step
+    return symbols, distances
+
+
+def distance_group(distance):
+    """Группа расстояния и его дополнительные биты.
+
+    Returns:
+        tuple: (номер группы, число дополнительных бит, их значение).
+    """
+    value = distance - 1
+    group = value.bit_length()
+    extra_bits = max(0, group - 1)
+    return group, extra_bits, value & ((1 << extra_bits) - 1)
+
+
+def encode_block(data, window=DEFAULT_WINDOW, max_chain=DEFAULT_MAX_CHAIN, max_code_length=None):
+    """
+    Сжатие блока: разбор LZ77 и кодирование потоков кодами Хаффмана.
+
+    Args:
+        data (bytes): Данные блока.
+        window (int): Размер окна.
+        max_chain (int): Максимальное число кандидатов при поиске совпадения.
+        max_code_length (int): Ограничение длины кода; None - без ограничения.
+
+    Returns:
+        tuple: (сериализованный блок, число символов литералов и длин,
+            число совпадений).
+    """
+    symbols, distances = find_tokens(data, window, max_chain)
+    groups = []
+    extra = []
+    for distance in distances:
+        group, extra_bits, value = distance_group(distance)
+        groups.append(group)
+        if extra_bits:
+            extra.append(format(value, f'0{extra_bits}b'))
+    extra = ''.join(extra)
+
+    streams = []
+    tables = []
+    for stream in (symbols, groups):
+        huffman = Huffman(max_code_length)
+        codes = huffman.build_codes_from_frequency(Counter(stream))
+        tables.append(pack_code_lengths(huffman.code_lengths))
+        streams.append(''.join(map(codes.__getitem__, stream)))
+    streams.append(extra)
+
+    header = struct.pack(LZ77_BLOCK_FORMAT, len(data), len(symbols), len(distances),
+                         *(len(table) for table in tables), *(len(bits) for bits in streams))
+    block = header + b''.join(tables) + b''.join(pack_bits(bits) for bits in streams)
+    return block, len(symbols), len(distances)
+
+
+def decode_block(file):
+    """
+    Чтение и восстановление одного блока.
+
+    Args:
+        file: Файл, открытый в режиме 'rb' и установленный на начало блока.
+
+    Returns:
+        bytes: Данные блока.
+
+    Raises:
+        ValueError: Если блок обрезан или содержит недопустимую ссылку.
+    """
+    raw = file.read(struct.calcsize(LZ77_BLOCK_FORMAT))
+    if len(raw) < struct.calcsize(LZ77_BLOCK_FORMAT):
+        raise ValueError("Блок LZ77 обрезан")
+    size, symbol_count, match_count, *sizes = struct.unpack(LZ77_BLOCK_FORMAT, raw)
+    table_sizes, bit_counts = sizes[:2], sizes[2:]
+
+    tables = [unpack_code_lengths(file.read(table_size))[0] for table_size in table_sizes]
+    payloads = [file.read((bits + 7) // 8) for bits in bit_counts]
+    if any(len(payload) < (bits + 7) // 8 for payload, bits in zip(payloads, bit_counts)):
+        raise ValueError("Блок LZ77 обрезан")
+
+    symbols = TableDecoder(canonical_codes(tables[0])).decode(payloads[0], bit_counts[0], symbol_count)
+    groups = TableDecoder(canonical_codes(tables[1])).decode(payloads[1], bit_counts[1], match_count)
+    extra = unpack_bits(payloads[2], bit_counts[2])
+    if len(symbols) != symbol_count or len(groups) != match_count:
+        raise ValueError("Поток LZ77 обрезан")
+
+    output = bytearray()
+    match = 0
+    extra_position = 0
+    for symbol in symbols:
+        if symbol < LENGTH_BASE:
+            output.append(symbol)
+            continue
+        length = symbol - LENGTH_BASE + MIN_MATCH
+        group = groups[match]
+        match += 1
+        extra_bits = max(0, group - 1)
+        value = (1 << extra_bits) if group > 1 else group
+        if extra_bits:
+            value |= int(extra[extra_position:extra_position + extra_bits], 2)
+            extra_position += extra_bits
+        distance = value + 1
+        if distance > len(output):
+            raise ValueError("Ссылка LZ77 выходит за начало блока")
+        start = len(output) - distance
+        if distance >= length:
+            output += output[start:start + length]
+        else:
+            # Перекрывающееся совпадение повторяет последние distance байт
+            output += (output[start:] * (length // distance + 1))[:length]
+    if len(output) != size:
+        raise ValueError("Размер блока LZ77 не совпадает с заголовком")
+    return bytes(output)
@@ -1,5 +1,26 @@
-from tkinter import Tk, Frame, Radiobutton, Button, Label, filedialog, messagebox
-from entropy import encode_file, decode_file, calculate_compression_ratio
+import argparse
+import sys
+from tkinter import (Tk, Frame, Radiobutton, Checkbutton, Button, Label, StringVar, BooleanVar,
+                     filedialog, messagebox)
+from entropy import (encode_file, decode_file, encode_file_stream, decode_file_stream,
+                     encode_file_blocks, decode_file_blocks, decode_single_block,
+                     encode_file_adaptive, decode_file_adaptive, encode_file_bytes,
+                     encode_file_dictionary, encode_file_range,
+                     encode_file_tans, encode_file_lz77,
+                     encode_file_bwt, encode_file_tokens, profile_entropy,
+                     analyze_length_limit,
+                     calculate_compression_ratio, DEFAULT_CHUNK_SIZE, STDIO,
+                     DEFAULT_PROFILE_WINDOW, PROFILE_FORMATS,
+                     MAX_NGRAM_ORDER, file_conditional_entropy, DEFAULT_MAX_VOCABULARY)
+from blocks import DEFAULT_BLOCK_SIZE
+from dictionary import DEFAULT_DICTIONARY_DIR, format_dictionary_id, train_dictionary
+from range_coder import DEFAULT_ORDER, MAX_ORDER
+from tans import DEFAULT_TABLE_LOG, MAX_TABLE_LOG
+from lz77 import DEFAULT_WINDOW, MAX_WINDOW, DEFAULT_MAX_CHAIN
+from bwt import DEFAULT_BLOCK_SIZE as DEFAULT_BWT_BLOCK_SIZE
+from huffman import DECODERS, DEFAULT_DECODER
+
+METHODS = ('static', 'adaptive', 'range', 'tans')
 
 class HuffmanApp:
     """GUI приложение для кодирования и декодирования файлов с использованием алгоритма Хаффмана."""
@@ -14,7 +35,13 @@ class HuffmanApp:
         self.main_window.title("Huffman Encoder/Decoder")
         self.main_window.bind('<Escape>', lambda e: self.main_window.quit())
 
-        self.operation_mode = "encode"  # Устанавливаем значение по умолчанию
+        self.operation_mode = StringVar(value="encode")  # Устанавливаем значение по умолчанию
+        self.decoder = StringVar(value=DEFAULT_DECODER)
+        self.method = StringVar(value="static")
+        self.binary = BooleanVar(value=False)
+        self.lz77 = BooleanVar(value=False)
+        self.bwt = BooleanVar(value=False)
+        self.tokens = BooleanVar(value=False)
 
         self.setup_ui()
 
@@ -28,6 +55,34 @@ class HuffmanApp:
         Radiobutton(control_frame, text="Decode", variable=self.operation_mode,
                     value="decode").pack(side="left", padx=5)
 
+        method_frame = Frame(self.main_window)
+        method_frame.pack(pady=5)
+
+        Radiobutton(method_frame, text="Static Huffman", variable=self.method,
+                    value="static").pack(side="left", padx=5)
+        Radiobutton(method_frame, text="Adaptive Huffman", variable=self.method,
+                    value="adaptive").pack(side="left", padx=5)
+        Radiobutton(method_frame, text="Range coder", variable=self.method,
+                    value="range").pack(side="left", padx=5)
+        Radiobutton(method_frame, text="tANS", variable=self.method,
+                    value="tans").pack(side="left", padx=5)
+        Checkbutton(method_frame, text="Binary file (bytes)",
+                    variable=self.binary).pack(side="left", padx=5)
+        Checkbutton(method_frame, text="LZ77 pre-pass",
+                    variable=self.lz77).pack(side="left", padx=5)
+        Checkbutton(method_frame, text="BWT pre-pass",
+                    variable=self.bwt).pack(side="left", padx=5)
+        Checkbutton(method_frame, text="Word tokens",
+                    variable=self.tokens).pack(side="left", padx=5)
+
+        decoder_frame = Frame(self.main_window)
+        decoder_frame.pack(pady=5)
+
+        Radiobutton(decoder_frame, text="Table decoder", variable=self.decoder,
+                    value="table").pack(side="left", padx=5)
+        Radiobutton(decoder_frame, text="Bitwise decoder", variable=self.decoder,
+                    value="bitwise").pack(side="left", padx=5)
+
         self.action_button = Button(self.main_window, text="Start", command=self.execute_action)
         self.action_button.pack(pady=15)
 
@@ -36,18 +91,20 @@ class HuffmanApp:
 
     def select_input_file(self):
         """Выбор файла для обработки."""
-        file_path = filedialog.askopenfilename(filetypes=[("Text Files", "*.txt")])
+        file_path = filedialog.askopenfilename(filetypes=[("Text Files", "*.txt"),
+                                                          ("All Files", "*")])
         return file_path
 
     def select_output_file(self):
         """Выбор файла для сохранения результата."""
         file_path = filedialog.asksaveasfilename(defaultextension=".txt",
-                                                 filetypes=[("Text Files", "*.txt")])
+                                                 filetypes=[("Text Files", "*.txt"),
+                                                            ("All Files", "*")])
         return file_path
 
     def execute_action(self):
         """Выполнение выбранного действия (кодирование или декодирование)."""
-        if self.operation_mode == "encode":
+        if self.operation_mode.get() == "encode":
             self.encode_file()
         else:
             self.decode_file()
@@ -61,7 +118,25 @@ class HuffmanApp:
         if not output_file_path:
             return
         try:
-            original_size, encoded_size, entropy, bits_per_symbol = encode_file(input_file_path, output_file_path)
+            if self.lz77.get() and self.method.get() == "static":
+                result = encode_file_lz77(input_file_path, output_file_path)
+            elif self.bwt.get() and self.method.get() == "static":
+                result = encode_file_bwt(input_file_path, output_file_path)
+            elif self.tokens.get() and self.method.get() == "static":
+                result = encode_file_tokens(input_file_path, output_file_path)
+            elif self.method.get() == "adaptive":
+                result = encode_file_adaptive(input_file_path, output_file_path)
+            elif self.method.get() == "range":
+                result = encode_file_range(input_file_path, output_file_path,
+                                           binary=self.binary.get())
+            elif self.method.get() == "tans":
+                result = encode_file_tans(input_file_path, output_file_path,
+                                          binary=self.binary.get())
+            elif self.binary.get():
+                result = encode_file_bytes(input_file_path, output_file_path)
+            else:
+                result = encode_file(input_file_path, output_file_path)
+            original_size, encoded_size, entropy, bits_per_symbol = result
             compression_ratio = calculate_compression_ratio(original_size, encoded_size)
 
             result_message = (
@@ -88,7 +163,8 @@ class HuffmanApp:
         if not output_file_path:
             return
         try:
-            encoded_size, decoded_size = decode_file(input_file_path, output_file_path)
+            encoded_size, decoded_size = decode_file(input_file_path, output_file_path,
+                                                     self.decoder.get())
             result_message = (
                 f"Decoding complete!\n"
                 f"Encoded size: {encoded_size} bytes\n"
@@ -101,7 +177,260 @@ class HuffmanApp:
         except ValueError as e:
             messagebox.showerror("Value Error", f"An error occurred with the values provided: {e}")
 
+def run_cli(args):
+    """Выполнение кодирования или декодирования из командной строки.
+
+    Args:
+        args (argparse.Namespace): Разобранные аргументы командной строки.
+    """
+    if args.command == "train":
+        dictionary_id, version, file_count, symbol_count = train_dictionary(
+            args.corpus, args.name, args.dictionary_dir, args.max_code_length)
+        print(f"Trained dictionary '{args.name}' version {version} "
+              f"on {file_count} files ({symbol_count} symbols)")
+        print(f"Dictionary ID: {format_dictionary_id(dictionary_id)}")
+        return
+    if args.command == "profile":
+        row_count = profile_entropy(args.input, args.output, args.window, args.step, args.format)
+        report = sys.stderr if args.output == STDIO else sys.stdout
+        print(f"Profile rows: {row_count}", file=report)
+        return
+    if args.command == "ngram":
+        entropies = file_conditional_entropy(args.input, range(args.max_order + 1),
+                                             args.sketch_width_log, chunk_size=args.chunk_size)
+        for order, entropy in entropies.items():
+            print(f"Order {order}: {entropy:.4f} bits/byte")
+        return
+
+    # При выводе в stdout статистика печатается в stderr, чтобы не смешиваться с данными
+    report = sys.stderr if args.output == STDIO else sys.stdout
+    if args.command == "encode":
+        if args.dictionary:
+            result = encode_file_dictionary(args.input, args.output, args.dictionary,
+                                            args.dictionary_dir)
+        elif args.lz77:
+            result = encode_file_lz77(args.input, args.output, args.window, args.max_chain,
+                                      args.max_code_length, args.chunk_size)
+        elif args.bwt:
+            result = encode_file_bwt(args.input, args.output, args.bwt_block_size,
+                                     args.max_code_length)
+        elif args.tokens:
+            result = encode_file_tokens(args.input, args.output, args.max_vocabulary,
+                                        args.max_code_length, args.chunk_size)
+        elif args.method == "adaptive":
+            result = encode_file_adaptive(args.input, args.output, args.chunk_size)
+        elif args.method == "range":
+            result = encode_file_range(args.input, args.output, args.order, args.bytes,
+                                       args.chunk_size)
+        elif args.method == "tans":
+            result = encode_file_tans(args.input, args.output, args.table_log, args.bytes,
+                                      args.chunk_size)
+        elif args.bytes:
+            result = encode_file_bytes(args.input, args.output, args.chunk_size,
+                                       args.max_code_length)
+        elif args.blocks:
+            result = encode_file_blocks(args.input, args.output, args.block_size,
+                                        args.workers, args.shared_table, args.max_code_length)
+        elif args.stream:
+            result = encode_file_stream(args.input, args.output, args.chunk_size,
+                                        args.max_code_length)
+        else:
+            result = encode_file(args.input, args.output, args.max_code_length)
+        original_size, encoded_size, entropy, bits_per_symbol = result
+        print(f"Original size: {original_size} bytes", file=report)
+        print(f"Encoded size: {encoded_size} bytes", file=report)
+        print(f"Entropy: {entropy:.4f} bits/symbol", file=report)
+        print(f"Average bits per symbol: {bits_per_symbol:.4f}", file=report)
+        if encoded_size:
+            print(f"Compression ratio: {calculate_compression_ratio(original_size, encoded_size):.4f}",
+                  file=report)
+        if args.max_code_length is not None:
+            cost = analyze_length_limit(args.input, args.max_code_length, args.chunk_size,
+                                        args.bytes)
+            print(f"Max code length without limit: {cost['unbounded_max_length']} bits",
+                  file=report)
+            print(f"Length limit cost: {cost['extra_bits']} bits "
+                  f"({cost['extra_ratio'] * 100:.4f}%)", file=report)
+    elif args.block is not None:
+        text = decode_single_block(args.input, args.block)
+        with open(args.output, 'w', encoding='utf-8', newline='') as file:
+            file.write(text)
+        print(f"Decoded block {args.block}: {len(text)} symbols")
+    else:
+        if args.input == STDIO:
+            encoded_size, decoded_size = decode_file_adaptive(args.input, args.output,
+                                                              args.chunk_size)
+        elif args.blocks:
+            encoded_size, decoded_size = decode_file_blocks(args.input, args.output, args.workers)
+        elif args.stream:
+            encoded_size, decoded_size = decode_file_stream(args.input, args.output, args.chunk_size)
+        else:
+            encoded_size, decoded_size = decode_file(args.input, args.output, args.decoder,
+                                                     args.dictionary_dir)
+        print(f"Encoded size: {encoded_size} bytes", file=report)
+        print(f"Decoded size: {decoded_size} symbols", file=report)
+
+def parse_args():
+    """Разбор аргументов командной строки.
+
+    Без аргументов запускается графический интерфейс.
+    """
+    parser = argparse.ArgumentParser(description="Huffman Encoder/Decoder")
+    subparsers = parser.add_subparsers(dest="command")
+    for command in ("encode", "decode"):
+        subparser = subparsers.add_parser(command)
+        subparser.add_argument("input", help="Input file ('-' for stdin with adaptive Huffman)")
+        subparser.add_argument("output", help="Output file ('-' for stdout with adaptive Huffman)")
+        subparser.add_argument("--stream", action="store_true",
+                               help="Process the file in fixed-size chunks with bounded memory")
+        subparser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                               help="Chunk size for --stream (characters when encoding, "
+                                    "bytes when decoding)")
+        subparser.add_argument("--blocks", action="store_true",
+                               help="Use independent blocks processed by a pool of processes")
+        subparser.add_argument("--workers", type=int, default=None,
+                               help="Number of worker processes for --blocks (default: all cores)")
+        subparser.add_argument("--dictionary-dir", default=DEFAULT_DICTIONARY_DIR,
+                               help="Directory with shared dictionaries created by 'train'")
+    subparsers.choices["encode"].add_argument("--method", choices=METHODS, default="static",
+                                              help="Static two-pass Huffman, one-pass adaptive "
+                                                   "Huffman (FGK) for live streams, range "
+                                                   "coding with an order-k context model or "
+                                                   "tANS (FSE) with table-driven decoding")
+    subparsers.choices["encode"].add_argument("--order", type=int, default=DEFAULT_ORDER,
+                                              choices=range(MAX_ORDER + 1),
+                                              help="Context order for --method range")
+    subparsers.choices["encode"].add_argument("--table-log", type=int, default=DEFAULT_TABLE_LOG,
+                                              help="Log2 of the state table size for --method tans")
+    subparsers.choices["encode"].add_argument("--lz77", action="store_true",
+                                              help="LZ77 match-finding stage before static "
+                                                   "Huffman (DEFLATE-like, input as bytes)")
+    subparsers.choices["encode"].add_argument("--window", type=int, default=DEFAULT_WINDOW,
+                                              help=f"LZ77 window size in bytes (up to {MAX_WINDOW})")
+    subparsers.choices["encode"].add_argument("--max-chain", type=int, default=DEFAULT_MAX_CHAIN,
+                                              help="Hash-chain candidates checked per LZ77 match")
+    subparsers.choices["encode"].add_argument("--bwt", action="store_true",
+                                              help="Burrows-Wheeler + move-to-front + RLE stage "
+                                                   "before static Huffman (input as bytes)")
+    subparsers.choices["encode"].add_argument("--bwt-block-size", type=int,
+                                              default=DEFAULT_BWT_BLOCK_SIZE,
+                                              help="Block size in bytes for --bwt")
+    subparsers.choices["encode"].add_argument("--tokens", action="store_true",
+                                              help="Static Huffman over words, whitespace runs "
+                                                   "and punctuation instead of characters")
+    subparsers.choices["encode"].add_argument("--max-vocabulary", type=int,
+                                              default=DEFAULT_MAX_VOCABULARY,
+                                              help="Maximum number of multi-character tokens "
+                                                   "stored in the container for --tokens")
+    subparsers.choices["encode"].add_argument("--dictionary", default=None,
+                                              help="Encode with a shared dictionary: name, "
+                                                   "name:version or dictionary ID")
+    subparsers.choices["encode"].add_argument("--bytes", action="store_true",
+                                              help="Treat the input as binary data with a "
+                                                   "256-symbol byte alphabet (e.g. base2.db)")
+    subparsers.choices["encode"].add_argument("--block-size", type=int, default=DEFAULT_BLOCK_SIZE,
+                                              help="Block size in characters for --blocks")
+    subparsers.choices["encode"].add_argument("--shared-table", action="store_true",
+                                              help="Use one code table for all blocks")
+    subparsers.choices["encode"].add_argument("--max-code-length", type=int, default=None,
+                                              help="Limit code length (package-merge), "
+                                                   "e.g. 15 bits")
+    subparsers.choices["decode"].add_argument("--block", type=int, default=None,
+                                              help="Decode only the block with this number")
+    subparsers.choices["decode"].add_argument("--decoder", choices=DECODERS,
+                                              default=DEFAULT_DECODER)
+    train_parser = subparsers.add_parser("train",
+                                         help="Build a shared dictionary from a corpus")
+    train_parser.add_argument("corpus", help="Directory with UTF-8 text files")
+    train_parser.add_argument("--name", required=True, help="Dictionary name")
+    train_parser.add_argument("--dictionary-dir", default=DEFAULT_DICTIONARY_DIR,
+                              help="Directory to store the dictionary in")
+    train_parser.add_argument("--max-code-length", type=int, default=None,
+                              help="Limit code length (package-merge)")
+    profile_parser = subparsers.add_parser("profile",
+                                           help="Shannon entropy per block or sliding window")
+    profile_parser.add_argument("input", help="Input file ('-' for stdin)")
+    profile_parser.add_argument("output", nargs="?", default=STDIO,
+                                help="CSV or JSON output file (default: stdout)")
+    profile_parser.add_argument("--window", type=int, default=DEFAULT_PROFILE_WINDOW,
+                                help="Window size in bytes")
+    profile_parser.add_argument("--step", type=int, default=None,
+                                help="Window step in bytes (default: non-overlapping blocks)")
+    profile_parser.add_argument("--format", choices=PROFILE_FORMATS, default="csv")
+    ngram_parser = subparsers.add_parser("ngram",
+                                         help="Conditional entropy H(X | previous k bytes)")
+    ngram_parser.add_argument("input", help="Input file")
+    ngram_parser.add_argument("--max-order", type=int, default=DEFAULT_ORDER,
+                              choices=range(MAX_NGRAM_ORDER + 1),
+                              help="Report orders 0..k (compare with --method range --order k)")
+    ngram_parser.add_argument("--sketch-width-log", type=int, default=None,
+                              help="Approximate counting with a count-min sketch of "
+                                   "2**N counters per row (bounded memory)")
+    ngram_parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                              help="Bytes read at a time")
+    args = parser.parse_args()
+    if args.command == "ngram" and args.sketch_width_log is not None \
+            and not 1 <= args.sketch_width_log <= 32:
+        parser.error("--sketch-width-log must be between 1 and 32")
+    if args.command == "profile" and (args.window < 1 or (args.step is not None and args.step < 1)):
+        parser.error("--window and --step must be positive")
+    if args.command in ("encode", "decode", "ngram") and args.chunk_size < 1:
+        parser.error("--chunk-size must be positive")
+    if args.command == "encode" and args.block_size < 1:
+        parser.error("--block-size must be positive")
+    if args.command in ("encode", "decode") and args.workers is not None and args.workers < 1:
+        parser.error("--workers must be positive")
+    if args.command == "encode" and args.method == "tans" \
+            and not 1 <= args.table_log <= MAX_TABLE_LOG:
+        parser.error(f"--table-log must be between 1 and {MAX_TABLE_LOG}")
+    if args.command == "encode" and args.method == "adaptive" and (args.blocks or args.bytes):
+        parser.error("--method adaptive codes the input as one byte stream; "
+                     "omit --blocks and --bytes")
+    if args.command == "encode" and args.tokens and (args.blocks or args.stream or args.bytes):
+        parser.error("--tokens cannot be combined with --blocks, --stream or --bytes")
+    if args.command == "encode" and args.lz77 and (args.blocks or args.stream or args.bytes):
+        parser.error("--lz77 cannot be combined with --blocks, --stream or --bytes")
+    if args.command == "encode" and args.bwt and (args.blocks or args.stream or args.bytes):
+        parser.error("--bwt cannot be combined with --blocks, --stream or --bytes")
+    if args.command == "encode" and args.lz77 + args.bwt + args.tokens > 1:
+        parser.error("--lz77, --bwt and --tokens cannot be combined")
+    if args.command == "encode" and (args.lz77 or args.bwt or args.tokens) \
+            and args.method != "static":
+        parser.error("--lz77, --bwt and --tokens use static Huffman coding; omit --method")
+    if args.command == "encode" and args.method in ("range", "tans") \
+            and (args.stream or args.blocks):
+        parser.error(f"--method {args.method} writes a single container; "
+                     "omit --stream and --blocks")
+    if args.command == "encode" and args.dictionary and (
+            args.method != "static" or args.lz77 or args.bwt or args.tokens or args.bytes
+            or args.blocks or args.stream):
+        parser.error("--dictionary uses the dictionary's static code table; omit --method, "
+                     "--lz77, --bwt, --tokens, --bytes, --blocks and --stream")
+    if args.command in ("encode", "train") and args.max_code_length is not None \
+            and args.max_code_length < 1:
+        parser.error("--max-code-length must be positive")
+    if args.command == "encode" and args.max_code_length is not None \
+            and (args.method != "static" or args.dictionary):
+        parser.error("--max-code-length applies only to static Huffman codes built "
+                     "from the input")
+    if args.command == "encode" and args.bytes and (args.blocks or args.stream):
+        parser.error("--bytes cannot be combined with --blocks or --stream")
+    if args.command == "encode" and args.tokens and args.max_vocabulary < 0:
+        parser.error("--max-vocabulary must not be negative")
+    if args.command == "encode" and args.lz77 and not 1 <= args.window <= MAX_WINDOW:
+        parser.error(f"--window must be between 1 and {MAX_WINDOW}")
+    if args.command == "encode" and args.bwt and args.bwt_block_size < 1:
+        parser.error("--bwt-block-size must be positive")
+    return args
+
 if __name__ == "__main__":
-    root = Tk()
-    app = HuffmanApp(root)
-    root.mainloop()
+    arguments = parse_args()
+    if arguments.command:
+        try:
+            run_cli(arguments)
+        except (OSError, ValueError) as e:
+            raise SystemExit(f"Error: {e}") from e
+    else:
+        root = Tk()
+        app = HuffmanApp(root)
+        root.mainloop()
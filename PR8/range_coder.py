@@ -0,0 +1,255 @@
+"""
+Адаптивное арифметическое (интервальное) кодирование с контекстной моделью.
+
+Символы - номера в алфавите из 2 ** symbol_bits элементов (номер знака в
+алфавите текста или значение байта). Каждый символ кодируется symbol_bits
+двоичными решениями по дереву битов, как в LZMA: вероятность очередного
+бита берётся из ячейки, номер которой определяется контекстом (k
+предыдущими символами) и уже закодированными старшими битами символа.
+Вероятности хранятся с точностью PROBABILITY_BITS и после каждого бита
+сдвигаются к наблюдаемому значению.
+
+В отличие от Хаффмана, символ может занимать меньше одного бита, поэтому
+при хорошей модели размер приближается к энтропии источника, а контекст
+порядка k учитывает зависимость символа от предшествующих.
+
+Таблица вероятностей занимает не более 2 ** table_bits ячеек: если все
+контексты порядка k в неё не помещаются, номер контекста хешируется.
+"""
+from array import array
+
+PROBABILITY_BITS = 11
+PROBABILITY_ONE = 1 << PROBABILITY_BITS
+MOVE_BITS = 5  # скорость адаптации вероятностей
+TOP = 1 << 24  # нижняя граница интервала перед нормализацией
+
+MAX_ORDER = 4
+DEFAULT_ORDER = 2
+DEFAULT_TABLE_BITS = 22
+
+
+def symbol_bits_for(alphabet_size):
+    """Число бит номера символа для алфавита заданного размера (не меньше 1)."""
+    return max(1, (alphabet_size - 1).bit_length())
+
+
+class ContextModel:
+    """
+    Таблица вероятностей битов для контекстов порядка order.
+
+    Атрибуты:
+        order (int): Число предыдущих символов в контексте.
+        symbol_bits (int): Число бит номера символа.
+        context_bits (int): Число бит номера контекста.
+        probabilities (array): Вероятность нулевого бита для каждой ячейки.
+    """
+
+    def __init__(self, order=DEFAULT_ORDER, symbol_bits=8, table_bits=DEFAULT_TABLE_BITS):
+        """
+        Создаёт модель с равновероятными битами.
+
+        Args:
+            order (int): Порядок контекста от 0 до MAX_ORDER.
+            symbol_bits (int): Число бит номера символа (8 для байтов).
+            table_bits (int): Число бит номера ячейки таблицы вероятностей.
+
+        Raises:
+            ValueError: Если порядок вне допустимого диапазона.
+        """
+        if not 0 <= order <= MAX_ORDER:
+            raise ValueError(f"Порядок контекста должен быть от 0 до {MAX_ORDER}")
+        self.order = order
+        self.symbol_bits = symbol_bits
+        self.hashed = symbol_bits * order > table_bits - symbol_bits
+        self.context_bits = table_bits - symbol_bits if self.hashed else symbol_bits * order
+        self.probabilities = array('H', [PROBABILITY_ONE // 2]) * (1 << (self.context_bits + symbol_bits))
+        self.history = 0
+        self.history_mask = (1 << (symbol_bits * order)) - 1
+
+    def base(self, history):
+        """Номер первой ячейки таблицы для контекста history."""
+        if self.hashed:
+            history = ((history * 0x9E3779B1) & 0xFFFFFFFF) >> (32 - self.context_bits)
+        return history << self.symbol_bits
+
+
+class RangeEncoder:
+    """
+    Потоковый кодер: части данных можно подавать по мере поступления.
+
+    Атрибуты:
+        model (ContextModel): Контекстная модель.
+    """
+
+    def __init__(self, model):
+        """
+        Создаёт кодер с начальным интервалом [0, 2 ** 32).
+
+        Args:
+            model (ContextModel): Контекстная модель.
+        """
+        self.model = model
+        self.low = 0
+        self.range = 0xFFFFFFFF
+        self.cache = 0
+        self.cache_size = 1
+        self.output = bytearray()
+
+    def _shift_low(self):
+        """Вывод старшего байта нижней границы с учётом переноса."""
+        low = self.low
+        if low < 0xFF000000 or low >= 1 << 32:
+            carry = low >> 32
+            self.output.append((self.cache + carry) & 0xFF)
+            self.output.extend(bytes([(0xFF + carry) & 0xFF]) * (self.cache_size - 1))
+            self.cache_size = 0
+            self.cache = (low >> 24) & 0xFF
+        self.cache_size += 1
+        self.low = (low & 0x00FFFFFF) << 8
+
+    def encode(self, data):
+        """
+        Кодирует часть данных.
+
+        Args:
+            data (iterable): Очередная часть символов (например, bytes).
+
+        Returns:
+            bytes: Сформированные байты кода.
+        """
+        model = self.model
+        probabilities = model.probabilities
+        base = model.base
+        history = model.history
+        history_mask = model.history_mask
+        symbol_bits = model.symbol_bits
+        shifts = range(symbol_bits - 1, -1, -1)
+        low = self.low
+        range_ = self.range
+        for symbol in data:
+            context = base(history)
+            node = 1
+            for shift in shifts:
+                bit = (symbol >> shift) & 1
+                index = context + node
+                probability = probabilities[index]
+                bound = (range_ >> PROBABILITY_BITS) * probability
+                if bit:
+                    low += bound
+                    range_ -= bound
+                    probabilities[index] = probability - (probability >> MOVE_BITS)
+                else:
+                    range_ = bound
+                    probabilities[index] = probability + ((PROBABILITY_ONE - probability) >> MOVE_BITS)
+                while range_ < TOP:
+                    range_ <<= 8
+                    self.low = low
+                    self._shift_low()
+                    low = self.low
+                node = (node << 1) | bit
+            history = ((history << symbol_bits) | symbol) & history_mask
+        model.history = history
+        self.low = low
+        self.range = range_
+        return self._take_output()
+
+    def finish(self):
+        """
+        Завершает кодирование, выводя оставшиеся байты нижней границы.
+
+        Returns:
+            bytes: Последние байты кода.
+        """
+        for _ in range(5):
+            self._shift_low()
+        return self._take_output()
+
+    def _take_output(self):
+        output = bytes(self.output)
+        self.output.clear()
+        return output
+
+
+class RangeDecoder:
+    """
+    Потоковый декодер, повторяющий изменения модели кодера.
+
+    Атрибуты:
+        model (ContextModel): Контекстная модель.
+    """
+
+    def __init__(self, model, chunks):
+        """
+        Создаёт декодер и читает первые пять байт кода.
+
+        Args:
+            model (ContextModel): Контекстная модель.
+            chunks (iterable): Части закодированного потока (bytes).
+        """
+        self.model = model
+        self.chunks = iter(chunks)
+        self.buffer = b''
+        self.position = 0
+        self.range = 0xFFFFFFFF
+        self.code = 0
+        for _ in range(5):
+            self.code = (self.code << 8) | self._next_byte()
+
+    def _next_byte(self):
+        """Следующий байт кода; за концом потока - нули."""
+        if self.position >= len(self.buffer):
+            self.buffer = next(self.chunks, b'')
+            self.position = 0
+            if not self.buffer:
+                return 0
+        byte = self.buffer[self.position]
+        self.position += 1
+        return byte
+
+    def decode(self, count):
+        """
+        Декодирует очередные count символов.
+
+        Args:
+            count (int): Число символов.
+
+        Returns:
+            list: Номера символов.
+        """
+        model = self.model
+        probabilities = model.probabilities
+        base = model.base
+        history = model.history
+        history_mask = model.history_mask
+        symbol_bits = model.symbol_bits
+        limit = 1 << symbol_bits
+        code = self.code
+        range_ = self.range
+        next_byte = self._next_byte
+        decoded = [0] * count
+        for position in range(count):
+            context = base(history)
+            node = 1
+            while node < limit:
+                index = context + node
+                probability = probabilities[index]
+                bound = (range_ >> PROBABILITY_BITS) * probability
+                if code < bound:
+                    range_ = bound
+                    probabilities[index] = probability + ((PROBABILITY_ONE - probability) >> MOVE_BITS)
+                    node <<= 1
+                else:
+                    code -= bound
+                    range_ -= bound
+                    probabilities[index] = probability - (probability >> MOVE_BITS)
+                    node = (node << 1) | 1
+                while range_ < TOP:
+                    range_ <<= 8
+                    code = (code << 8) | next_byte()
+            symbol = node - limit
+            decoded[position] = symbol
+            history = ((history << symbol_bits) | symbol) & history_mask
+        model.history = history
+        self.code = code
+        self.range = range_
+        return decoded
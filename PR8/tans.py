@@ -0,0 +1,229 @@
+"""
+Табличная асимметричная система счисления (tANS) в варианте FSE.
+
+Частоты символов нормируются так, чтобы их сумма была равна размеру
+таблицы L = 2 ** table_log. Символы раскладываются по L состояниям
+(каждому символу достаётся столько состояний, какова его нормированная
+частота), после чего кодирование и декодирование символа сводятся к
+чтению заранее вычисленных таблиц и записи (чтению) нескольких бит.
+
+Как и в арифметическом кодировании, символ может занимать дробное число
+бит, а декодер, как и табличный декодер Хаффмана, выполняет на символ одно
+обращение к таблице без ветвлений по дереву.
+
+Кодер обрабатывает символы в обратном порядке (ANS - стек), поэтому
+биты каждого блока сохраняются и записываются в обратном порядке, чтобы
+декодер читал поток от начала. Первыми в потоке записаны table_log бит
+конечного состояния кодера, декодер заканчивает работу в состоянии 0.
+"""
+import struct
+from array import array
+
+DEFAULT_TABLE_LOG = 11
+MAX_TABLE_LOG = 20  # таблица состояний должна умещаться в память и в STATE_SHIFT бит
+WORD_BITS = 32  # поток записывается и читается 32-битными словами
+STATE_SHIFT = 32  # сдвиг для вычисления числа бит без ветвлений, как в FSE
+
+
+def normalize_frequencies(frequency, table_log=DEFAULT_TABLE_LOG):
+    """
+    Нормирование частот к сумме 2 ** table_log.
+
+    Каждый встречающийся символ получает частоту не меньше 1; если символов
+    больше, чем состояний, table_log увеличивается. Расхождение суммы после
+    округления компенсируется за счёт самых частых символов.
+
+    Args:
+        frequency (dict): Словарь символ -> число вхождений.
+        table_log (int): Желаемый логарифм размера таблицы.
+
+    Returns:
+        dict: Словарь символ -> нормированная частота.
+    """
+    frequency = {symbol: count for symbol, count in frequency.items() if count}
+    if not frequency:
+        return {}
+    table_log = max(table_log, (len(frequency) - 1).bit_length())
+    table_size = 1 << table_log
+    total = sum(frequency.values())
+    normalized = {symbol: max(1, round(count * table_size / total))
+                  for symbol, count in frequency.items()}
+    difference = table_size - sum(normalized.values())
+    by_count = sorted(normalized, key=lambda symbol: (-normalized[symbol], symbol))
+    if difference > 0:
+        normalized[by_count[0]] += difference
+    while difference < 0:
+        for symbol in by_count:
+            if normalized[symbol] > 1:
+                normalized[symbol] -= 1
+                difference += 1
+                if not difference:
+                    break
+    return normalized
+
+
+def spread_symbols(normalized, table_size):
+    """
+    Раскладка символов по состояниям с нечётным шагом, как в FSE.
+
+    Шаг взаимно прост с размером таблицы, поэтому обходятся все состояния,
+    а состояния одного символа оказываются разбросаны по таблице.
+
+    Returns:
+        list: Символ каждого состояния.
+    """
+    step = ((table_size >> 1) + (table_size >> 3) + 3) | 1  # нечётен и для малых таблиц
+    mask = table_size - 1
+    spread = [None] * table_size
+    position = 0
+    for symbol in sorted(normalized):
+        for _ in range(normalized[symbol]):
+            spread[position] = symbol
+            position = (position + step) & mask
+    return spread
+
+
+class TansCodec:
+    """
+    Кодер и декодер tANS для заданных нормированных частот.
+
+    Атрибуты:
+        normalized (dict): Символ -> нормированная частота.
+        table_log (int): Логарифм размера таблицы.
+    """
+
+    def __init__(self, normalized):
+        """
+        Строит таблицы кодирования и декодирования.
+
+        Args:
+            normalized (dict): Символ -> нормированная частота; сумма частот
+                должна быть степенью двойки.
+
+        Raises:
+            ValueError: Если сумма частот не является степенью двойки.
+        """
+        table_size = sum(normalized.values())
+        if table_size & (table_size - 1) or any(count < 1 for count in normalized.values()):
+            raise ValueError("Сумма нормированных частот должна быть степенью двойки")
+        table_log = table_size.bit_length() - 1
+        self.normalized = normalized
+        self.table_log = table_log
+        spread = spread_symbols(normalized, table_size) if table_size else []
+
+        # Декодирование: состояние -> (символ, число бит, основание следующего состояния)
+        next_count = dict(normalized)
+        self.decode_symbols = spread
+        self.decode_bits = array('B', bytes(table_size))
+        self.decode_base = array('L', [0]) * table_size
+        for state, symbol in enumerate(spread):
+            count = next_count[symbol]
+            next_count[symbol] += 1
+            bit_count = table_log + 1 - count.bit_length()
+            self.decode_bits[state] = bit_count
+            self.decode_base[state] = (count << bit_count) - table_size
+
+        # Кодирование: для символа - поправки для числа бит и номера следующего состояния
+        self.encode_table = array('L', [0]) * table_size
+        self.transforms = {}
+        start = 0
+        for symbol in sorted(normalized):
+            count = normalized[symbol]
+            max_bits = table_log if count == 1 else table_log + 1 - (count - 1).bit_length()
+            self.transforms[symbol] = ((max_bits << STATE_SHIFT) - (count << max_bits),
+                                       start - count)
+            start += count
+        rank = dict.fromkeys(normalized, 0)
+        starts = {symbol: delta + normalized[symbol]
+                  for symbol, (_, delta) in self.transforms.items()}
+        for state, symbol in enumerate(spread):
+            self.encode_table[starts[symbol] + rank[symbol]] = table_size + state
+            rank[symbol] += 1
+
+    @classmethod
+    def from_frequency(cls, frequency, table_log=DEFAULT_TABLE_LOG):
+        """Кодек для таблицы частот: нормирование и построение таблиц."""
+        return cls(normalize_frequencies(frequency, table_log))
+
+    def encode(self, data):
+        """
+        Кодирует последовательность символов в отдельный поток.
+
+        Args:
+            data (sequence): Символы (str, bytes или list); все символы
+                должны иметь ненулевую нормированную частоту.
+
+        Returns:
+            bytes: Поток, выровненный по 32-битным словам.
+        """
+        table_size = 1 << self.table_log
+        transforms = self.transforms
+        encode_table = self.encode_table
+        values = []
+        widths = []
+        state = table_size
+        for symbol in reversed(data):
+            delta_bits, delta_state = transforms[symbol]
+            bit_count = (state + delta_bits) >> STATE_SHIFT
+            values.append(state & ((1 << bit_count) - 1))
+            widths.append(bit_count)
+            state = encode_table[(state >> bit_count) + delta_state]
+        values.append(state - table_size)
+        widths.append(self.table_log)
+
+        words = []
+        buffer = 0
+        buffered = 0
+        for value, width in zip(reversed(values), reversed(widths)):
+            buffer = (buffer << width) | value
+            buffered += width
+            if buffered >= WORD_BITS:
+                buffered -= WORD_BITS
+                words.append(buffer >> buffered)
+                buffer &= (1 << buffered) - 1
+        if buffered:
+            words.append(buffer << (WORD_BITS - buffered))
+        return struct.pack(f'>{len(words)}I', *words)
+
+    def decode(self, data, count):
+        """
+        Декодирует поток, записанный методом encode.
+
+        Args:
+            data (bytes): Поток одного блока.
+            count (int): Число символов блока.
+
+        Returns:
+            list: Декодированные символы.
+
+        Raises:
+            ValueError: Если поток обрезан или повреждён.
+        """
+        if len(data) % 4:
+            raise ValueError("Длина потока tANS не кратна 4 байтам")
+        words = struct.unpack(f'>{len(data) // 4}I', data)
+        symbols = self.decode_symbols
+        bits = self.decode_bits
+        base = self.decode_base
+        masks = [(1 << width) - 1 for width in range(WORD_BITS + 1)]
+        table_log = self.table_log
+        decoded = [None] * count
+        try:
+            buffer = words[0] if words else 0
+            word = 1
+            buffered = WORD_BITS - table_log
+            state = buffer >> buffered
+            for position in range(count):
+                decoded[position] = symbols[state]
+                bit_count = bits[state]
+                while buffered < bit_count:
+                    buffer = ((buffer & masks[buffered]) << WORD_BITS) | words[word]
+                    word += 1
+                    buffered += WORD_BITS
+                buffered -= bit_count
+                state = base[state] + ((buffer >> buffered) & masks[bit_count])
+        except IndexError:
+            raise ValueError("Поток tANS обрезан") from None
+        if state != 0 and count:
+            raise ValueError("Поток tANS повреждён")
+        return decoded
@@ -0,0 +1,6 @@
+"""
+Общие алгоритмы теории информации, используемые лабораторными работами.
+
+Модули пакета подключаются из каталогов лабораторных работ (PR3-PR10)
+и test, поэтому здесь собраны их переиспользуемые части.
+"""
@@ -0,0 +1,91 @@
+"""
+Преобразование битовых строк из символов '0'/'1' в упакованные байты.
+"""
+
+
+def pack_bits(bits):
+    """
+    Упаковывает строку из символов '0'/'1' в байты (старший бит первым).
+
+    Последний байт дополняется нулевыми битами справа.
+
+    Args:
+        bits (str): Битовая строка.
+
+    Returns:
+        bytes: Упакованные данные длиной ceil(len(bits) / 8) байт.
+    """
+    bit_count = len(bits)
+    if not bit_count:
+        return b''
+    padding = -bit_count % 8
+    return (int(bits, 2) << padding).to_bytes((bit_count + padding) // 8, 'big')
+
+
+def unpack_bits(data, bit_count=None):
+    """
+    Распаковывает байты в строку из символов '0'/'1'.
+
+    Args:
+        data (bytes): Упакованные данные (старший бит первым).
+        bit_count (int): Число значащих бит; по умолчанию 8 * len(data).
+
+    Returns:
+        str: Битовая строка.
+    """
+    if not data:
+        return ''
+    bits = format(int.from_bytes(data, 'big'), f'0{8 * len(data)}b')
+    return bits if bit_count is None else bits[:bit_count]
+
+
+class BitWriter:
+    """
+    Побайтовая запись битовой строки в файл по частям.
+
+    Неполный последний байт каждой части откладывается до следующей
+    записи, поэтому в памяти хранится не более семи лишних бит.
+
+    Атрибуты:
+        file: Файл, открытый в режиме 'wb'.
+        pending (str): Биты, ещё не образовавшие полный байт.
+        bit_count (int): Общее число записанных бит.
+    """
+
+    def __init__(self, file):
+        """
+        Инициализирует запись в указанный файл.
+
+        Args:
+            file: Файл, открытый в режиме 'wb'.
+        """
+        self.file = file
+        self.pending = ''
+        self.bit_count = 0
+
+    def write(self, bits):
+        """
+        Дописывает биты в поток.
+
+        Args:
+            bits (str): Битовая строка из символов '0'/'1'.
+        """
+        self.bit_count += len(bits)
+        bits = self.pending + bits
+        whole = len(bits) - len(bits) % 8
+        if whole:
+            self.file.write(pack_bits(bits[:whole]))
+        self.pending = bits[whole:]
+
+    def flush(self):
+        """
+        Записывает оставшиеся биты, дополняя последний байт нулями.
+
+        Returns:
+            int: Число бит выравнивания в последнем байте.
+        """
+        padding = -len(self.pending) % 8
+        if self.pending:
+            self.file.write(pack_bits(self.pending))
+            self.pending = ''
+        return padding
@@ -0,0 +1,186 @@
+"""
+Канонические коды Хаффмана.
+
+Канонический код полностью определяется длинами кодов символов: символы
+упорядочиваются по (длина, символ) и получают последовательные двоичные
+значения. Поэтому вместо словаря кодов достаточно хранить длины.
+"""
+
+
+def canonical_order(code_lengths):
+    """
+    Упорядочивает символы канонического кода.
+
+    Args:
+        code_lengths (dict): Словарь символ -> длина кода (не меньше 1).
+
+    Returns:
+        tuple: (список символов по возрастанию (длина, символ),
+            список counts, где counts[i] - число кодов длины i + 1).
+    """
+    order = sorted(code_lengths.items(), key=lambda item: (item[1], item[0]))
+    counts = [0] * (order[-1][1] if order else 0)
+    for _, length in order:
+        counts[length - 1] += 1
+    return [symbol for symbol, _ in order], counts
+
+
+def codes_from_counts(symbols, counts):
+    """
+    Восстанавливает канонические коды за O(k) без сортировки.
+
+    Args:
+        symbols (sequence): Символы в каноническом порядке.
+        counts (list): Число кодов каждой длины, начиная с длины 1.
+
+    Returns:
+        dict: Словарь символ -> код в виде строки из '0'/'1'.
+
+    Raises:
+        ValueError: Если длины не образуют префиксный код.
+    """
+    codes = {}
+    code = 0
+    index = 0
+    for length, count in enumerate(counts, 1):
+        for symbol in symbols[index:index + count]:
+            codes[symbol] = format(code, f'0{length}b')
+            code += 1
+        if code > 1 << length:
+            raise ValueError("Длины кодов не удовлетворяют неравенству Крафта")
+        index += count
+        code <<= 1
+    return codes
+
+
+def canonical_codes(code_lengths):
+    """
+    Строит канонические коды по длинам кодов.
+
+    Args:
+        code_lengths (dict): Словарь символ -> длина кода.
+
+    Returns:
+        dict: Словарь символ -> код в виде строки из '0'/'1'.
+    """
+    return codes_from_counts(*canonical_order(code_lengths))
+
+
+def code_lengths_to_json(code_lengths):
+    """
+    Представляет канонический код в компактном виде для JSON.
+
+    Сохраняются только символы в каноническом порядке одной строкой и
+    число кодов каждой длины; сами коды восстанавливает codes_from_json.
+
+    Args:
+        code_lengths (dict): Словарь символ (строка из одного знака) -> длина кода.
+
+    Returns:
+        dict: Объект {"format": "canonical", "symbols": ..., "counts": [...]}.
+    """
+    symbols, counts = canonical_order(code_lengths)
+    return {"format": "canonical", "symbols": ''.join(symbols), "counts": counts}
+
+
+def codes_from_json(data):
+    """
+    Восстанавливает коды из объекта, прочитанного из JSON.
+
+    Поддерживаются компактный канонический формат code_lengths_to_json
+    и прежний формат - словарь символ -> код.
+
+    Args:
+        data (dict): Объект из JSON-файла.
+
+    Returns:
+        dict: Словарь символ -> код.
+    """
+    if data.get("format") == "canonical":
+        return codes_from_counts(data["symbols"], data["counts"])
+    return dict(data)
+
+
+def code_lengths_from_codes(codes):
+    """
+    Извлекает длины кодов из словаря кодов.
+
+    Алфавиту из одного символа назначается код длины 1, чтобы каждый
+    символ занимал в потоке хотя бы один бит.
+
+    Args:
+        codes (dict): Словарь символ -> код.
+
+    Returns:
+        dict: Словарь символ -> длина кода.
+    """
+    return {symbol: max(len(code), 1) for symbol, code in codes.items()}
+
+
+def _write_varint(out, value):
+    """Записывает неотрицательное целое в формате LEB128."""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, offset):
+    """Читает целое в формате LEB128, возвращает (значение, новое смещение)."""
+    value = 0
+    shift = 0
+    while True:
+        if offset >= len(data):
+            raise ValueError("Таблица длин кодов обрезана")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def pack_code_lengths(code_lengths):
+    """
+    Сериализует длины кодов в компактный двоичный вид.
+
+    Формат: число символов, затем для каждого символа по возрастанию -
+    приращение номера символа относительно предыдущего и длина кода.
+    Числа записываются в формате LEB128.
+
+    Args:
+        code_lengths (dict): Словарь целочисленный символ -> длина кода.
+
+    Returns:
+        bytes: Сериализованная таблица.
+    """
+    out = bytearray()
+    _write_varint(out, len(code_lengths))
+    previous = 0
+    for symbol in sorted(code_lengths):
+        _write_varint(out, symbol - previous)
+        _write_varint(out, code_lengths[symbol])
+        previous = symbol
+    return bytes(out)
+
+
+def unpack_code_lengths(data, offset=0):
+    """
+    Читает таблицу длин кодов, записанную pack_code_lengths.
+
+    Args:
+        data (bytes): Буфер с таблицей.
+        offset (int): Смещение начала таблицы.
+
+    Returns:
+        tuple: (словарь целочисленный символ -> длина кода, смещение после таблицы).
+    """
+    count, offset = _read_varint(data, offset)
+    code_lengths = {}
+    symbol = 0
+    for _ in range(count):
+        delta, offset = _read_varint(data, offset)
+        length, offset = _read_varint(data, offset)
+        symbol += delta
+        code_lengths[symbol] = length
+    return code_lengths, offset
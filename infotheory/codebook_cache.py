@@ -0,0 +1,283 @@
+"""
+Кэш кодовых книг Хаффмана и заранее обученные кодовые книги.
+
+При сжатии множества коротких похожих сообщений дерево Хаффмана
+строится заново для одних и тех же гистограмм частот. CodebookCache
+хранит последние построенные коды с вытеснением по LRU: ключом служит
+сама гистограмма (неизменяемое множество пар символ-частота) вместе с
+ограничением длины кода. Кроме того, кэш хранит именованные словари -
+обученные заранее кодовые книги StaticCodebook, которые не вытесняются.
+
+StaticCodebook кодирует сообщение без построения дерева и без
+передачи таблицы: символы, которых не было при обучении, передаются
+escape-кодом и следующим за ним значением символа фиксированной длины.
+"""
+from collections import OrderedDict
+
+from infotheory.canonical import canonical_codes
+from infotheory.huffman_table import TableDecoder
+from infotheory.huffman_tree import huffman_code_lengths, limited_code_lengths
+
+DEFAULT_CAPACITY = 128
+
+TEXT_RAW_BITS = 21  # достаточно для любого символа Unicode (до 0x10FFFF)
+BYTE_RAW_BITS = 8
+
+
+class CodebookCache:
+    """
+    LRU-кэш кодов Хаффмана по гистограмме частот и реестр именованных словарей.
+
+    Атрибуты:
+        capacity (int): Максимальное число кэшируемых гистограмм.
+        hits (int): Число попаданий в кэш и в словари.
+        misses (int): Число промахов.
+        dictionaries (dict): Имя -> StaticCodebook.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        """
+        Создаёт пустой кэш.
+
+        Args:
+            capacity (int): Максимальное число кэшируемых гистограмм.
+        """
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.dictionaries = {}
+        self._entries = OrderedDict()
+
+    def get(self, frequencies, max_code_length=None):
+        """
+        Возвращает коды для гистограммы, строя их только при промахе.
+
+        Возвращаемые словари общие для всех обращений и не должны изменяться.
+
+        Args:
+            frequencies (dict): Словарь символ -> частота.
+            max_code_length (int): Ограничение длины кода; None - без ограничения.
+
+        Returns:
+            tuple: (словарь символ -> длина кода, словарь символ -> код).
+        """
+        key = (max_code_length, frozenset(frequencies.items()))
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        if max_code_length is not None:
+            code_lengths = limited_code_lengths(frequencies, max_code_length)
+        else:
+            code_lengths = huffman_code_lengths(frequencies)
+        entry = (code_lengths, canonical_codes(code_lengths))
+        self._entries[key] = entry
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+        return entry
+
+    def add_dictionary(self, name, codebook):
+        """
+        Регистрирует обученную кодовую книгу под именем.
+
+        Args:
+            name (str): Имя словаря.
+            codebook (StaticCodebook): Кодовая книга.
+        """
+        self.dictionaries[name] = codebook
+
+    def dictionary(self, name):
+        """
+        Возвращает именованную кодовую книгу.
+
+        Args:
+            name (str): Имя словаря.
+
+        Returns:
+            StaticCodebook: Кодовая книга.
+
+        Raises:
+            KeyError: Если словарь с таким именем не зарегистрирован.
+        """
+        codebook = self.dictionaries.get(name)
+        if codebook is None:
+            self.misses += 1
+            raise KeyError(f"Словарь кодов '{name}' не зарегистрирован")
+        self.hits += 1
+        return codebook
+
+    def stats(self):
+        """
+        Возвращает счётчики кэша.
+
+        Returns:
+            dict: Попадания ('hits'), промахи ('misses'), доля попаданий
+                ('hit_ratio'), число кэшированных гистограмм ('size') и
+                число словарей ('dictionaries').
+        """
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / total if total else 0.0,
+            'size': len(self._entries),
+            'dictionaries': len(self.dictionaries),
+        }
+
+
+class StaticCodebook:
+    """
+    Обученная заранее кодовая книга с escape-кодом.
+
+    Символы - целые числа (ord() для текста или значения байтов). Escape-
+    символ равен 1 << raw_bits, то есть не совпадает ни с одним символом,
+    значение которого помещается в raw_bits бит.
+
+    Атрибуты:
+        code_lengths (dict): Целочисленный символ -> длина кода, включая escape.
+        raw_bits (int): Число бит значения символа после escape-кода.
+        escape (int): Escape-символ.
+        codes (dict): Целочисленный символ -> код в виде строки из '0'/'1'.
+    """
+
+    def __init__(self, code_lengths, raw_bits=TEXT_RAW_BITS):
+        """
+        Восстанавливает кодовую книгу по длинам кодов.
+
+        Args:
+            code_lengths (dict): Целочисленный символ -> длина кода, включая escape.
+            raw_bits (int): Число бит значения символа после escape-кода.
+
+        Raises:
+            ValueError: Если в таблице нет escape-символа.
+        """
+        self.code_lengths = code_lengths
+        self.raw_bits = raw_bits
+        self.escape = 1 << raw_bits
+        if self.escape not in code_lengths:
+            raise ValueError("В кодовой книге нет escape-кода")
+        self.codes = canonical_codes(code_lengths)
+        self._decoder = None
+        self._entries = None
+
+    @classmethod
+    def train(cls, frequencies, raw_bits=TEXT_RAW_BITS, max_code_length=None):
+        """
+        Обучает кодовую книгу по частотам обучающих данных.
+
+        Escape-символу назначается частота 1, как самому редкому символу.
+
+        Args:
+            frequencies (dict): Целочисленный символ -> частота.
+            raw_bits (int): Число бит значения символа после escape-кода.
+            max_code_length (int): Ограничение длины кода; None - без ограничения.
+
+        Returns:
+            StaticCodebook: Обученная кодовая книга.
+        """
+        frequencies = dict(frequencies)
+        frequencies[1 << raw_bits] = 1
+        if max_code_length is not None:
+            code_lengths = limited_code_lengths(frequencies, max_code_length)
+        else:
+            code_lengths = huffman_code_lengths(frequencies)
+        return cls(code_lengths, raw_bits)
+
+    def encode(self, symbols):
+        """
+        Кодирует последовательность символов.
+
+        Args:
+            symbols (iterable): Целочисленные символы.
+
+        Returns:
+            str: Закодированные данные в виде строки из '0'/'1'.
+        """
+        codes = self.codes
+        escape_code = codes[self.escape]
+        raw_format = f'0{self.raw_bits}b'
+        return ''.join([codes[symbol] if symbol in codes
+                        else escape_code + format(symbol, raw_format)
+                        for symbol in symbols])
+
+    def decode(self, bits, symbol_count=None):
+        """
+        Декодирует строку из '0'/'1', полученную методом encode.
+
+        Args:
+            bits (str): Закодированные данные.
+            symbol_count (int): Число символов; None - до конца строки.
+
+        Returns:
+            list: Целочисленные символы.
+
+        Raises:
+            ValueError: Если данные обрываются посреди значения после escape-кода.
+        """
+        decoder, entries = self._tables()
+        window = decoder.lookup_bits
+        escape = self.escape
+        raw_bits = self.raw_bits
+        symbols = []
+        position = 0
+        bit_count = len(bits)
+        while position < bit_count:
+            if symbol_count is not None and len(symbols) >= symbol_count:
+                break
+            piece = bits[position:position + window]
+            index = int(piece.ljust(window, '0'), 2)
+            run, used = entries[index]
+            if not used:
+                run, used = self._decode_long(decoder, bits, position)
+            elif used > len(piece):
+                # Конец строки: окно дополнено нулями, берётся только первый код
+                used = decoder.lengths[index]
+                run = (decoder.symbols[index],)
+            if not used or position + used > bit_count:
+                # Незавершённый код в конце строки игнорируется
+                break
+            symbols.extend(run)
+            position += used
+            if run[-1] == escape:
+                if symbol_count is not None and len(symbols) > symbol_count:
+                    break
+                if position + raw_bits > bit_count:
+                    raise ValueError("Данные обрываются после escape-кода")
+                symbols[-1] = int(bits[position:position + raw_bits], 2)
+                position += raw_bits
+        return symbols if symbol_count is None else symbols[:symbol_count]
+
+    def _tables(self):
+        """
+        Табличный декодер кодовой книги, построенный при первом декодировании.
+
+        Записи окна обрываются после escape-кода, потому что за ним следует
+        значение символа, а не очередной код.
+
+        Returns:
+            tuple: (TableDecoder, список пар (символы, число занятых бит)).
+        """
+        if self._decoder is None:
+            decoder = TableDecoder(self.codes)
+            entries = []
+            for run, used in decoder.entries:
+                if self.escape in run:
+                    run = run[:run.index(self.escape) + 1]
+                    used = sum(map(self.code_lengths.__getitem__, run))
+                entries.append((run, used))
+            self._decoder, self._entries = decoder, entries
+        return self._decoder, self._entries
+
+    @staticmethod
+    def _decode_long(decoder, bits, position):
+        """Код длиннее окна основной таблицы: (символы, длина); ((), 0), если кода нет."""
+        for length in range(decoder.lookup_bits + 1, decoder.max_length + 1):
+            table = decoder.long_codes.get(length)
+            if table and position + length <= len(bits):
+                symbol = table.get(int(bits[position:position + length], 2))
+                if symbol is not None:
+                    return (symbol,), length
+        return (), 0
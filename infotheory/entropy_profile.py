@@ -0,0 +1,151 @@
+"""
+Профиль энтропии файла по блокам или по скользящему окну.
+
+Файл читается потоком байтов, поэтому размер файла не ограничен памятью:
+в памяти находится только текущее окно. Для окна поддерживаются счётчики
+байтов и сумма S = sum(c * log2(c)), так что энтропия окна из n байт
+равна log2(n) - S / n. При сдвиге окна на step байт сумма поправляется
+только для байтов, чьи счётчики изменились (не больше 256 значений),
+а не пересчитывается по всему окну.
+
+Избыточность считается относительно 8 бит на байт: близкие к нулю
+значения указывают на уже сжатые или случайные данные.
+"""
+import csv
+import json
+from collections import Counter, namedtuple
+from math import log2
+
+BYTE_BITS = 8
+DEFAULT_WINDOW = 64 * 1024
+PROFILE_FORMATS = ('csv', 'json')
+
+ProfileRow = namedtuple('ProfileRow', ['offset', 'length', 'entropy', 'redundancy'])
+
+
+def _xlogx(count):
+    return count * log2(count) if count > 1 else 0.0
+
+
+class WindowEntropy:
+    """
+    Энтропия мультимножества байтов с обновлением при добавлении и удалении.
+
+    Атрибуты:
+        counts (list): Счётчики 256 значений байта.
+        length (int): Число байтов в окне.
+    """
+
+    def __init__(self):
+        """Создаёт пустое окно."""
+        self.counts = [0] * 256
+        self.length = 0
+        self._sum = 0.0  # sum(c * log2(c)) по всем счётчикам
+
+    def update(self, data, sign=1):
+        """
+        Добавляет (sign=1) или удаляет (sign=-1) байты из окна.
+
+        Args:
+            data (bytes): Байты.
+            sign (int): Направление изменения.
+        """
+        counts = self.counts
+        total = self._sum
+        for byte, count in Counter(data).items():
+            old = counts[byte]
+            new = old + sign * count
+            total += _xlogx(new) - _xlogx(old)
+            counts[byte] = new
+        self._sum = total
+        self.length += sign * len(data)
+
+    @property
+    def entropy(self):
+        """Энтропия Шеннона окна в битах на байт."""
+        if not self.length:
+            return 0.0
+        # Ошибки округления накопленной суммы не должны давать отрицательную энтропию
+        return max(0.0, log2(self.length) - self._sum / self.length)
+
+    @property
+    def redundancy(self):
+        """Избыточность окна относительно BYTE_BITS бит на байт."""
+        return 1 - self.entropy / BYTE_BITS
+
+
+def profile_stream(file, window=DEFAULT_WINDOW, step=None):
+    """
+    Профиль энтропии потока байтов.
+
+    Args:
+        file: Двоичный файл, открытый для чтения.
+        window (int): Размер окна в байтах.
+        step (int): Сдвиг окна; None - окно равно блоку (step = window).
+
+    Yields:
+        ProfileRow: Смещение окна, его длина, энтропия и избыточность.
+
+    Raises:
+        ValueError: Если размер окна или шаг не положительны.
+    """
+    step = step or window
+    if window < 1 or step < 1:
+        raise ValueError("Размер окна и шаг должны быть положительными")
+    counter = WindowEntropy()
+    buffer = bytearray(file.read(window))
+    counter.update(buffer)
+    end = len(buffer)
+    if buffer:
+        yield ProfileRow(0, counter.length, counter.entropy, counter.redundancy)
+    while True:
+        incoming = file.read(step)
+        if not incoming:
+            return
+        end += len(incoming)
+        # Окно сдвигается на длину прочитанного; при step >= window окно заполняется заново,
+        # так что последний блок может быть короче окна
+        removed = len(buffer) if step >= window else len(incoming)
+        counter.update(bytes(buffer[:removed]), -1)
+        del buffer[:removed]
+        if len(incoming) > window:
+            incoming = incoming[-window:]
+        counter.update(incoming)
+        buffer += incoming
+        yield ProfileRow(end - len(buffer), counter.length, counter.entropy, counter.redundancy)
+
+
+def write_profile(rows, file, output_format='csv'):
+    """
+    Запись профиля в текстовый файл по мере получения строк.
+
+    Args:
+        rows (iterable): Строки ProfileRow.
+        file: Текстовый файл, открытый для записи.
+        output_format (str): 'csv' или 'json' (массив объектов).
+
+    Returns:
+        int: Число записанных строк.
+
+    Raises:
+        ValueError: Если формат не поддерживается.
+    """
+    if output_format not in PROFILE_FORMATS:
+        raise ValueError(f"Неподдерживаемый формат профиля: {output_format}")
+    count = 0
+    if output_format == 'csv':
+        writer = csv.writer(file, lineterminator='\n')
+        writer.writerow(ProfileRow._fields)
+        for row in rows:
+            writer.writerow((row.offset, row.length, f'{row.entropy:.6f}', f'{row.redundancy:.6f}'))
+            count += 1
+        return count
+    file.write('[')
+    for row in rows:
+        file.write(',\n' if count else '\n')
+        file.write(json.dumps({'offset': row.offset, 'length': row.length,
+                               'entropy': round(row.entropy, 6),
+                               'redundancy': round(row.redundancy, 6)}))
+        count += 1
+    file.write('\n]\n')
+    return count
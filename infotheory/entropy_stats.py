@@ -0,0 +1,138 @@
+"""
+Статистики источника за один проход: мощность алфавита, энтропия Хартли
+и Шеннона, избыточность, средняя длина кода и степень сжатия.
+
+Частоты считает Counter на уровне C - по частям для больших файлов.
+Фильтр букв (str.lower() и isalpha) применяется к части целиком и к
+символам алфавита, а не к каждому знаку текста, поэтому второй проход
+для мощности алфавита не нужен.
+"""
+import os
+from collections import Counter, namedtuple
+from math import log2
+
+DEFAULT_CHUNK_SIZE = 1 << 20  # размер части файла при подсчёте частот
+
+Statistics = namedtuple('Statistics', ['symbol_count', 'alphabet_size', 'hartley', 'shannon',
+                                       'redundancy', 'average_code_length', 'compression_ratio'])
+
+
+def count_symbols(chunks, letters_only=False, frequency=None):
+    """
+    Подсчёт частот символов по частям данных.
+
+    Args:
+        chunks (iterable): Части текста (str) или двоичных данных (bytes).
+        letters_only (bool): Учитывать только буквы без учёта регистра (для текста).
+        frequency (Counter): Счётчик для накопления; None - новый.
+
+    Returns:
+        Counter: Символ -> число вхождений.
+    """
+    if frequency is None:
+        frequency = Counter()
+    for chunk in chunks:
+        frequency.update(chunk.lower() if letters_only else chunk)
+    if letters_only:
+        for symbol in [symbol for symbol in frequency if not symbol.isalpha()]:
+            del frequency[symbol]
+    return frequency
+
+
+def shannon_entropy(frequency):
+    """Энтропия Шеннона (бит на символ) по таблице частот; 0 для пустой таблицы."""
+    total = sum(frequency.values())
+    if not total:
+        return 0.0
+    return log2(total) - sum(count * log2(count) for count in frequency.values() if count) / total
+
+
+def hartley_entropy(alphabet_size):
+    """Энтропия Хартли log2(N); 0 для пустого алфавита."""
+    return log2(alphabet_size) if alphabet_size else 0.0
+
+
+def redundancy(alphabet_size, entropy):
+    """Избыточность 1 - H / log2(N); 0 для алфавита из одного символа."""
+    return 1 - entropy / log2(alphabet_size) if alphabet_size > 1 else 0.0
+
+
+def frequency_statistics(frequency, code_lengths=None, original_size=None, encoded_size=None):
+    """
+    Все статистики по готовой таблице частот.
+
+    Args:
+        frequency (dict): Символ -> число вхождений.
+        code_lengths (dict): Символ -> длина кода; None - средняя длина не считается.
+        original_size (int): Размер исходных данных в байтах.
+        encoded_size (int): Размер сжатых данных в байтах; степень сжатия
+            считается, если заданы оба размера.
+
+    Returns:
+        Statistics: Число символов, мощность алфавита, энтропии Хартли и
+            Шеннона, избыточность, средняя длина кода (или None) и степень
+            сжатия (или None).
+    """
+    symbol_count = sum(frequency.values())
+    alphabet_size = sum(1 for count in frequency.values() if count)
+    shannon = shannon_entropy(frequency)
+    average_code_length = None
+    if code_lengths is not None:
+        average_code_length = (sum(code_lengths[symbol] * count
+                                   for symbol, count in frequency.items() if count) / symbol_count
+                               if symbol_count else 0.0)
+    compression_ratio = None
+    if original_size is not None and encoded_size:
+        compression_ratio = original_size / encoded_size
+    return Statistics(symbol_count, alphabet_size, hartley_entropy(alphabet_size), shannon,
+                      redundancy(alphabet_size, shannon), average_code_length, compression_ratio)
+
+
+def text_statistics(text, letters_only=False, code_lengths=None, encoded_size=None):
+    """
+    Статистики текста или двоичных данных, уже находящихся в памяти.
+
+    Размер исходных данных для степени сжатия - длина в кодировке UTF-8
+    для текста и длина для bytes.
+
+    Args:
+        text (str | bytes): Данные.
+        letters_only (bool): Учитывать только буквы без учёта регистра.
+        code_lengths (dict): Символ -> длина кода.
+        encoded_size (int): Размер сжатых данных в байтах.
+
+    Returns:
+        Statistics: См. frequency_statistics.
+    """
+    original_size = None
+    if encoded_size is not None:
+        original_size = len(text.encode('utf-8')) if isinstance(text, str) else len(text)
+    return frequency_statistics(count_symbols((text,), letters_only), code_lengths,
+                                original_size, encoded_size)
+
+
+def file_statistics(path, letters_only=False, binary=False, code_lengths=None,
+                    encoded_size=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Статистики файла, прочитанного по частям.
+
+    Args:
+        path (str): Путь к файлу (текст в UTF-8 или любые данные при binary).
+        letters_only (bool): Учитывать только буквы без учёта регистра.
+        binary (bool): Считать байты вместо символов Unicode.
+        code_lengths (dict): Символ -> длина кода.
+        encoded_size (int): Размер сжатых данных в байтах.
+        chunk_size (int): Размер части файла.
+
+    Returns:
+        Statistics: См. frequency_statistics.
+    """
+    if binary:
+        file = open(path, 'rb')
+    else:
+        file = open(path, 'r', encoding='utf-8', newline='')
+    with file:
+        frequency = count_symbols(iter(lambda: file.read(chunk_size), b'' if binary else ''),
+                                  letters_only)
+    original_size = os.path.getsize(path) if encoded_size is not None else None
+    return frequency_statistics(frequency, code_lengths, original_size, encoded_size)
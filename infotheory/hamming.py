@@ -0,0 +1,443 @@
+"""
+Код Хэмминга над целыми числами.
+
+Кодовое слово хранится как целое число: позиция p (нумерация с 1, как в
+классической записи кода) - бит p - 1. Контрольный бит 2 ** i проверяет
+позиции, в номере которых установлен бит i, поэтому его значение - чётность
+числа единиц в codeword & mask_i, а синдром - сумма 2 ** i по группам с
+нечётной чётностью. Вместо суммирования символов '0'/'1' по срезам каждая
+проверка выполняется одной операцией AND и int.bit_count().
+
+Биты данных занимают позиции между степенями двойки, то есть отрезки
+2 ** i + 1 .. 2 ** (i + 1) - 1, и переносятся в кодовое слово и обратно
+сдвигами целых отрезков, а не по одному биту.
+
+Hamming кодирует всю строку одним кодовым словом (как прежние классы
+лабораторных работ), при extended - с битом общей чётности в конце;
+BlockCode - коды фиксированной длины, например (7, 4), (15, 11) и
+(72, 64) с дополнительным битом общей чётности (SECDED).
+
+В блочном режиме (encode_blocks / decode_blocks) сообщение делится на
+независимые блоки такого кода: число контрольных бит на блок постоянно,
+ошибка исправляется в каждом блоке отдельно, а пакеты блоков можно
+обрабатывать параллельно в нескольких процессах.
+"""
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+# Результат декодирования блока
+NO_ERROR = 0
+CORRECTED = 1
+DETECTED = 2  # обнаружена неисправимая ошибка
+
+LENGTH_BITS = 64  # длина сообщения в начале блочного потока
+BATCH_BLOCKS = 8192  # блоков в задаче одного процесса
+
+BlockReport = namedtuple('BlockReport', ['block', 'status', 'syndrome'])
+
+
+def bits_to_int(bits):
+    """Строка '0'/'1' -> целое, первый символ - младший бит."""
+    return int(bits[::-1], 2) if bits else 0
+
+
+def int_to_bits(value, length):
+    """Целое -> строка '0'/'1' длины length, младший бит - первый символ."""
+    return format(value, f'0{length}b')[::-1] if length else ''
+
+
+def check_bit_count(data_bits):
+    """Число контрольных бит r - наименьшее, при котором 2 ** r >= data_bits + r + 1."""
+    r = 0
+    while (1 << r) < data_bits + r + 1:
+        r += 1
+    return r
+
+
+@lru_cache(maxsize=None)
+def parity_masks(length):
+    """
+    Маски групп проверки для кодового слова длины length.
+
+    Returns:
+        tuple: mask_i для i = 0 .. length.bit_length() - 1.
+    """
+    masks = []
+    for i in range(length.bit_length()):
+        step = 1 << i
+        # Позиции 0..2 * step - 1: step нулей, затем step единиц; повторяем удвоением
+        mask = ((1 << step) - 1) << step
+        period = 2 * step
+        while period <= length:
+            mask |= mask << period
+            period *= 2
+        masks.append((mask >> 1) & ((1 << length) - 1))
+    return tuple(masks)
+
+
+@lru_cache(maxsize=None)
+def data_segments(length):
+    """
+    Отрезки позиций данных в кодовом слове длины length.
+
+    Returns:
+        tuple: Тройки (начало в данных, начало в кодовом слове, маска длины)
+            для отрезков между контрольными позициями.
+    """
+    segments = []
+    data_start = 0
+    i = 1
+    while (1 << i) < length:
+        start = (1 << i) + 1
+        end = min((1 << (i + 1)) - 1, length)
+        size = end - start + 1
+        segments.append((data_start, start - 1, (1 << size) - 1))
+        data_start += size
+        i += 1
+    return tuple(segments)
+
+
+def scatter(data, length):
+    """Размещение бит данных на позициях данных кодового слова."""
+    code = 0
+    for data_start, code_start, mask in data_segments(length):
+        code |= ((data >> data_start) & mask) << code_start
+    return code
+
+
+def gather(code, length):
+    """Извлечение бит данных из кодового слова."""
+    data = 0
+    for data_start, code_start, mask in data_segments(length):
+        data |= ((code >> code_start) & mask) << data_start
+    return data
+
+
+def syndrome(code, length):
+    """Синдром кодового слова: 0 или номер позиции одиночной ошибки."""
+    value = 0
+    for i, mask in enumerate(parity_masks(length)):
+        value |= ((code & mask).bit_count() & 1) << i
+    return value
+
+
+def data_bit_count(length):
+    """Число бит данных в кодовом слове длины length; None - такой длины у кода нет."""
+    data_bits = length - length.bit_length()
+    return data_bits if data_bits + check_bit_count(data_bits) == length else None
+
+
+def correct(code, hamming_length, extended=False):
+    """
+    Исправление одиночной ошибки в кодовом слове.
+
+    Args:
+        code (int): Кодовое слово; при extended бит hamming_length - общая чётность.
+        hamming_length (int): Длина кода Хэмминга без бита общей чётности.
+        extended (bool): Есть ли бит общей чётности (SECDED).
+
+    Returns:
+        tuple: (исправленное слово, NO_ERROR | CORRECTED | DETECTED, синдром).
+            Синдром вне слова (возможен при кратных ошибках и в укороченных
+            кодах) означает неисправимую ошибку, а не индекс для исправления.
+    """
+    error_pos = syndrome(code, hamming_length)
+    status = NO_ERROR
+    if extended and code.bit_count() & 1:
+        # Нечётное число ошибок: одиночная, если её позиция внутри слова
+        if not error_pos:
+            code ^= 1 << hamming_length
+            status = CORRECTED
+        elif error_pos <= hamming_length:
+            code ^= 1 << (error_pos - 1)
+            status = CORRECTED
+        else:
+            status = DETECTED
+    elif error_pos:
+        if not extended and error_pos <= hamming_length:
+            code ^= 1 << (error_pos - 1)
+            status = CORRECTED
+        else:
+            # Для SECDED чётное число ошибок при ненулевом синдроме - двойная ошибка
+            status = DETECTED
+    return code, status, error_pos
+
+
+def encode_int(data, data_bits):
+    """
+    Кодирование целого из data_bits бит одним кодовым словом.
+
+    Returns:
+        tuple: (кодовое слово, его длина).
+    """
+    length = data_bits + check_bit_count(data_bits)
+    code = scatter(data, length)
+    for i, mask in enumerate(parity_masks(length)):
+        # Контрольная позиция 2 ** i входит только в свою группу
+        code |= ((code & mask).bit_count() & 1) << ((1 << i) - 1)
+    return code, length
+
+
+class Hamming:
+    """Класс для кодирования и декодирования данных методом Хэмминга."""
+
+    def __init__(self, extended=False):
+        """
+        Args:
+            extended (bool): Добавлять бит общей чётности (SECDED): одиночная
+                ошибка исправляется, двойная - обнаруживается.
+        """
+        self.extended = extended
+
+    def encode(self, data):
+        """Кодирует данные методом Хэмминга.
+
+        Добавляет контрольные биты к входным данным для обеспечения возможности
+        обнаружения и исправления одиночных ошибок.
+
+        Args:
+            data (str): Входные данные для кодирования, представленные в виде строки из битов.
+
+        Returns:
+            str: Закодированные данные, содержащие исходные и контрольные биты.
+        """
+        code, length = encode_int(bits_to_int(data), len(data))
+        if self.extended:
+            code |= (code.bit_count() & 1) << length
+            length += 1
+        return int_to_bits(code, length)
+
+    def decode(self, encoded_data):
+        """Декодирует данные, закодированные методом Хэмминга.
+
+        Проверяет наличие ошибок в закодированных данных, исправляет одиночные ошибки
+        и восстанавливает исходные данные.
+
+        Args:
+            encoded_data (str): Закодированные данные, представленные в виде строки из битов.
+
+        Returns:
+            str: Декодированные данные без контрольных битов.
+
+        Raises:
+            ValueError: Если кодовых слов такой длины не бывает.
+        """
+        return self.decode_with_status(encoded_data)[0]
+
+    def decode_with_status(self, encoded_data):
+        """Декодирует данные и сообщает, была ли ошибка исправлена или только обнаружена.
+
+        Args:
+            encoded_data (str): Закодированные данные, представленные в виде строки из битов.
+
+        Returns:
+            tuple: (декодированные данные, NO_ERROR | CORRECTED | DETECTED, синдром).
+
+        Raises:
+            ValueError: Если кодовых слов такой длины не бывает.
+        """
+        hamming_length = len(encoded_data) - self.extended
+        data_bits = data_bit_count(hamming_length) if hamming_length >= 0 else None
+        if data_bits is None:
+            raise ValueError(f"Недопустимая длина кодового слова Хэмминга: {len(encoded_data)}")
+        code, status, error_pos = correct(bits_to_int(encoded_data), hamming_length, self.extended)
+        return int_to_bits(gather(code, hamming_length), data_bits), status, error_pos
+
+
+class BlockCode:
+    """
+    Код Хэмминга фиксированной длины, при extended - с битом общей чётности.
+
+    Бит общей чётности записывается старшим битом кодового слова. Для
+    укороченных кодов (например, (72, 64): 64 бита данных, 7 контрольных и
+    бит общей чётности) синдром вне кодового слова означает неисправимую ошибку.
+
+    Атрибуты:
+        data_bits (int): Число бит данных k.
+        extended (bool): Есть ли бит общей чётности (SECDED).
+        hamming_length (int): Длина кода Хэмминга без бита общей чётности.
+        length (int): Длина кодового слова n.
+    """
+
+    def __init__(self, data_bits, extended=False):
+        """
+        Args:
+            data_bits (int): Число бит данных в блоке.
+            extended (bool): Добавлять бит общей чётности.
+
+        Raises:
+            ValueError: Если число бит данных не положительно.
+        """
+        if data_bits < 1:
+            raise ValueError("Число бит данных в блоке должно быть положительным")
+        self.data_bits = data_bits
+        self.extended = extended
+        self.hamming_length = data_bits + check_bit_count(data_bits)
+        self.length = self.hamming_length + extended
+        self._masks = parity_masks(self.hamming_length)
+        self._segments = data_segments(self.hamming_length)
+
+    def __repr__(self):
+        return f'BlockCode({self.data_bits}, extended={self.extended})'
+
+    def encode(self, data):
+        """Кодовое слово для целого из data_bits бит."""
+        code = 0
+        for data_start, code_start, mask in self._segments:
+            code |= ((data >> data_start) & mask) << code_start
+        for i, mask in enumerate(self._masks):
+            code |= ((code & mask).bit_count() & 1) << ((1 << i) - 1)
+        if self.extended:
+            code |= (code.bit_count() & 1) << self.hamming_length
+        return code
+
+    def decode(self, code):
+        """
+        Декодирование кодового слова с исправлением одиночной ошибки.
+
+        Returns:
+            tuple: (данные, NO_ERROR | CORRECTED | DETECTED, синдром).
+        """
+        code, status, error_pos = correct(code, self.hamming_length, self.extended)
+        data = 0
+        for data_start, code_start, mask in self._segments:
+            data |= ((code >> code_start) & mask) << data_start
+        return data, status, error_pos
+
+    def encode_many(self, words):
+        """Кодирование последовательности блоков данных (целых)."""
+        encode = self.encode
+        return [encode(word) for word in words]
+
+    def decode_many(self, codes):
+        """
+        Декодирование последовательности кодовых слов.
+
+        Returns:
+            tuple: (список данных, список состояний NO_ERROR | CORRECTED | DETECTED).
+        """
+        words = []
+        statuses = []
+        for code in codes:
+            word, status, _ = self.decode(code)
+            words.append(word)
+            statuses.append(status)
+        return words, statuses
+
+    def encode_bits(self, bits):
+        """
+        Кодирование строки '0'/'1' блоками по data_bits бит.
+
+        Последний неполный блок дополняется нулями.
+
+        Returns:
+            str: Кодовые слова подряд, по length символов.
+        """
+        k = self.data_bits
+        bits += '0' * (-len(bits) % k)
+        words = [int(bits[start:start + k][::-1], 2) for start in range(0, len(bits), k)]
+        return ''.join(int_to_bits(code, self.length) for code in self.encode_many(words))
+
+    def decode_bits(self, bits):
+        """
+        Декодирование строки кодовых слов, записанной encode_bits.
+
+        Returns:
+            tuple: (строка данных (с дополнением последнего блока),
+                список состояний блоков).
+
+        Raises:
+            ValueError: Если длина строки не кратна длине кодового слова.
+        """
+        n = self.length
+        if len(bits) % n:
+            raise ValueError(f"Длина закодированных данных не кратна {n}")
+        codes = [int(bits[start:start + n][::-1], 2) for start in range(0, len(bits), n)]
+        words, statuses = self.decode_many(codes)
+        return ''.join(int_to_bits(word, self.data_bits) for word in words), statuses
+
+
+HAMMING_7_4 = BlockCode(4)
+HAMMING_15_11 = BlockCode(11)
+SECDED_72_64 = BlockCode(64, extended=True)
+
+
+def _encode_batch(code, bits):
+    return code.encode_bits(bits)
+
+
+def _decode_batch(code, bits):
+    n = code.length
+    codes = [int(bits[start:start + n][::-1], 2) for start in range(0, len(bits), n)]
+    data = []
+    reports = []
+    for block, value in enumerate(codes):
+        word, status, error_pos = code.decode(value)
+        data.append(int_to_bits(word, code.data_bits))
+        if status != NO_ERROR:
+            reports.append(BlockReport(block, status, error_pos))
+    return ''.join(data), reports
+
+
+def _map_batches(function, code, bits, batch_bits, workers):
+    """Применение function к пакетам блоков по порядку, при workers != 1 - в пуле процессов."""
+    batches = [bits[start:start + batch_bits] for start in range(0, len(bits), batch_bits)]
+    if workers == 1 or len(batches) < 2:
+        return [function(code, batch) for batch in batches]
+    with ProcessPoolExecutor(workers) as pool:
+        return list(pool.map(function, [code] * len(batches), batches))
+
+
+def encode_blocks(bits, code=SECDED_72_64, workers=1):
+    """
+    Блочное кодирование строки '0'/'1'.
+
+    Перед данными записывается их длина (LENGTH_BITS бит), последний блок
+    дополняется нулями; всё это кодируется блоками code независимо.
+
+    Args:
+        bits (str): Данные.
+        code (BlockCode): Код блока.
+        workers (int): Число процессов; None - по числу ядер.
+
+    Returns:
+        str: Кодовые слова блоков подряд.
+    """
+    bits = int_to_bits(len(bits), LENGTH_BITS) + bits
+    bits += '0' * (-len(bits) % code.data_bits)
+    return ''.join(_map_batches(_encode_batch, code, bits, BATCH_BLOCKS * code.data_bits, workers))
+
+
+def decode_blocks(encoded, code=SECDED_72_64, workers=1):
+    """
+    Декодирование результата encode_blocks с отчётом по блокам.
+
+    Args:
+        encoded (str): Кодовые слова блоков подряд.
+        code (BlockCode): Код блока.
+        workers (int): Число процессов; None - по числу ядер.
+
+    Returns:
+        tuple: (данные, список BlockReport для блоков с исправленной или
+            обнаруженной ошибкой; номера блоков считаются с 0).
+
+    Raises:
+        ValueError: Если длина не кратна длине блока или поле длины
+            повреждено.
+    """
+    if len(encoded) % code.length:
+        raise ValueError(f"Длина закодированных данных не кратна {code.length}")
+    batch_bits = BATCH_BLOCKS * code.length
+    data = []
+    reports = []
+    for batch, (bits, batch_reports) in enumerate(
+            _map_batches(_decode_batch, code, encoded, batch_bits, workers)):
+        data.append(bits)
+        reports.extend(report._replace(block=report.block + batch * BATCH_BLOCKS)
+                       for report in batch_reports)
+    data = ''.join(data)
+    length = bits_to_int(data[:LENGTH_BITS])
+    if len(data) < LENGTH_BITS or length > len(data) - LENGTH_BITS:
+        raise ValueError("Поле длины блочного потока повреждено")
+    return data[LENGTH_BITS:LENGTH_BITS + length], reports
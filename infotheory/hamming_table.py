@@ -0,0 +1,142 @@
+"""
+Табличное кодирование и декодирование коротких блочных кодов Хэмминга.
+
+Для кода длины до MAX_TABLE_BITS бит заранее вычисляются таблицы
+данные -> кодовое слово и кодовое слово -> исправленные данные, состояние
+и синдром, поэтому кодирование и декодирование блока - одно обращение к
+таблице без вычисления чётностей.
+
+Для кодов над полубайтом с кодовым словом не длиннее байта, например
+(7, 4) и SECDED (8, 4), буфер байтов обрабатывается целиком: каждый
+байт данных даёт два кодовых слова (младший и старший полубайт), таблицы
+из 256 значений применяются через bytes.translate, а полубайты
+декодированных данных объединяются одной операцией OR над целыми. Все
+проходы по буферу выполняются на уровне C.
+"""
+import re
+
+from infotheory.hamming import NO_ERROR, BlockCode, BlockReport
+
+MAX_TABLE_BITS = 16
+BYTE_VALUES = 256
+NIBBLE_BITS = 4
+
+ERROR_PATTERN = re.compile(b'[^\\x00]')  # позиции кодовых слов с ошибками
+
+SECDED_8_4 = BlockCode(NIBBLE_BITS, extended=True)
+
+
+class TableCode:
+    """
+    Таблицы кодирования и синдромного декодирования для блочного кода.
+
+    Атрибуты:
+        code (BlockCode): Код блока.
+        encode_table (list): Данные -> кодовое слово.
+        decode_table (list): Кодовое слово -> исправленные данные.
+        status_table (bytes): Кодовое слово -> NO_ERROR | CORRECTED | DETECTED.
+        syndrome_table (list): Кодовое слово -> синдром.
+    """
+
+    def __init__(self, code=SECDED_8_4):
+        """
+        Строит таблицы по всем словам данных и всем возможным кодовым словам.
+
+        Args:
+            code (BlockCode): Код блока длиной не больше MAX_TABLE_BITS бит.
+
+        Raises:
+            ValueError: Если код слишком длинный для таблиц.
+        """
+        if code.length > MAX_TABLE_BITS:
+            raise ValueError(f"Табличный код ограничен длиной {MAX_TABLE_BITS} бит")
+        self.code = code
+        self.encode_table = [code.encode(word) for word in range(1 << code.data_bits)]
+        decoded = [code.decode(value) for value in range(1 << code.length)]
+        self.decode_table = [word for word, _, _ in decoded]
+        self.status_table = bytes(status for _, status, _ in decoded)
+        self.syndrome_table = [error_pos for _, _, error_pos in decoded]
+
+        self.byte_codec = code.data_bits == NIBBLE_BITS and code.length <= 8
+        if self.byte_codec:
+            # Таблицы bytes.translate: байт данных -> кодовое слово полубайта,
+            # байт кодового слова (лишние старшие биты не учитываются) -> полубайт
+            mask = (1 << code.length) - 1
+            self._encode_low = bytes(self.encode_table[byte & 0x0F] for byte in range(BYTE_VALUES))
+            self._encode_high = bytes(self.encode_table[byte >> 4] for byte in range(BYTE_VALUES))
+            self._decode_low = bytes(self.decode_table[byte & mask] for byte in range(BYTE_VALUES))
+            self._decode_high = bytes(self.decode_table[byte & mask] << 4
+                                      for byte in range(BYTE_VALUES))
+            self._status = bytes(self.status_table[byte & mask] for byte in range(BYTE_VALUES))
+            self._valid = bytes(self.encode_table)
+
+    def encode_words(self, words):
+        """Кодовые слова для последовательности слов данных."""
+        return list(map(self.encode_table.__getitem__, words))
+
+    def decode_words(self, codes):
+        """
+        Декодирование последовательности кодовых слов по таблицам.
+
+        Returns:
+            tuple: (список данных, список BlockReport для блоков с ошибками).
+        """
+        codes = list(codes)
+        status_table = self.status_table
+        reports = [BlockReport(block, status_table[value], self.syndrome_table[value])
+                   for block, value in enumerate(codes) if status_table[value] != NO_ERROR]
+        return list(map(self.decode_table.__getitem__, codes)), reports
+
+    def encode_bytes(self, data):
+        """
+        Кодирование буфера: два байта кодовых слов на байт данных.
+
+        Args:
+            data (bytes): Данные.
+
+        Returns:
+            bytes: Кодовые слова младшего и старшего полубайта каждого байта.
+
+        Raises:
+            ValueError: Если код не полубайтовый.
+        """
+        if not self.byte_codec:
+            raise ValueError("Буферное кодирование требует кода над полубайтом длиной до 8 бит")
+        out = bytearray(2 * len(data))
+        out[0::2] = data.translate(self._encode_low)
+        out[1::2] = data.translate(self._encode_high)
+        return bytes(out)
+
+    def decode_bytes(self, codes, block_offset=0):
+        """
+        Декодирование буфера, записанного encode_bytes.
+
+        Args:
+            codes (bytes): Кодовые слова (чётное число байт).
+            block_offset (int): Номер первого кодового слова для отчёта.
+
+        Returns:
+            tuple: (данные, список BlockReport для кодовых слов с ошибками).
+
+        Raises:
+            ValueError: Если код не полубайтовый или длина буфера нечётна.
+        """
+        if not self.byte_codec:
+            raise ValueError("Буферное декодирование требует кода над полубайтом длиной до 8 бит")
+        if len(codes) % 2:
+            raise ValueError("Длина закодированного буфера должна быть чётной")
+        size = len(codes) // 2
+        low = codes[0::2].translate(self._decode_low)
+        high = codes[1::2].translate(self._decode_high)
+        data = (int.from_bytes(low, 'little') | int.from_bytes(high, 'little')).to_bytes(size, 'little')
+
+        reports = []
+        # Удаление всех допустимых кодовых слов оставляет пустую строку, если ошибок нет
+        if codes.translate(None, self._valid):
+            statuses = codes.translate(self._status)
+            mask = (1 << self.code.length) - 1
+            for match in ERROR_PATTERN.finditer(statuses):
+                position = match.start()
+                reports.append(BlockReport(block_offset + position, statuses[position],
+                                           self.syndrome_table[codes[position] & mask]))
+        return data, reports
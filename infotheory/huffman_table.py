@@ -0,0 +1,230 @@
+"""
+Табличный декодер префиксных кодов (Хаффмана) для упакованных байтов.
+
+Вместо побитового наращивания строки декодер заглядывает сразу на
+`lookup_bits` бит вперёд и одним обращением к таблице получает символ
+и длину его кода. Коды длиннее окна разбираются по запасным таблицам,
+сгруппированным по длине кода.
+"""
+
+DEFAULT_LOOKUP_BITS = 10
+
+
+class TableDecoder:
+    """
+    Декодер префиксного кода на основе таблиц поиска.
+
+    Атрибуты:
+        lookup_bits (int): Число бит, просматриваемых за одно обращение к таблице.
+        max_length (int): Максимальная длина кода.
+        symbols (list): Основная таблица: индекс окна -> символ.
+        lengths (list): Основная таблица: индекс окна -> длина кода (0 - длинный код).
+        entries (list): Индекс окна -> (все символы, целиком умещающиеся в окне,
+            суммарная длина их кодов); позволяет декодировать несколько
+            символов за одно обращение.
+        long_codes (dict): Запасные таблицы: длина -> {значение кода: символ}.
+        remaining_bits (int): Число бит в конце потока, не образовавших
+            полного кода при последнем декодировании (None, если декодирование
+            остановлено по числу символов).
+    """
+
+    def __init__(self, codes, lookup_bits=DEFAULT_LOOKUP_BITS):
+        """
+        Строит таблицы декодирования по словарю кодов.
+
+        Args:
+            codes (dict): Словарь символ -> код в виде строки из '0'/'1'.
+            lookup_bits (int): Ширина окна основной таблицы (обычно 8-12 бит).
+        """
+        self.empty_symbol = None
+        self.remaining_bits = None
+        self.max_length = max((len(code) for code in codes.values()), default=0)
+        self.lookup_bits = max(1, min(lookup_bits, self.max_length))
+        size = 1 << self.lookup_bits
+        self.symbols = [None] * size
+        self.lengths = [0] * size
+        self.long_codes = {}
+
+        for symbol, code in codes.items():
+            length = len(code)
+            if not length:
+                # Алфавит из одного символа: код пустой
+                self.empty_symbol = symbol
+                continue
+            value = int(code, 2)
+            if length <= self.lookup_bits:
+                shift = self.lookup_bits - length
+                start = value << shift
+                for index in range(start, start + (1 << shift)):
+                    self.symbols[index] = symbol
+                    self.lengths[index] = length
+            else:
+                self.long_codes.setdefault(length, {})[value] = symbol
+
+        self.entries = [self._entry(index) for index in range(size)]
+
+    def _entry(self, index):
+        """
+        Собирает все коды, которые целиком помещаются в окне с данным индексом.
+
+        Args:
+            index (int): Значение окна из `lookup_bits` бит.
+
+        Returns:
+            tuple: (кортеж символов, число занятых ими бит).
+        """
+        window = self.lookup_bits
+        mask = (1 << window) - 1
+        decoded = []
+        used = 0
+        while used < window:
+            probe = (index << used) & mask
+            length = self.lengths[probe]
+            if not length or length > window - used:
+                break
+            decoded.append(self.symbols[probe])
+            used += length
+        return tuple(decoded), used
+
+    def decode(self, data, bit_count=None, symbol_count=None):
+        """
+        Декодирует упакованные байты целиком.
+
+        Args:
+            data (bytes): Упакованный битовый поток (старший бит первым).
+            bit_count (int): Число значащих бит; по умолчанию 8 * len(data).
+            symbol_count (int): Максимальное число декодируемых символов.
+
+        Returns:
+            list: Декодированные символы.
+        """
+        decoded = []
+        for part in self.decode_stream((data,), bit_count, symbol_count):
+            decoded.extend(part)
+        return decoded
+
+    def decode_stream(self, chunks, bit_count=None, symbol_count=None):
+        """
+        Декодирует поток упакованных байтов по частям.
+
+        Незавершённый код на стыке частей переносится в следующую часть,
+        поэтому границы частей могут быть произвольными.
+
+        Args:
+            chunks (iterable): Последовательность объектов bytes.
+            bit_count (int): Общее число значащих бит во всём потоке.
+            symbol_count (int): Максимальное число декодируемых символов.
+
+        Yields:
+            list: Символы, декодированные из очередной части.
+
+        Raises:
+            ValueError: Если поток содержит последовательность, не являющуюся кодом.
+        """
+        self.remaining_bits = None
+        if self.empty_symbol is not None:
+            # Единственный код пустой: биты потока не содержат символов
+            if symbol_count:
+                yield [self.empty_symbol] * symbol_count
+            else:
+                self.remaining_bits = 0
+            return
+
+        window = self.lookup_bits
+        mask = (1 << window) - 1
+        # Запас в байт гарантирует, что в основном цикле не будут
+        # прочитаны биты выравнивания из последнего байта потока
+        reserve = self.max_length + 8
+        symbols = self.symbols
+        lengths = self.lengths
+        entries = self.entries
+        remaining = symbol_count
+        fed_bits = 0
+        acc = 0
+        nbits = 0
+
+        for chunk in chunks:
+            decoded = []
+            append = decoded.append
+            extend = decoded.extend
+            pos = 0
+            size = len(chunk)
+            fed_bits += 8 * size
+            while True:
+                if nbits < reserve:
+                    if pos >= size:
+                        break
+                    piece = chunk[pos:pos + 8]
+                    pos += 8
+                    acc = ((acc & ((1 << nbits) - 1)) << (8 * len(piece))) | int.from_bytes(piece, 'big')
+                    nbits += 8 * len(piece)
+                    continue
+                run, length = entries[(acc >> (nbits - window)) & mask]
+                if length:
+                    extend(run)
+                    nbits -= length
+                else:
+                    symbol, length = self._decode_long(acc, nbits)
+                    append(symbol)
+                    nbits -= length
+            if remaining is not None:
+                if len(decoded) >= remaining:
+                    yield decoded[:remaining]
+                    return
+                remaining -= len(decoded)
+            yield decoded
+
+        # Хвост потока: отбрасываем биты выравнивания и дочитываем короткие коды
+        if bit_count is not None and fed_bits > bit_count:
+            padding = fed_bits - bit_count
+            acc >>= padding
+            nbits = max(0, nbits - padding)
+        acc &= (1 << nbits) - 1
+        decoded = []
+        while nbits and (remaining is None or len(decoded) < remaining):
+            if nbits >= window:
+                index = (acc >> (nbits - window)) & mask
+            else:
+                index = (acc << (window - nbits)) & mask
+            length = lengths[index]
+            if length and length <= nbits:
+                decoded.append(symbols[index])
+                nbits -= length
+            elif not length and nbits > window:
+                symbol, length = self._decode_long(acc, nbits, partial=True)
+                if symbol is None:
+                    break
+                decoded.append(symbol)
+                nbits -= length
+            else:
+                # Незавершённый код в конце потока игнорируется
+                break
+            acc &= (1 << nbits) - 1
+        self.remaining_bits = nbits
+        if decoded:
+            yield decoded
+
+    def _decode_long(self, acc, nbits, partial=False):
+        """
+        Разбирает код длиннее окна основной таблицы по запасным таблицам.
+
+        Args:
+            acc (int): Накопитель бит.
+            nbits (int): Число доступных бит в накопителе.
+            partial (bool): Разрешить нехватку бит (конец потока).
+
+        Returns:
+            tuple: (символ, длина кода); (None, 0) для незавершённого кода в конце.
+
+        Raises:
+            ValueError: Если биты не образуют ни одного кода.
+        """
+        for length in range(self.lookup_bits + 1, min(self.max_length, nbits) + 1):
+            table = self.long_codes.get(length)
+            if table:
+                symbol = table.get((acc >> (nbits - length)) & ((1 << length) - 1))
+                if symbol is not None:
+                    return symbol, length
+        if partial and nbits < self.max_length:
+            return None, 0
+        raise ValueError("Битовый поток содержит недопустимый код")
@@ -0,0 +1,230 @@
+"""
+Построение дерева Хаффмана за линейное время по отсортированным листьям.
+
+Частоты считаются одним проходом Counter, листья сортируются один раз,
+после чего дерево строится слиянием двух очередей: очереди листьев и
+очереди уже объединённых узлов. Веса объединённых узлов не убывают,
+поэтому минимальный элемент всегда находится в начале одной из очередей
+и каждое слияние выполняется за O(1).
+
+Для кодов с ограниченной длиной используется алгоритм package-merge.
+"""
+from collections import Counter, deque
+from heapq import merge
+
+
+class Node:
+    """
+    Внутренний узел дерева Хаффмана. Листьями дерева служат сами символы.
+
+    Атрибуты:
+        left: Левый потомок (код '0').
+        right: Правый потомок (код '1').
+    """
+
+    __slots__ = ('left', 'right')
+
+    def __init__(self, left, right):
+        """
+        Инициализирует узел с двумя потомками.
+
+        Args:
+            left: Левый потомок.
+            right: Правый потомок.
+        """
+        self.left = left
+        self.right = right
+
+
+def count_frequencies(data):
+    """
+    Подсчитывает частоты символов за один проход.
+
+    Args:
+        data (iterable): Последовательность символов.
+
+    Returns:
+        Counter: Словарь символ -> число вхождений.
+    """
+    return Counter(data)
+
+
+def build_tree(frequencies):
+    """
+    Строит дерево Хаффмана слиянием двух очередей.
+
+    При равных весах предпочтение отдаётся листьям, что уменьшает
+    максимальную длину кода.
+
+    Args:
+        frequencies (dict): Словарь символ -> частота.
+
+    Returns:
+        Корень дерева (Node или символ для алфавита из одного символа);
+        None для пустого алфавита.
+    """
+    if not frequencies:
+        return None
+    leaves = deque(sorted(((weight, symbol) for symbol, weight in frequencies.items()),
+                          key=lambda item: item[0]))
+    merged = deque()
+
+    def pop_lightest():
+        if merged and (not leaves or merged[0][0] < leaves[0][0]):
+            return merged.popleft()
+        return leaves.popleft()
+
+    for _ in range(len(leaves) - 1):
+        first_weight, first = pop_lightest()
+        second_weight, second = pop_lightest()
+        merged.append((first_weight + second_weight, Node(first, second)))
+
+    return (merged or leaves)[0][1]
+
+
+def generate_codes(root):
+    """
+    Формирует коды символов обходом дерева без рекурсии.
+
+    Единственному символу алфавита назначается код '0'.
+
+    Args:
+        root: Корень дерева, построенного build_tree.
+
+    Returns:
+        dict: Словарь символ -> код в виде строки из '0'/'1'.
+    """
+    if root is None:
+        return {}
+    if not isinstance(root, Node):
+        return {root: '0'}
+    codes = {}
+    stack = [(root, '')]
+    while stack:
+        node, code = stack.pop()
+        if isinstance(node, Node):
+            stack.append((node.right, code + '1'))
+            stack.append((node.left, code + '0'))
+        else:
+            codes[node] = code
+    return codes
+
+
+def huffman_code_lengths(frequencies):
+    """
+    Вычисляет длины кодов Хаффмана без построения строк кодов.
+
+    Args:
+        frequencies (dict): Словарь символ -> частота.
+
+    Returns:
+        dict: Словарь символ -> длина кода.
+    """
+    root = build_tree(frequencies)
+    if root is None:
+        return {}
+    if not isinstance(root, Node):
+        return {root: 1}
+    lengths = {}
+    stack = [(root, 0)]
+    while stack:
+        node, depth = stack.pop()
+        if isinstance(node, Node):
+            stack.append((node.right, depth + 1))
+            stack.append((node.left, depth + 1))
+        else:
+            lengths[node] = depth
+    return lengths
+
+
+def limited_code_lengths(frequencies, max_length):
+    """
+    Вычисляет оптимальные длины кодов, не превышающие max_length.
+
+    Используется алгоритм package-merge (Larmore, Hirschberg): на каждом
+    из max_length - 1 шагов соседние элементы списка попарно объединяются
+    в пакеты, которые сливаются с отсортированными листьями. Длина кода
+    символа равна числу вхождений его листа в первые 2n - 2 элемента
+    итогового списка. Пакеты хранят ссылки на свои части, а подсчёт
+    вхождений выполняется обходом со стеком, без рекурсии.
+
+    Args:
+        frequencies (dict): Словарь символ -> частота.
+        max_length (int): Максимальная длина кода.
+
+    Returns:
+        dict: Словарь символ -> длина кода.
+
+    Raises:
+        ValueError: Если 2 ** max_length меньше числа символов.
+    """
+    symbols = list(frequencies)
+    count = len(symbols)
+    if count <= 1:
+        return {symbol: 1 for symbol in symbols}
+    if max_length < 1 or (1 << max_length) < count:
+        raise ValueError(f"Нельзя построить код для {count} символов "
+                         f"с длиной не более {max_length} бит")
+
+    lengths = huffman_code_lengths(frequencies)
+    if max(lengths.values()) <= max_length:
+        return lengths
+
+    leaves = sorted(((frequencies[symbol], index) for index, symbol in enumerate(symbols)),
+                    key=lambda item: item[0])
+    limit = 2 * count - 2
+    current = leaves
+    for _ in range(max_length - 1):
+        packages = [(current[i][0] + current[i + 1][0], (current[i][1], current[i + 1][1]))
+                    for i in range(0, len(current) - 1, 2)]
+        current = list(merge(leaves, packages, key=lambda item: item[0]))[:limit]
+
+    depths = [0] * count
+    stack = [item for _, item in current[:limit]]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, tuple):
+            stack.extend(item)
+        else:
+            depths[item] += 1
+    return {symbol: depths[index] for index, symbol in enumerate(symbols)}
+
+
+def encoded_bit_count(frequencies, code_lengths):
+    """
+    Вычисляет размер закодированных данных в битах.
+
+    Args:
+        frequencies (dict): Словарь символ -> частота.
+        code_lengths (dict): Словарь символ -> длина кода.
+
+    Returns:
+        int: Сумма частота * длина кода по всем символам.
+    """
+    return sum(freq * code_lengths[symbol] for symbol, freq in frequencies.items())
+
+
+def length_limit_cost(frequencies, max_length):
+    """
+    Оценивает потерю сжатия от ограничения длины кода.
+
+    Args:
+        frequencies (dict): Словарь символ -> частота.
+        max_length (int): Максимальная длина кода.
+
+    Returns:
+        dict: Максимальная длина кода без ограничения ('unbounded_max_length'),
+            размеры в битах без ограничения и с ограничением ('unbounded_bits',
+            'limited_bits'), прирост в битах ('extra_bits') и в долях ('extra_ratio').
+    """
+    unbounded = huffman_code_lengths(frequencies)
+    limited = limited_code_lengths(frequencies, max_length)
+    unbounded_bits = encoded_bit_count(frequencies, unbounded)
+    limited_bits = encoded_bit_count(frequencies, limited)
+    return {
+        'unbounded_max_length': max(unbounded.values(), default=0),
+        'unbounded_bits': unbounded_bits,
+        'limited_bits': limited_bits,
+        'extra_bits': limited_bits - unbounded_bits,
+        'extra_ratio': (limited_bits - unbounded_bits) / unbounded_bits if unbounded_bits else 0.0,
+    }
@@ -0,0 +1,236 @@
+"""
+Условная энтропия порядка k: H(X_n | X_{n-k} ... X_{n-1}) для байтов.
+
+n-граммы длины k + 1 упаковываются в целые числа (первый байт - младший),
+поэтому ключи счётчиков - int, а не строки. Для длины до 8 байт ключи
+получаются без цикла Python: memoryview над данными со сдвигом 0..7
+приводится к массиву 64-битных слов, и лишние старшие байты отсекаются
+маской. Контекст n-граммы - её младшие 8k бит.
+
+Точный подсчёт хранит по счётчику на каждую различную n-грамму. Для
+больших корпусов и высоких порядков вместо него можно использовать
+скетч count-min с фиксированным объёмом памяти: первый проход заполняет
+скетчи n-грамм и контекстов, второй суммирует log2(n(c) / n(c, x)) по
+позициям (по различным n-граммам каждой части файла).
+"""
+import sys
+from array import array
+from collections import Counter
+from math import log2
+
+from infotheory.entropy_stats import DEFAULT_CHUNK_SIZE, shannon_entropy
+
+MAX_ORDER = 8
+WORD_BYTES = 8  # длина слова при приведении memoryview к 'Q'
+DEFAULT_SKETCH_DEPTH = 4
+# Нечётные 64-битные множители хеш-функций строк скетча (multiply-shift)
+SKETCH_MULTIPLIERS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9,
+                      0xD6E8FEB86659FD93, 0xFF51AFD7ED558CCD, 0xC4CEB9FE1A85EC53,
+                      0x94D049BB133111EB, 0xBF58476D1CE4E5B9)
+MASK64 = (1 << 64) - 1
+
+
+def _packed_ngrams(data, width):
+    """
+    Упакованные n-граммы всех позиций данных.
+
+    Args:
+        data (bytes): Данные.
+        width (int): Длина n-граммы в байтах.
+
+    Returns:
+        list: Итераторы ключей (порядок ключей не сохраняется).
+    """
+    count = len(data) - width + 1
+    if count <= 0:
+        return []
+    parts = []
+    fast = 0
+    if width <= WORD_BYTES and sys.byteorder == 'little':
+        # Слова, начинающиеся в позициях shift, shift + 8, ..., целиком внутри данных
+        fast = max(0, len(data) - WORD_BYTES + 1)
+        view = memoryview(data)
+        mask = (1 << (8 * width)) - 1
+        for shift in range(min(WORD_BYTES, fast)):
+            words = view[shift:shift + (len(data) - shift) // WORD_BYTES * WORD_BYTES].cast('Q')
+            parts.append(words if width == WORD_BYTES else map(mask.__and__, words))
+    parts.append(int.from_bytes(data[position:position + width], 'little')
+                 for position in range(fast, count))
+    return parts
+
+
+def count_ngrams(chunks, width, frequency=None):
+    """
+    Точный подсчёт n-грамм по частям данных.
+
+    n-граммы на границах частей учитываются: последние width - 1 байт
+    части переносятся в начало следующей.
+
+    Args:
+        chunks (iterable): Части данных (bytes).
+        width (int): Длина n-граммы в байтах (1..MAX_ORDER + 1).
+        frequency (Counter): Счётчик для накопления; None - новый.
+
+    Returns:
+        Counter: Упакованная n-грамма -> число вхождений.
+    """
+    if frequency is None:
+        frequency = Counter()
+    for chunk in _carried(chunks, width):
+        for keys in _packed_ngrams(chunk, width):
+            frequency.update(keys)
+    return frequency
+
+
+def _carried(chunks, width):
+    """Части данных с перенесёнными из предыдущей части width - 1 байтами."""
+    tail = b''
+    for chunk in chunks:
+        chunk = tail + chunk
+        yield chunk
+        tail = chunk[len(chunk) - width + 1:] if width > 1 else b''
+
+
+def context_mask(order):
+    """Маска контекста (первых order байт) упакованной n-граммы."""
+    return (1 << (8 * order)) - 1
+
+
+def conditional_entropy_from_counts(frequency, order):
+    """
+    Условная энтропия по точным частотам n-грамм длины order + 1.
+
+    H(X | C) = H(C, X) - H(C), где частоты контекстов получаются
+    суммированием частот n-грамм с общим контекстом.
+
+    Returns:
+        float: Энтропия в битах на байт; 0 для пустой таблицы.
+    """
+    mask = context_mask(order)
+    contexts = Counter()
+    for key, count in frequency.items():
+        contexts[key & mask] += count
+    return max(0.0, shannon_entropy(frequency) - shannon_entropy(contexts))
+
+
+class CountMinSketch:
+    """
+    Скетч count-min: приближённые частоты в памяти фиксированного размера.
+
+    Оценка частоты никогда не меньше истинной; при N добавлениях ошибка
+    не превышает e * N / width с вероятностью 1 - exp(-depth).
+
+    Атрибуты:
+        width_log (int): Логарифм числа счётчиков в строке.
+        depth (int): Число строк (хеш-функций).
+        table (array): Счётчики строк подряд.
+    """
+
+    def __init__(self, width_log, depth=DEFAULT_SKETCH_DEPTH):
+        """
+        Создаёт пустой скетч.
+
+        Args:
+            width_log (int): Логарифм ширины строки (1..32).
+            depth (int): Число строк (1..len(SKETCH_MULTIPLIERS)).
+
+        Raises:
+            ValueError: Если размеры вне допустимых пределов.
+        """
+        if not 1 <= width_log <= 32 or not 1 <= depth <= len(SKETCH_MULTIPLIERS):
+            raise ValueError("Недопустимый размер скетча count-min")
+        self.width_log = width_log
+        self.depth = depth
+        self.table = array('Q', [0]) * (depth << width_log)
+        self._shift = 64 - width_log
+        self._rows = [(multiplier, row << width_log)
+                      for row, multiplier in enumerate(SKETCH_MULTIPLIERS[:depth])]
+
+    @staticmethod
+    def _fold(key):
+        # Произведение по модулю 2 ** 64 зависит только от младших 64 бит ключа
+        return key if key <= MASK64 else (key ^ (key >> 64) * SKETCH_MULTIPLIERS[0]) & MASK64
+
+    def add(self, key, count=1):
+        """Увеличивает частоту ключа (int) на count."""
+        key = self._fold(key)
+        table = self.table
+        shift = self._shift
+        for multiplier, offset in self._rows:
+            table[offset + (((key * multiplier) & MASK64) >> shift)] += count
+
+    def estimate(self, key):
+        """Оценка частоты ключа сверху."""
+        key = self._fold(key)
+        table = self.table
+        shift = self._shift
+        return min(table[offset + (((key * multiplier) & MASK64) >> shift)]
+                   for multiplier, offset in self._rows)
+
+
+def conditional_entropy(read_chunks, order, sketch_width_log=None,
+                        sketch_depth=DEFAULT_SKETCH_DEPTH):
+    """
+    Условная энтропия порядка order.
+
+    Args:
+        read_chunks (callable): Функция без аргументов, возвращающая
+            итератор частей данных; при подсчёте скетчем вызывается дважды.
+        order (int): Длина контекста в байтах (0..MAX_ORDER).
+        sketch_width_log (int): Логарифм ширины скетча count-min; None -
+            точный подсчёт.
+        sketch_depth (int): Число строк скетча.
+
+    Returns:
+        float: Энтропия в битах на байт.
+
+    Raises:
+        ValueError: Если порядок вне диапазона 0..MAX_ORDER.
+    """
+    if not 0 <= order <= MAX_ORDER:
+        raise ValueError(f"Порядок должен быть от 0 до {MAX_ORDER}")
+    width = order + 1
+    if sketch_width_log is None:
+        return conditional_entropy_from_counts(count_ngrams(read_chunks(), width), order)
+
+    mask = context_mask(order)
+    joint = CountMinSketch(sketch_width_log, sketch_depth)
+    contexts = CountMinSketch(sketch_width_log, sketch_depth)
+    for chunk in _carried(read_chunks(), width):
+        # Частоты внутри части считаются точно, в скетч попадают только различные ключи
+        for key, count in count_ngrams((chunk,), width).items():
+            joint.add(key, count)
+            contexts.add(key & mask, count)
+
+    total = 0
+    information = 0.0
+    for chunk in _carried(read_chunks(), width):
+        for key, count in count_ngrams((chunk,), width).items():
+            joint_count = joint.estimate(key)
+            # Оценки завышены независимо, поэтому частота контекста может оказаться меньше
+            information += count * log2(max(contexts.estimate(key & mask), joint_count) / joint_count)
+            total += count
+    return information / total if total else 0.0
+
+
+def file_conditional_entropy(path, orders, sketch_width_log=None,
+                             sketch_depth=DEFAULT_SKETCH_DEPTH, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Условные энтропии байтов файла для нескольких порядков.
+
+    Args:
+        path (str): Путь к файлу.
+        orders (iterable): Порядки 0..MAX_ORDER.
+        sketch_width_log (int): Логарифм ширины скетча; None - точный подсчёт.
+        sketch_depth (int): Число строк скетча.
+        chunk_size (int): Размер части файла.
+
+    Returns:
+        dict: Порядок -> энтропия в битах на байт.
+    """
+    def read_chunks():
+        with open(path, 'rb') as file:
+            yield from iter(lambda: file.read(chunk_size), b'')
+
+    return {order: conditional_entropy(read_chunks, order, sketch_width_log, sketch_depth)
+            for order in orders}
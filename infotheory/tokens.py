@@ -0,0 +1,176 @@
+"""
+Разбиение текста на слова и словарь токенов для кодирования Хаффмана.
+
+Текст без потерь разбивается на слова, серии пробельных символов и
+отдельные знаки препинания. Словарь содержит все различные символы текста
+и не больше max_size самых выгодных многосимвольных токенов; номер токена
+в словаре - символ алфавита кода Хаффмана. Токены, не попавшие в словарь,
+кодируются посимвольно, поэтому escape-коды не нужны.
+
+Частоты токенов считаются в ограниченной памяти: когда число различных
+токенов превышает PRUNE_FACTOR * max_size, счётчик сокращается до самых
+частых 2 * max_size токенов. Редкие токены при этом теряются, что влияет
+только на выбор словаря, но не на правильность кодирования.
+"""
+import re
+from array import array
+from collections import Counter
+
+DEFAULT_MAX_VOCABULARY = 1 << 14
+MIN_TOKEN_COUNT = 2  # токен, встретившийся один раз, дешевле передать посимвольно
+MAX_TOKEN_BYTES = 255  # длина токена в UTF-8 записывается одним байтом
+PRUNE_FACTOR = 4
+
+TOKEN_PATTERN = re.compile(r'\w+|\s+|[^\w\s]')
+
+
+def tokenize(chunks):
+    """
+    Разбиение текста, прочитанного по частям, на токены.
+
+    Последний токен части может продолжаться в следующей, поэтому он
+    переносится в начало следующей части.
+
+    Args:
+        chunks (iterable): Части текста (str).
+
+    Yields:
+        list: Токены очередной части; их конкатенация равна исходному тексту.
+    """
+    tail = ''
+    for chunk in chunks:
+        tokens = TOKEN_PATTERN.findall(tail + chunk)
+        tail = tokens.pop() if tokens else ''
+        if tokens:
+            yield tokens
+    if tail:
+        yield [tail]
+
+
+def count_tokens(chunks, max_size=DEFAULT_MAX_VOCABULARY):
+    """
+    Частоты символов и многосимвольных токенов текста.
+
+    Args:
+        chunks (iterable): Части текста (str).
+        max_size (int): Предельный размер словаря, определяющий объём счётчика.
+
+    Returns:
+        tuple: (Counter символов (точный), Counter многосимвольных токенов
+            (приближённый при большом числе различных токенов)).
+    """
+    characters = Counter()
+    frequency = Counter()
+    limit = PRUNE_FACTOR * max(max_size, 1)
+    for tokens in tokenize(chunks):
+        characters.update(''.join(tokens))
+        frequency.update(token for token in tokens if len(token) > 1)
+        if len(frequency) > limit:
+            frequency = Counter(dict(frequency.most_common(2 * max_size)))
+    return characters, frequency
+
+
+class Vocabulary:
+    """
+    Словарь токенов: номер -> токен в списке, токен -> номер в словаре.
+
+    Атрибуты:
+        tokens (list): Токены по номерам; сначала отдельные символы.
+        index (dict): Токен -> номер.
+    """
+
+    def __init__(self, tokens):
+        """
+        Создаёт словарь из списка различных токенов.
+
+        Args:
+            tokens (list): Токены по номерам.
+        """
+        self.tokens = list(tokens)
+        self.index = {token: number for number, token in enumerate(self.tokens)}
+
+    def __len__(self):
+        return len(self.tokens)
+
+    @classmethod
+    def build(cls, characters, frequency, max_size=DEFAULT_MAX_VOCABULARY):
+        """
+        Словарь из всех символов и max_size самых выгодных токенов.
+
+        Выгода токена - число покрываемых им символов текста (частота,
+        умноженная на длину).
+
+        Args:
+            characters (dict): Символ -> частота.
+            frequency (dict): Многосимвольный токен -> частота.
+            max_size (int): Максимальное число многосимвольных токенов.
+
+        Returns:
+            Vocabulary: Словарь.
+        """
+        candidates = [token for token, count in frequency.items()
+                      if count >= MIN_TOKEN_COUNT and len(token.encode('utf-8')) <= MAX_TOKEN_BYTES]
+        candidates.sort(key=lambda token: (-frequency[token] * len(token), token))
+        return cls(sorted(characters) + candidates[:max_size])
+
+    def encode(self, tokens):
+        """
+        Номера токенов; токены вне словаря заменяются номерами их символов.
+
+        Args:
+            tokens (iterable): Токены.
+
+        Returns:
+            array: Номера токенов (array('I')).
+
+        Raises:
+            KeyError: Если в токене есть символ, которого нет в словаре.
+        """
+        index = self.index
+        numbers = array('I')
+        for token in tokens:
+            number = index.get(token)
+            if number is None:
+                numbers.extend(map(index.__getitem__, token))
+            else:
+                numbers.append(number)
+        return numbers
+
+    def decode(self, numbers):
+        """Текст по номерам токенов."""
+        return ''.join(map(self.tokens.__getitem__, numbers))
+
+    def pack(self):
+        """
+        Сериализация: для каждого токена длина в UTF-8 (один байт) и сам токен.
+
+        Returns:
+            bytes: Сериализованный словарь.
+        """
+        out = bytearray()
+        for token in self.tokens:
+            raw = token.encode('utf-8')
+            out.append(len(raw))
+            out += raw
+        return bytes(out)
+
+    @classmethod
+    def unpack(cls, data):
+        """
+        Чтение словаря, записанного методом pack.
+
+        Raises:
+            ValueError: Если данные обрезаны или не являются UTF-8.
+        """
+        tokens = []
+        offset = 0
+        while offset < len(data):
+            end = offset + 1 + data[offset]
+            if end > len(data):
+                raise ValueError("Словарь токенов обрезан")
+            try:
+                tokens.append(data[offset + 1:end].decode('utf-8'))
+            except UnicodeDecodeError:
+                raise ValueError("Словарь токенов повреждён") from None
+            offset = end
+        return cls(tokens)
@@ -1,8 +1,14 @@
+import os
+import sys
 import time
 from flask import Flask, render_template, request
 from hemming import Hamming
 from haffman2 import HuffmanTree, Node
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infotheory.hamming import encode_blocks  # noqa: E402
+
 app = Flask(__name__)
 hamming = Hamming()
 
@@ -26,7 +32,8 @@ def result():
     """
     Обрабатывает маршрут '/result' для метода POST.
 
-    Получает данные из формы, применяет кодирование Хаффмана, затем кодирование Хэмминга,
+    Получает данные из формы, применяет кодирование Хаффмана, затем кодирование Хэмминга
+    (одним кодовым словом или независимыми блоками (72,64) при mode=blocks),
     и отображает шаблон 'result.html' с закодированными данными.
 
     Возвращает:
@@ -39,7 +46,10 @@ def result():
     huff_codes = huffman_tree.generate_codes(huffman_tree.build_tree())
     encoded_huffman = Node.compress_data(textarea_data, huff_codes)
     # Кодирование Хэмминга
-    encoded_hamming = hamming.encode(encoded_huffman)
+    if request.form.get('mode') == 'blocks':
+        encoded_hamming = encode_blocks(encoded_huffman)
+    else:
+        encoded_hamming = hamming.encode(encoded_huffman)
     return render_template('result.html', data=encoded_hamming)
 
 if __name__ == '__main__':
@@ -3,6 +3,13 @@ from datetime import datetime
 import os
 import re
 import shutil
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infotheory import huffman_tree  # noqa: E402
+from infotheory.huffman_table import TableDecoder  # noqa: E402
+from infotheory.bitbuffer import pack_bits, unpack_bits  # noqa: E402
 
 
 class Node:
@@ -32,10 +39,7 @@ class Node:
         Возвращает:
             str: Сжатые данные.
         """
-        compressed_data = ""
-        for char in text:
-            compressed_data += huff_codes[char]
-        return compressed_data
+        return ''.join(map(huff_codes.__getitem__, text))
 
     @staticmethod
     def decompress_data(compressed_data, huff_codes):
@@ -49,17 +53,10 @@ class Node:
         Возвращает:
             str: Раскодированные данные.
         """
-        decoded_data = ""
-        current_code = ""
-
-        for bit in compressed_data:
-            current_code += str(bit)
-            if current_code in huff_codes.values():
-                decoded_data += next(symbol for symbol, code in huff_codes.items()
-                                     if code == current_code)
-                current_code = ""
-
-        return decoded_data
+        if not isinstance(compressed_data, str):
+            compressed_data = ''.join(map(str, compressed_data))
+        decoder = TableDecoder(huff_codes)
+        return ''.join(decoder.decode(pack_bits(compressed_data), len(compressed_data)))
 
 
 class HuffmanTree:
@@ -74,41 +71,26 @@ class HuffmanTree:
         - text: Входной текст для кодирования Хаффмана.
         """
         self.text = text
-        self.letters = set(text)
-        self.frequencies = [(text.count(letter), letter) for letter in self.letters]
+        self.frequencies = huffman_tree.count_frequencies(text)
+        self.letters = set(self.frequencies)
 
     def build_tree(self):
         """
         Строит дерево Хаффмана.
         """
-        while len(self.frequencies) > 1:
-            self.frequencies = sorted(self.frequencies, key=lambda x: x[0], reverse=True)
-            first = self.frequencies.pop()
-            second = self.frequencies.pop()
-            freq = first[0] + second[0]
-            self.frequencies.append((freq, Node(first[1], second[1])))
-        return self.frequencies[0][1]
-
-    def generate_codes(self, node, path='', code=None):
+        return huffman_tree.build_tree(self.frequencies)
+
+    def generate_codes(self, node):
         """
         Генерирует коды Хаффмана.
 
         Параметры:
-        - node: Текущий узел дерева.
-        - path: Текущий путь кода.
-        - code: Словарь для хранения кодов.
+        - node: Корень дерева, возвращённый build_tree.
 
         Возвращает:
             dict: Словарь с кодами Хаффмана.
         """
-        if code is None:
-            code = {}
-        if isinstance(node, str):
-            code[node] = path
-            return code
-        code = self.generate_codes(node.left, path + '0', code)
-        code = self.generate_codes(node.right, path + '1', code)
-        return code
+        return huffman_tree.generate_codes(node)
 
 
 def delete_folders_by_pattern(base_folder, pattern):
@@ -179,9 +161,10 @@ def save_binary_data(source_data, file_path):
         source_data (str): Исходные данные для сохранения.
         file_path (str): Путь к файлу для сохранения данных.
     """
-    source_data = source_data + '0' * (8 - (len(source_data) % 8))
-    source_data_byte = bytearray([int(source_data[i * 8:i * 8 + 8], 2)
-                                  for i in range(int(len(source_data) / 8))])
+    source_data_byte = pack_bits(source_data)
+    if len(source_data) % 8 == 0:
+        # Формат файла: выравнивание всегда добавляет от 1 до 8 нулевых бит
+        source_data_byte += b'\x00'
     with open(file_path, 'wb') as file:
         file.write(source_data_byte)
 
@@ -197,6 +180,4 @@ def load_binary_data(file_path):
         str: Загруженные бинарные данные.
     """
     with open(file_path, 'rb') as file:
-        result_data_byte = file.read()
-    result_data = ''.join(['{:08b}'.format(byte) for byte in result_data_byte])
-    return result_data
+        return unpack_bits(file.read())